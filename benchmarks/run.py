@@ -0,0 +1,180 @@
+"""
+Benchmark runner - Draait de scenarios headless (update + render naar een offscreen surface)
+
+    python -m benchmarks.run                    # alles draaien en met de baseline vergelijken
+    python -m benchmarks.run --save-baseline    # huidige resultaten als nieuwe baseline
+    python -m benchmarks.run bat_swarm --frames 600 --margin 0.1
+
+Per scenario: frames/s en p99 frame tijd (beste van een paar runs) en hoeveel geheugen
+een frame gemiddeld alloceert (piek boven het begin van de frame, gemeten met tracemalloc
+in een aparte run, zodat tracemalloc de tijden niet beïnvloedt). Exit code 1 als een scenario meer dan
+`margin` slechter is dan de baseline. De baseline hoort bij een machine en staat niet in git.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+import numpy as np
+
+# Vanuit de repo root draaien, ook als script (python benchmarks/run.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from game import Game
+from benchmarks.scenarios import SCENARIOS, setup_scenario
+from constants import (
+    BENCHMARK_FRAMES, BENCHMARK_WARMUP_FRAMES, BENCHMARK_REPEATS, BENCHMARK_SEED, BENCHMARK_MARGIN, BENCHMARK_BASELINE_FILE
+)
+
+# Metric -> True als hoger beter is
+METRICS = {'fps': True, 'p99_ms': False, 'alloc_kib': False}
+
+
+def new_scenario(name, seed):
+    """Verse game met het scenario klaar, na de warmup frames"""
+    game = Game(headless=True, seed=seed)
+    step = setup_scenario(game, name, seed)
+    for frame in range(BENCHMARK_WARMUP_FRAMES):
+        step(frame)
+        run_frame(game)
+    return game, step
+
+
+def run_frame(game):
+    game.handle_events()
+    game.update()
+    game.render()
+
+
+def measure_time(name, frames, seed):
+    """(frames/s, p99 ms) over `frames` frames"""
+    game, step = new_scenario(name, seed)
+    times = np.zeros(frames, dtype=np.int64)
+    perf_counter_ns = time.perf_counter_ns
+    for frame in range(BENCHMARK_WARMUP_FRAMES, BENCHMARK_WARMUP_FRAMES + frames):
+        step(frame)
+        start = perf_counter_ns()
+        run_frame(game)
+        times[frame - BENCHMARK_WARMUP_FRAMES] = perf_counter_ns() - start
+    fps = frames / (times.sum() / 1e9)
+    return fps, float(np.percentile(times, 99)) / 1e6
+
+
+def measure_allocations(name, frames, seed):
+    """Gemiddelde allocatie piek per frame in KiB"""
+    game, step = new_scenario(name, seed)
+    total = 0
+    tracemalloc.start()
+    try:
+        for frame in range(BENCHMARK_WARMUP_FRAMES, BENCHMARK_WARMUP_FRAMES + frames):
+            step(frame)
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            run_frame(game)
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - start
+    finally:
+        tracemalloc.stop()
+    return total / frames / 1024
+
+
+def run_scenario(name, frames=BENCHMARK_FRAMES, seed=BENCHMARK_SEED, repeats=BENCHMARK_REPEATS):
+    # Elke run simuleert hetzelfde, dus verschillen zijn ruis: neem de beste
+    timings = [measure_time(name, frames, seed) for _ in range(repeats)]
+    fps = max(fps for fps, _ in timings)
+    p99_ms = min(p99_ms for _, p99_ms in timings)
+    alloc_kib = measure_allocations(name, frames, seed)
+    return {'fps': round(fps, 1), 'p99_ms': round(p99_ms, 3), 'alloc_kib': round(alloc_kib, 2)}
+
+
+def compare(results, baseline, margin):
+    """Lijst met regressies als tekst (leeg = alles binnen de marge)"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in base:
+                continue
+            old, new = base[metric], result[metric]
+            if higher_is_better:
+                worse = new < old * (1 - margin)
+            else:
+                worse = new > old * (1 + margin)
+            if worse:
+                regressions.append(f"{name}: {metric} {old} -> {new}")
+    return regressions
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    baseline = load_baseline(path) or {}
+    baseline.update(results)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks voor The Legend of Smellda")
+    parser.add_argument('scenarios', nargs='*', metavar='SCENARIO',
+                        help=f"Welke scenarios (standaard alle): {', '.join(SCENARIOS)}")
+    parser.add_argument('--frames', type=int, default=BENCHMARK_FRAMES,
+                        help="Frames per scenario")
+    parser.add_argument('--repeats', type=int, default=BENCHMARK_REPEATS,
+                        help="Aantal runs voor de tijden (de beste telt)")
+    parser.add_argument('--seed', type=int, default=BENCHMARK_SEED,
+                        help="World seed en seed voor de plaatsing van vijanden")
+    parser.add_argument('--baseline', metavar='FILE', default=BENCHMARK_BASELINE_FILE,
+                        help="Baseline bestand (JSON)")
+    parser.add_argument('--margin', type=float, default=BENCHMARK_MARGIN,
+                        help="Toegestane verslechtering t.o.v. de baseline (0.2 = 20%%)")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Schrijf de resultaten als nieuwe baseline in plaats van te vergelijken")
+    args = parser.parse_args(argv)
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"onbekend scenario {name}")
+
+    pygame.init()
+    results = {}
+    print(f"{'scenario':<20} {'frames/s':>10} {'p99 ms':>8} {'KiB/frame':>10}")
+    for name in args.scenarios or SCENARIOS:
+        results[name] = result = run_scenario(name, args.frames, args.seed, args.repeats)
+        print(f"{name:<20} {result['fps']:>10.0f} {result['p99_ms']:>8.3f} {result['alloc_kib']:>10.2f}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"baseline opgeslagen in {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"geen baseline in {args.baseline} (maak er een met --save-baseline)")
+        return 0
+    regressions = compare(results, baseline, args.margin)
+    for regression in regressions:
+        print(f"REGRESSIE {regression}")
+    if regressions:
+        return 1
+    print(f"binnen {args.margin:.0%} van de baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
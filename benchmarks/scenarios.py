@@ -0,0 +1,174 @@
+"""
+Benchmark scenarios - Zware situaties die frame voor frame gescript worden
+
+Elk scenario zet een verse headless Game klaar en geeft een step(frame) terug die
+vóór elke frame de input zet (en de speler in leven houdt). Plaatsing gebeurt met een
+eigen Random(seed), dus elke run van een scenario simuleert precies hetzelfde.
+"""
+import random
+import pygame
+from entities.monster import Monster
+from entities.archer import Archer
+from entities.slime import Slime
+from rooms.room import RoomManager
+from constants import GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS
+
+SWARM_MONSTERS = 60
+SWARM_ARCHERS = 30
+BAT_SWARM_SIZE = 80
+SLIME_WAVE_SIZE = 12
+BARRAGE_COOLDOWN = 6  # Frames tussen vuurballen (normaal 180)
+TRANSITION_WORLD_SIZE = 16  # Groter dan de room cache, zodat er ook ge-evict wordt
+TRANSITION_FRAMES = 8  # Frames per room tijdens de wereld tour
+
+# Rondje door de room: (toets, aantal frames)
+PATROL = ((pygame.K_RIGHT, 90), (pygame.K_DOWN, 60), (pygame.K_LEFT, 90), (pygame.K_UP, 60))
+ATTACK_INTERVAL = 20
+
+
+def patrol_keys(frame):
+    """Vastgehouden toets voor deze frame van het rondje"""
+    frame %= sum(frames for _, frames in PATROL)
+    for key, frames in PATROL:
+        if frame < frames:
+            return key
+        frame -= frames
+
+
+def place_player(player, x, y):
+    player.x = x
+    player.y = y
+    player.rect.x = x
+    player.rect.y = y
+
+
+def keep_alive(player):
+    # Een benchmark mag niet stoppen omdat de speler dood gaat
+    player.health = player.max_health
+
+
+def free_tiles(room, rng, count):
+    """count willekeurige lege tiles (pixel posities) in een overworld room"""
+    tiles = [(x, y) for y in range(room.grid_height) for x in range(room.grid_width)
+             if (x, y) not in room.occupied_tiles]
+    return [(room.grid_origin_x + x * room.tile_size, room.grid_origin_y + y * room.tile_size)
+            for x, y in rng.sample(tiles, min(count, len(tiles)))]
+
+
+def enter_dungeon_room(game, room_pos):
+    game.in_dungeon = True
+    game.dungeon_manager.current_room = room_pos
+    place_player(game.player, GAME_WIDTH // 2, HUD_HEIGHT + GAME_HEIGHT - 120)
+    return game.dungeon_manager.get_current_room()
+
+
+def patrol_and_attack(game):
+    """step() die de speler rondjes laat lopen en regelmatig laat slaan"""
+    def step(frame):
+        keep_alive(game.player)
+        pressed = (pygame.K_SPACE,) if frame % ATTACK_INTERVAL == 0 else ()
+        game.input_source.set_keys((patrol_keys(frame),), pressed)
+    return step
+
+
+def overworld_swarm(game, rng):
+    """Overworld room vol monsters en archers (batch stores, pijlen, zwaard)"""
+    game.player.has_sword = True
+    room = game.room_manager.get_current_room()
+    positions = free_tiles(room, rng, SWARM_MONSTERS + SWARM_ARCHERS)
+    for x, y in positions[:SWARM_MONSTERS]:
+        room.add_monster(Monster(x, y))
+    for x, y in positions[SWARM_MONSTERS:]:
+        room.add_archer(Archer(x, y))
+    return patrol_and_attack(game)
+
+
+def bat_swarm(game, rng):
+    """Zwerm vleermuizen in de center room van de dungeon"""
+    game.player.has_sword = True
+    room = enter_dungeon_room(game, (0, 0))
+    room.add_bats(BAT_SWARM_SIZE)
+    return patrol_and_attack(game)
+
+
+def slime_cascade(game, rng):
+    """Grote slimes die steeds gesplitst worden; als alles dood is komt er een nieuwe golf"""
+    game.player.has_sword = True
+    room = enter_dungeon_room(game, (-1, 0))
+
+    def add_wave():
+        for _ in range(SLIME_WAVE_SIZE):
+            x = rng.randint(WALL_THICKNESS + 50, GAME_WIDTH - WALL_THICKNESS - 75)
+            y = rng.randint(HUD_HEIGHT + WALL_THICKNESS + 50, HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS - 70)
+            room.add_slime(Slime(x, y, is_large=True))
+
+    def step(frame):
+        player = game.player
+        keep_alive(player)
+        if frame % ATTACK_INTERVAL:
+            game.input_source.set_keys(())
+            return
+        target = next((slime for slime in room.slimes if slime.alive), None)
+        if target is None:
+            add_wave()
+            target = room.slimes[-1]
+        # Links naast de slime staan en naar rechts slaan
+        place_player(player, target.x - player.width - 4, target.y)
+        player.facing = 'right'
+        game.input_source.set_keys((), (pygame.K_SPACE,))
+
+    add_wave()
+    return step
+
+
+def boss_barrage(game, rng):
+    """De boss schiet veel sneller dan normaal; de speler ontwijkt heen en weer"""
+    room = enter_dungeon_room(game, (0, -1))
+    room.boss.fireball_cooldown_max = BARRAGE_COOLDOWN
+
+    def step(frame):
+        keep_alive(game.player)
+        key = pygame.K_LEFT if (frame // 60) % 2 else pygame.K_RIGHT
+        game.input_source.set_keys((key,))
+    return step
+
+
+def world_transitions(game, rng):
+    """Willekeurige tour door een grote wereld: room generatie, prefetch en eviction"""
+    game.room_manager = RoomManager(GAME_WIDTH, GAME_HEIGHT, TRANSITION_WORLD_SIZE, TRANSITION_WORLD_SIZE,
+                                    game.cave_entrances)
+    center_y = HUD_HEIGHT + GAME_HEIGHT // 2 - game.player.height // 2
+    # Net over de rand in het midden van de exit, zodat de volgende update overgaat
+    edges = {
+        'east': ((GAME_WIDTH - game.player.width + 2, center_y), pygame.K_RIGHT),
+        'west': ((-2, center_y), pygame.K_LEFT),
+        'north': ((GAME_WIDTH // 2 - game.player.width // 2, HUD_HEIGHT - 2), pygame.K_UP),
+        'south': ((GAME_WIDTH // 2 - game.player.width // 2, HUD_HEIGHT + GAME_HEIGHT - game.player.height + 2),
+                  pygame.K_DOWN),
+    }
+
+    def step(frame):
+        keep_alive(game.player)
+        if frame % TRANSITION_FRAMES:
+            game.input_source.set_keys(())
+            return
+        room = game.room_manager.get_current_room()
+        direction = rng.choice([direction for direction, open_exit in room.exits.items() if open_exit])
+        (x, y), key = edges[direction]
+        place_player(game.player, x, y)
+        game.input_source.set_keys((key,))
+    return step
+
+
+SCENARIOS = {
+    'overworld_swarm': overworld_swarm,
+    'bat_swarm': bat_swarm,
+    'slime_cascade': slime_cascade,
+    'boss_barrage': boss_barrage,
+    'world_transitions': world_transitions,
+}
+
+
+def setup_scenario(game, name, seed):
+    """Zet scenario `name` klaar in game en geef de step functie terug"""
+    return SCENARIOS[name](game, random.Random(seed))
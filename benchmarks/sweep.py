@@ -0,0 +1,292 @@
+"""
+Balance sweep - Headless games over een grid van constant overrides, verdeeld over een process pool
+
+    python -m benchmarks.sweep --set MONSTER_SPEED=1,1.5,2 --set ARCHER_SHOOT_COOLDOWN=60,120
+    python -m benchmarks.sweep --set PLAYER_INVINCIBILITY_FRAMES=30,90 --player patrol --seeds 8
+    python -m benchmarks.sweep --arena boss --set BOSS_FIREBALL_COOLDOWN=60,120,180
+    python -m benchmarks.sweep --set DROP_HEALTH_ROLLS=0,3,6 --csv sweep.csv
+    python -m benchmarks.sweep --player explorer --frames 36000 --seeds 32
+
+Elke combinatie van waarden wordt met `seeds` verschillende world seeds gespeeld door
+een gescripte speler met zwaard, in een arena: de start room met extra vijanden of een
+dungeon room (bats, slimes, boss). Per combinatie: gemiddelde overleving (frames tot de
+speler dood is, maximaal `frames`), schade, kills en de tijd van een Game.update(). De
+overrides worden in het worker proces gezet; constants.py zelf verandert niet.
+"""
+import os
+import sys
+import csv
+import ast
+import math
+import time
+import random
+import argparse
+import itertools
+import multiprocessing
+
+# Vanuit de repo root draaien, ook als script (python benchmarks/sweep.py)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import constants
+from game import Game
+from managers.input_manager import ScriptedInput
+from managers.explorer_bot import ExplorerBot
+from world.scene_queries import get_enemies
+from entities.monster import Monster
+from entities.archer import Archer
+from benchmarks.scenarios import patrol_keys, free_tiles, enter_dungeon_room, ATTACK_INTERVAL
+from constants import SWEEP_FRAMES, SWEEP_SEEDS, SWEEP_SEED
+
+STUCK_FRAMES = 20  # Zo lang niet bewogen = vast tegen een obstakel
+DETOUR_FRAMES = 30  # Dan zo lang een andere kant op
+ATTACK_RANGE = 50  # Afstand (midden tot midden) waarop de chase speler slaat
+ARENA_MONSTERS = 8  # Extra vijanden in de overworld arena
+ARENA_ARCHERS = 4
+
+DIRECTION_KEYS = {
+    'left': pygame.K_LEFT, 'right': pygame.K_RIGHT, 'up': pygame.K_UP, 'down': pygame.K_DOWN,
+}
+
+_defaults = {}  # Oorspronkelijke waarden van constants die ooit overschreven zijn
+
+
+def apply_overrides(overrides):
+    """Zet constants op de waarden in overrides en alle andere terug naar hun standaard
+
+    Modules die `from constants import X` doen hebben een eigen kopie van X; die wordt
+    in elke geladen module uit de repo ook gezet. Waarden die al bij het aanmaken van
+    een object gekopieerd zijn (Monster.speed) gelden dus pas voor nieuwe games, en
+    default argumenten van functies veranderen niet.
+    """
+    for name in overrides:
+        if not hasattr(constants, name):
+            raise ValueError(f"Onbekende constant {name}")
+        _defaults.setdefault(name, getattr(constants, name))
+    for name, default in _defaults.items():
+        value = overrides.get(name, default)
+        for module in list(sys.modules.values()):
+            path = getattr(module, '__file__', None)
+            if path and os.path.abspath(path).startswith(ROOT + os.sep) and name in vars(module):
+                setattr(module, name, value)
+
+
+def chase_keys(game, state):
+    """Loop naar de dichtstbijzijnde vijand en sla als hij dichtbij is; (held, pressed)"""
+    player = game.player
+    center_x, center_y = player.rect.center
+    if state['detour']:
+        state['detour'] -= 1
+        return (state['detour_key'],), ()
+
+    # Vast tegen een obstakel: even een willekeurige andere kant op
+    position = (player.x, player.y)
+    state['still'] = state['still'] + 1 if position == state['position'] else 0
+    state['position'] = position
+    if state['still'] >= STUCK_FRAMES:
+        state['still'] = 0
+        state['detour'] = DETOUR_FRAMES
+        state['detour_key'] = state['rng'].choice(list(DIRECTION_KEYS.values()))
+        return (state['detour_key'],), ()
+
+    enemies = [enemy for enemy in get_enemies(game.get_current_scene()) if enemy.alive]
+    if not enemies:
+        return (patrol_keys(state['frame']),), ()
+    target = min(enemies, key=lambda enemy: (enemy.rect.centerx - center_x) ** 2 +
+                                            (enemy.rect.centery - center_y) ** 2)
+    dx = target.rect.centerx - center_x
+    dy = target.rect.centery - center_y
+    if abs(dx) > abs(dy):
+        key = DIRECTION_KEYS['right' if dx > 0 else 'left']
+    else:
+        key = DIRECTION_KEYS['down' if dy > 0 else 'up']
+    pressed = (pygame.K_SPACE,) if math.hypot(dx, dy) < ATTACK_RANGE else ()
+    return (key,), pressed
+
+
+def patrol_player(game, state):
+    """Rondjes door de room, regelmatig slaan (zelfde als de benchmark scenarios)"""
+    frame = state['frame']
+    return (patrol_keys(frame),), (pygame.K_SPACE,) if frame % ATTACK_INTERVAL == 0 else ()
+
+
+def explorer_player(game, state):
+    """De explorer bot: vecht zich vanuit de arena door naar de dungeon en de boss"""
+    bot = state.get('bot')
+    if bot is None:
+        bot = state['bot'] = ExplorerBot()
+        bot.attach(game)
+    return bot.next_keys()
+
+
+PLAYERS = {
+    'chase': chase_keys,
+    'patrol': patrol_player,
+    'explorer': explorer_player,
+}
+
+
+def overworld_arena(game, rng):
+    """Start room met extra monsters en archers"""
+    room = game.room_manager.get_current_room()
+    positions = free_tiles(room, rng, ARENA_MONSTERS + ARENA_ARCHERS)
+    for x, y in positions[:ARENA_MONSTERS]:
+        room.add_monster(Monster(x, y))
+    for x, y in positions[ARENA_MONSTERS:]:
+        room.add_archer(Archer(x, y))
+
+
+# Arena -> setup(game, rng); de dungeon rooms zoals ze gegenereerd zijn
+ARENAS = {
+    'overworld': overworld_arena,
+    'bats': lambda game, rng: enter_dungeon_room(game, (1, 0)),
+    'slimes': lambda game, rng: enter_dungeon_room(game, (-1, 0)),
+    'boss': lambda game, rng: enter_dungeon_room(game, (0, -1)),
+}
+
+
+def play(task):
+    """Eén game in een worker: (overrides, seed, arena, player, frames) -> metrics dict"""
+    overrides, seed, arena, player_name, frames = task
+    apply_overrides(overrides)
+    policy = PLAYERS[player_name]
+    input_source = ScriptedInput()
+    game = Game(headless=True, input_source=input_source, seed=seed)
+    player = game.player
+    player.has_sword = True
+    rng = random.Random(seed)
+    ARENAS[arena](game, rng)
+    state = {'frame': 0, 'rng': rng, 'position': None, 'still': 0, 'detour': 0}
+
+    damage = kills = 0
+    update_ns = 0
+    perf_counter_ns = time.perf_counter_ns
+    frame = 0
+    for frame in range(frames):
+        state['frame'] = frame
+        held, pressed = policy(game, state)
+        input_source.set_keys(held, pressed)
+        alive = [enemy for enemy in get_enemies(game.get_current_scene()) if enemy.alive]
+        health = player.health
+        game.handle_events()
+        start = perf_counter_ns()
+        game.update()
+        update_ns += perf_counter_ns() - start
+        damage += max(0, health - player.health)
+        kills += sum(1 for enemy in alive if not enemy.alive)
+        if not player.alive:
+            break
+    return {
+        'overrides': overrides,
+        'survived': frame + 1,
+        'died': not player.alive,
+        'damage': damage,
+        'kills': kills,
+        'update_us': update_ns / (frame + 1) / 1000,
+    }
+
+
+def parse_values(text):
+    """'1,1.5,2' -> [1, 1.5, 2] (Python literals)"""
+    try:
+        return [ast.literal_eval(value.strip()) for value in text.split(',')]
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(f"ongeldige waarden {text}")
+
+
+def parse_setting(text):
+    name, separator, values = text.partition('=')
+    if not separator or not name:
+        raise argparse.ArgumentTypeError(f"verwacht NAAM=waarde,waarde,... in plaats van {text}")
+    return name.strip(), parse_values(values)
+
+
+def build_grid(settings):
+    """Lijst van override dicts: alle combinaties van de waarden (leeg = alleen de standaard)"""
+    names = [name for name, _ in settings]
+    return [dict(zip(names, values)) for values in itertools.product(*(values for _, values in settings))]
+
+
+def run_sweep(grid, seeds, base_seed=SWEEP_SEED, arena='overworld', player='chase', frames=SWEEP_FRAMES,
+              workers=None):
+    """Speel elke combinatie met `seeds` seeds; geeft per combinatie de samengevoegde rij"""
+    tasks = [(overrides, base_seed + index, arena, player, frames)
+             for overrides in grid for index in range(seeds)]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(play, tasks, chunksize=1)
+    else:
+        results = [play(task) for task in tasks]
+        apply_overrides({})
+    return [aggregate(overrides, results[index * seeds:(index + 1) * seeds])
+            for index, overrides in enumerate(grid)]
+
+
+def aggregate(overrides, results):
+    count = len(results)
+    return {
+        **overrides,
+        'games': count,
+        'survived': sum(result['survived'] for result in results) / count,
+        'deaths': sum(result['died'] for result in results),
+        'damage': sum(result['damage'] for result in results) / count,
+        'kills': sum(result['kills'] for result in results) / count,
+        'update_us': sum(result['update_us'] for result in results) / count,
+    }
+
+
+METRIC_COLUMNS = (('games', 'games', '{:d}'), ('survived', 'frames', '{:.0f}'), ('deaths', 'deaths', '{:d}'),
+                  ('damage', 'schade', '{:.1f}'), ('kills', 'kills', '{:.1f}'), ('update_us', 'us/frame', '{:.1f}'))
+
+
+def format_table(names, rows):
+    """Eén tekst tabel: de parameters, dan de metrics per combinatie"""
+    headers = list(names) + [header for _, header, _ in METRIC_COLUMNS]
+    lines = [[str(row[name]) for name in names] +
+             [fmt.format(row[key]) for key, _, fmt in METRIC_COLUMNS] for row in rows]
+    widths = [max(len(header), *(len(line[column]) for line in lines)) for column, header in enumerate(headers)]
+    out = ['  '.join(header.rjust(width) for header, width in zip(headers, widths))]
+    out.extend('  '.join(value.rjust(width) for value, width in zip(line, widths)) for line in lines)
+    return '\n'.join(out)
+
+
+def write_csv(path, names, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(names) + [key for key, _, _ in METRIC_COLUMNS])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Balance sweep voor The Legend of Smellda")
+    parser.add_argument('--set', dest='settings', action='append', type=parse_setting, default=[],
+                        metavar='NAAM=W1,W2', help="Waarden voor een constant (meerdere keren te gebruiken)")
+    parser.add_argument('--seeds', type=int, default=SWEEP_SEEDS, help="Games per combinatie")
+    parser.add_argument('--seed', type=int, default=SWEEP_SEED, help="Eerste world seed")
+    parser.add_argument('--frames', type=int, default=SWEEP_FRAMES, help="Maximale frames per game")
+    parser.add_argument('--arena', choices=ARENAS, default='overworld', help="Waar gespeeld wordt")
+    parser.add_argument('--player', choices=PLAYERS, default='chase', help="Gescripte speler")
+    parser.add_argument('--workers', type=int, help="Aantal processen (standaard alle cores)")
+    parser.add_argument('--csv', metavar='FILE', help="Schrijf de tabel ook als CSV")
+    args = parser.parse_args(argv)
+    for name, _ in args.settings:
+        if not hasattr(constants, name):
+            parser.error(f"onbekende constant {name}")
+
+    names = [name for name, _ in args.settings]
+    grid = build_grid(args.settings)
+    rows = run_sweep(grid, args.seeds, args.seed, args.arena, args.player, args.frames, args.workers)
+    print(format_table(names, rows))
+    if args.csv:
+        write_csv(args.csv, names, rows)
+        print(f"opgeslagen in {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
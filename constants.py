@@ -13,6 +13,13 @@ SCREEN_HEIGHT = GAME_HEIGHT + HUD_HEIGHT
 TILE_SIZE = 50
 WALL_THICKNESS = 40
 EXIT_SIZE = 100
+CAVE_EXIT_SIZE = 50  # Smalle exit onderin een cave
+ENTITY_QUERY_MARGIN = 8  # Extra pixels rond een bewegend entity bij obstacle queries (> 2x snelheid)
+ENTITY_BATCH_THRESHOLD = 40  # Vanaf zoveel monsters/archers bewegen ze in één numpy batch
+
+# Tile codes in de occupancy map van een room (0 = vrij)
+TILE_EMPTY = 0
+OBSTACLE_TILE_CODES = {'rock': 1, 'water': 2, 'tree': 3}
 
 # FPS
 FPS = 60
@@ -52,6 +59,8 @@ SAFE_DISTANCE_FROM_EXIT = 3
 WORLD_WIDTH = 3
 WORLD_HEIGHT = 3
 SPAWN_ROOM = (1, 1)
+ROOM_CACHE_SIZE = 16  # Maximaal aantal overworld rooms als object in het geheugen
+SAVE_FILE = 'saves/quicksave.sav'  # Quicksave (F5) en quickload (F9)
 
 # Kleuren
 WALL_COLOR = (100, 70, 50)
@@ -98,6 +107,8 @@ STAIRS_STEP_COLOR = (80, 70, 60)
 MINIMAP_ROOM_SIZE = 12
 MINIMAP_ROOM_SPACING = 2
 MINIMAP_START_X = 15
+MINIMAP_WINDOW_WIDTH = 9  # Maximaal aantal rooms naast elkaar op de minimap
+MINIMAP_WINDOW_HEIGHT = 3  # Maximaal aantal rooms onder elkaar (past in de HUD)
 MINIMAP_VISITED_ROOM_COLOR = (100, 100, 100)
 MINIMAP_CURRENT_ROOM_COLOR = (255, 255, 255)
 
@@ -118,11 +129,21 @@ DUNGEON_LOCK_BORDER_COLOR = (70, 70, 70)  # Lichtgrijs voor slot rand
 DUNGEON_KEYHOLE_COLOR = (30, 30, 30)  # Zwart voor sleutelgat
 DUNGEON_FLOOR_TILE_COLOR = (35, 50, 75)  # Lichtere blauwe tint voor vloertegels
 
+# Bat settings
+BAT_WIDTH = 25
+BAT_HEIGHT = 20
+
 # Bat kleuren
 BAT_BODY_COLOR = (5, 5, 5)  # Pikzwart
 BAT_WING_COLOR = (10, 10, 10)  # Bijna zwart voor vleugels
 BAT_EYE_COLOR = (255, 0, 0)  # Rode oogjes
 
+# Slime settings
+SLIME_LARGE_WIDTH = 40
+SLIME_LARGE_HEIGHT = 35
+SLIME_SMALL_WIDTH = 20
+SLIME_SMALL_HEIGHT = 18
+
 # Slime kleuren
 SLIME_LARGE_COLOR = (128, 128, 128)  # Grijs voor grote slimes
 SLIME_SMALL_COLOR = (160, 160, 160)  # Lichter grijs voor kleine slimes
@@ -132,6 +153,10 @@ SLIME_HIGHLIGHT_COLOR = (180, 180, 180)  # Highlight kleur
 CAVE_BACKGROUND_COLOR = (0, 0, 0)  # Zwart
 CAVE_ENTRANCE_COLOR = (0, 0, 0)  # Zwart
 
+# Fire settings
+FIRE_WIDTH = 20
+FIRE_HEIGHT = 25
+
 # Fire kleuren
 FIRE_COLOR_1 = (255, 69, 0)  # Oranje-rood
 FIRE_COLOR_2 = (255, 140, 0)  # Donker oranje
@@ -162,6 +187,93 @@ ARCHER_SHOOT_COOLDOWN = 120  # 2 seconden @ 60 FPS
 ARROW_SPEED = 4
 ARROW_WIDTH = 12
 ARROW_HEIGHT = 4
+ARROW_ANGLE_STEPS = 64  # Aantal vooraf gedraaide pijl sprites (hoeken worden hierop afgerond)
+
+# Boss settings
+BOSS_WIDTH = 60
+BOSS_HEIGHT = 70
+BOSS_BODY_COLOR = (150, 50, 50)  # Donkerrood
+BOSS_BELLY_COLOR = (200, 100, 100)  # Lichter rood
+BOSS_EYE_COLOR = (255, 255, 0)  # Geel
+BOSS_HORN_COLOR = (80, 30, 30)  # Donkerder rood
+
+# Boss vuurbal settings
+FIREBALL_SPEED = 3
+FIREBALL_RADIUS = 8
+BOSS_FIREBALL_COOLDOWN = 180  # 3 seconden @ 60 FPS
+
+# Drops van verslagen vijanden: worp van 1 tot DROP_ROLL, kansen als aantal ogen
+DROP_ROLL = 20
+DROP_HEALTH_ROLLS = 3  # Health drop (15% kans)
+DROP_RUPEE_ROLLS = 6  # 1-rupee (30% kans)
+DROP_BIG_RUPEE_ROLLS = 3  # 5-rupee (15% kans)
+
+# Item settings
+RUPEE_SIZE = 16
+TRIFORCE_WIDTH = 40
+TRIFORCE_HEIGHT = 35
+
+# Sprite atlas settings
+SPRITE_CANVAS_MARGIN = 48  # Ruimte rond een entity bij het bakken (zwaard, staart, triforce)
+SPRITE_ATLAS_WIDTH = 512  # Breedte van de sheet waarin alle frames gepakt worden
+
+# Text cache settings
+TEXT_CACHE_MAX_ENTRIES = 128  # Maximaal aantal gerenderde teksten in de cache
+TEXT_CACHE_MAX_BYTES = 2 * 1024 * 1024  # Geheugen limiet voor gerenderde teksten (2 MB)
+
+# Profiler settings (F3)
+PROFILER_WINDOW = 240  # Aantal metingen per scope waarover p50/p95/p99 berekend worden
+PROFILER_REFRESH_FRAMES = 30  # Overlay tekst twee keer per seconde vernieuwen
+PROFILER_FONT_SIZE = 14
+PROFILER_BG_COLOR = (0, 0, 0)
+PROFILER_TEXT_COLOR = (0, 255, 0)
+
+# Telemetry settings
+TELEMETRY_BATCH_FRAMES = 120  # Frames per batch naar de writer thread (2 seconden)
+TELEMETRY_QUEUE_BATCHES = 64  # Maximaal aantal batches in de wachtrij, daarna worden ze weggegooid
+TELEMETRY_CLOSE_TIMEOUT = 5  # Seconden dat close() op de writer thread wacht
+
+# Allocation tracking settings (diagnose mode)
+ALLOC_REPORT_FRAMES = 1000  # Elke zoveel frames een rapport
+ALLOC_TOP_SITES = 15  # Aantal call sites in het rapport
+
+# Benchmark settings (python -m benchmarks.run)
+BENCHMARK_FRAMES = 1200  # Frames per scenario (20 seconden speeltijd)
+BENCHMARK_WARMUP_FRAMES = 60  # Niet gemeten: sprites bakken, statische lagen, eerste rooms
+BENCHMARK_REPEATS = 3  # Tijden: beste van zoveel runs (minder ruis van de rest van het systeem)
+BENCHMARK_SEED = 1234
+BENCHMARK_MARGIN = 0.20  # Maximaal 20% slechter dan de baseline
+BENCHMARK_BASELINE_FILE = 'benchmarks/baseline.json'
+
+# Balance sweep settings (python -m benchmarks.sweep)
+SWEEP_FRAMES = 3600  # Maximale lengte van een game (1 minuut speeltijd)
+SWEEP_SEEDS = 4  # Games per combinatie van parameters
+SWEEP_SEED = 1
+
+# Explorer bot settings (python game.py --headless --bot)
+BOT_FRAMES = 36000  # Maximale lengte van een bot run (10 minuten speeltijd)
+BOT_ENGAGE_DISTANCE = 160  # Overworld: vijanden binnen deze afstand aanvallen (dungeon: allemaal)
+BOT_DROP_DISTANCE = 200  # Drops binnen deze afstand oppakken (dungeon: allemaal)
+BOT_CHASE_DISTANCE = 100  # Dichterbij: direct op de vijand af in plaats van via de tiles
+BOT_GIVE_UP_FRAMES = 600  # Zo lang zonder kill: vijand een tijd negeren
+BOT_IGNORE_FRAMES = 300
+BOT_STUCK_FRAMES = 20  # Zo lang niet bewogen = vast
+BOT_DETOUR_FRAMES = 15  # Dan zo lang een willekeurige andere kant op
+
+# Reinforcement learning environment settings
+RL_FRAME_SKIP = 4  # Frames per actie
+RL_MAX_STEPS = 10000  # Daarna wordt de episode afgekapt
+RL_NEAREST_ENEMIES = 8  # Aantal vijanden in de state observatie
+RL_NEAREST_PROJECTILES = 8  # Aantal projectielen in de state observatie
+RL_PIXEL_WIDTH = 160  # Verkleinde frame voor pixel observaties
+RL_PIXEL_HEIGHT = 120
+RL_REWARD_KILL = 1.0
+RL_REWARD_DAMAGE = -0.5  # Per half hartje
+RL_REWARD_RUPEE = 0.05  # Per rupee
+RL_REWARD_NEW_ROOM = 0.5  # Eerste keer in een room, dungeon room of cave
+RL_REWARD_ITEM = 2.0  # Zwaard, schild, sleutel of heart container
+RL_REWARD_WIN = 10.0
+RL_REWARD_DEATH = -5.0
 
 # Archer kleuren
 ARCHER_BODY_COLOR = (32, 140, 128)  # Donker turkoois
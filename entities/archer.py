@@ -1,12 +1,12 @@
 import pygame
-import random
-from entities.arrow import Arrow
 from constants import (
     ARCHER_WIDTH, ARCHER_HEIGHT, ARCHER_SPEED, ARCHER_HEALTH,
     ARCHER_SHOOT_COOLDOWN, WALL_THICKNESS, HUD_HEIGHT,
     ARCHER_BODY_COLOR, ARCHER_EYE_COLOR, ARCHER_PUPIL_COLOR, ARCHER_BOW_COLOR,
     MONSTER_DAMAGE_COOLDOWN
 )
+from managers.sprite_atlas import get_sprite_atlas
+from world.random_streams import ai_random
 
 class Archer:
     """Turkoois vijand die pijlen afvuurt"""
@@ -19,9 +19,9 @@ class Archer:
         self.rect = pygame.Rect(x, y, self.width, self.height)
 
         # Random bewegingsrichting
-        self.direction = random.choice(['left', 'right', 'up', 'down'])
+        self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
         self.direction_timer = 0
-        self.direction_change_interval = random.randint(60, 180)
+        self.direction_change_interval = ai_random.randint(60, 180)
 
         # Health
         self.health = ARCHER_HEALTH
@@ -33,19 +33,18 @@ class Archer:
 
         # Arrow shooting
         self.shoot_cooldown = 120  # Start met vertraging voordat eerste schot
-        self.arrows = []
 
-    def update(self, obstacles, screen_width, screen_height, hud_height, pushable_block, player):
-        """Update archer beweging en pijlen"""
+    def update(self, obstacles, screen_width, screen_height, hud_height, pushable_block, player, projectiles):
+        """Update archer beweging en schieten (pijlen bewegen in de ProjectilePool van de room)"""
         if not self.alive:
             return
 
         # Verander af en toe van richting
         self.direction_timer += 1
         if self.direction_timer >= self.direction_change_interval:
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
-            self.direction_change_interval = random.randint(60, 180)
+            self.direction_change_interval = ai_random.randint(60, 180)
 
         # Sla oude positie op
         old_x = self.x
@@ -68,12 +67,12 @@ class Archer:
         # Check muur collisions
         if self.x < WALL_THICKNESS or self.x + self.width > screen_width - WALL_THICKNESS:
             self.x = old_x
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
 
         if self.y < hud_height + WALL_THICKNESS or self.y + self.height > screen_height - WALL_THICKNESS:
             self.y = old_y
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
 
         # Check obstakel collisions
@@ -81,7 +80,7 @@ class Archer:
             if self.rect.colliderect(obstacle.rect):
                 self.x = old_x
                 self.y = old_y
-                self.direction = random.choice(['left', 'right', 'up', 'down'])
+                self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
                 self.direction_timer = 0
                 break
 
@@ -89,7 +88,7 @@ class Archer:
         if pushable_block and self.rect.colliderect(pushable_block.rect):
             self.x = old_x
             self.y = old_y
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
 
         # Update rect met nieuwe positie
@@ -102,24 +101,18 @@ class Archer:
             if self.damage_cooldown == 0:
                 self.can_damage = True
 
-        # Update shoot cooldown en schiet pijl
+        self.update_shooting(player, projectiles)
+
+    def update_shooting(self, player, projectiles):
+        """Tel de shoot cooldown af en schiet een pijl (beweging van de archer zelf zit in update)"""
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
         else:
             # Schiet pijl richting speler
-            self.shoot_arrow(player.x + player.width // 2, player.y + player.height // 2)
+            self.shoot_arrow(player.x + player.width // 2, player.y + player.height // 2, projectiles)
             self.shoot_cooldown = ARCHER_SHOOT_COOLDOWN
 
-        # Update arrows
-        for arrow in self.arrows[:]:
-            arrow.update()
-
-        # Verwijder pijlen die buiten scherm zijn
-        self.arrows = [arrow for arrow in self.arrows
-                      if (0 <= arrow.x <= screen_width and
-                          hud_height <= arrow.y <= screen_height)]
-
-    def shoot_arrow(self, target_x, target_y):
+    def shoot_arrow(self, target_x, target_y, projectiles):
         """Schiet een pijl richting het doel"""
         center_x = self.x + self.width // 2
         center_y = self.y + self.height // 2
@@ -134,8 +127,7 @@ class Archer:
             dy /= distance
 
         # Maak nieuwe pijl
-        arrow = Arrow(center_x, center_y, dx, dy)
-        self.arrows.append(arrow)
+        projectiles.spawn_arrow(center_x, center_y, dx, dy, owner=self)
 
     def take_damage(self):
         """Neem schade van zwaard"""
@@ -148,30 +140,35 @@ class Archer:
         self.can_damage = False
         self.damage_cooldown = MONSTER_DAMAGE_COOLDOWN
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent"""
+        return self.rect.inflate(4, 4)
+
     def render(self, screen):
         """Teken de archer"""
         if not self.alive:
             return
 
-        # Turkoois lichaam
-        pygame.draw.rect(screen, ARCHER_BODY_COLOR, self.rect)
-
-        # Ogen
-        eye_y = self.y + 10
-        # Linker oog
-        pygame.draw.circle(screen, ARCHER_EYE_COLOR, (int(self.x + 10), int(eye_y)), 4)
-        pygame.draw.circle(screen, ARCHER_PUPIL_COLOR, (int(self.x + 10), int(eye_y)), 2)
-        # Rechter oog
-        pygame.draw.circle(screen, ARCHER_EYE_COLOR, (int(self.x + 20), int(eye_y)), 4)
-        pygame.draw.circle(screen, ARCHER_PUPIL_COLOR, (int(self.x + 20), int(eye_y)), 2)
-
-        # Boog (simpele boog aan de zijkant)
-        bow_x = self.x + self.width - 5
-        bow_y = self.y + self.height // 2
-        pygame.draw.arc(screen, ARCHER_BOW_COLOR,
-                       pygame.Rect(bow_x - 8, bow_y - 10, 12, 20),
-                       -1.5, 1.5, 2)
-
-        # Render arrows
-        for arrow in self.arrows:
-            arrow.render(screen)
+        get_sprite_atlas().blit(screen, ('archer',), self.rect.x, self.rect.y)
+
+
+def draw_archer(screen, x, y):
+    """Teken een archer met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    # Turkoois lichaam
+    pygame.draw.rect(screen, ARCHER_BODY_COLOR, (x, y, ARCHER_WIDTH, ARCHER_HEIGHT))
+
+    # Ogen
+    eye_y = y + 10
+    # Linker oog
+    pygame.draw.circle(screen, ARCHER_EYE_COLOR, (x + 10, eye_y), 4)
+    pygame.draw.circle(screen, ARCHER_PUPIL_COLOR, (x + 10, eye_y), 2)
+    # Rechter oog
+    pygame.draw.circle(screen, ARCHER_EYE_COLOR, (x + 20, eye_y), 4)
+    pygame.draw.circle(screen, ARCHER_PUPIL_COLOR, (x + 20, eye_y), 2)
+
+    # Boog (simpele boog aan de zijkant)
+    bow_x = x + ARCHER_WIDTH - 5
+    bow_y = y + ARCHER_HEIGHT // 2
+    pygame.draw.arc(screen, ARCHER_BOW_COLOR,
+                   pygame.Rect(bow_x - 8, bow_y - 10, 12, 20),
+                   -1.5, 1.5, 2)
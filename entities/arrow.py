@@ -1,48 +1,54 @@
 import pygame
 import math
-from constants import ARROW_SPEED, ARROW_WIDTH, ARROW_HEIGHT, ARROW_COLOR, ARROW_TIP_COLOR
-
-class Arrow:
-    """Pijl projectile afgevuurd door Archer vijanden"""
-    def __init__(self, x, y, dx, dy):
-        self.x = x
-        self.y = y
-        self.dx = dx * ARROW_SPEED
-        self.dy = dy * ARROW_SPEED
-
-        # Bereken de hoek voor rotatie van de pijl
-        self.angle = math.atan2(dy, dx)
-
-        # Hitbox voor collision detection
-        self.width = ARROW_WIDTH
-        self.height = ARROW_HEIGHT
-        self.rect = pygame.Rect(x - self.width // 2, y - self.height // 2, self.width, self.height)
-
-    def update(self):
-        """Update pijl positie"""
-        self.x += self.dx
-        self.y += self.dy
-        self.rect.x = self.x - self.width // 2
-        self.rect.y = self.y - self.height // 2
-
-    def render(self, screen):
-        """Teken de pijl als een geroteerde rechthoek met pijlpunt"""
-        # Maak een surface voor de pijl
-        arrow_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-
-        # Teken de pijl shaft (bruin)
-        pygame.draw.rect(arrow_surface, ARROW_COLOR, (0, self.height // 4, self.width - 3, self.height // 2))
-
-        # Teken de pijlpunt (grijs driehoek)
-        tip_points = [
-            (self.width - 3, self.height // 2),  # Midden rechts
-            (self.width, 0),  # Top rechts
-            (self.width, self.height)  # Bottom rechts
-        ]
-        pygame.draw.polygon(arrow_surface, ARROW_TIP_COLOR, tip_points)
-
-        # Roteer de pijl in de richting van beweging
-        rotated_surface = pygame.transform.rotate(arrow_surface, -math.degrees(self.angle))
-        rotated_rect = rotated_surface.get_rect(center=(int(self.x), int(self.y)))
-
-        screen.blit(rotated_surface, rotated_rect)
+from constants import ARROW_WIDTH, ARROW_HEIGHT, ARROW_COLOR, ARROW_TIP_COLOR, ARROW_ANGLE_STEPS
+
+# Pijlen zelf leven als slots in de ProjectilePool van de room (world/projectile_pool.py);
+# hier staat alleen hoe een pijl getekend wordt.
+
+# Vooraf gedraaide sprites per hoek-stap: (surface, halve breedte, halve hoogte)
+_arrow_sprites = []
+
+
+def _draw_arrow_surface():
+    """Teken de pijl horizontaal (naar rechts wijzend)"""
+    arrow_surface = pygame.Surface((ARROW_WIDTH, ARROW_HEIGHT), pygame.SRCALPHA)
+
+    # Teken de pijl shaft (bruin)
+    pygame.draw.rect(arrow_surface, ARROW_COLOR, (0, ARROW_HEIGHT // 4, ARROW_WIDTH - 3, ARROW_HEIGHT // 2))
+
+    # Teken de pijlpunt (grijs driehoek)
+    tip_points = [
+        (ARROW_WIDTH - 3, ARROW_HEIGHT // 2),  # Midden rechts
+        (ARROW_WIDTH, 0),  # Top rechts
+        (ARROW_WIDTH, ARROW_HEIGHT)  # Bottom rechts
+    ]
+    pygame.draw.polygon(arrow_surface, ARROW_TIP_COLOR, tip_points)
+    return arrow_surface
+
+
+def get_arrow_sprites():
+    """Alle gedraaide pijl sprites (bij het eerste gebruik één keer getekend)"""
+    if not _arrow_sprites:
+        arrow_surface = _draw_arrow_surface()
+        for step in range(ARROW_ANGLE_STEPS):
+            rotated_surface = pygame.transform.rotate(arrow_surface, -step * 360 / ARROW_ANGLE_STEPS)
+            _arrow_sprites.append((rotated_surface,
+                                   rotated_surface.get_width() // 2, rotated_surface.get_height() // 2))
+    return _arrow_sprites
+
+
+def get_arrow_angle_step(angle):
+    """Rond een hoek (radialen) af op de dichtstbijzijnde sprite"""
+    return round(angle * ARROW_ANGLE_STEPS / (2 * math.pi)) % ARROW_ANGLE_STEPS
+
+
+def get_arrow_render_rect(x, y):
+    """Gebied dat een geroteerde pijl op (x, y) kan beslaan"""
+    return pygame.Rect(int(x) - ARROW_WIDTH // 2 - 2, int(y) - ARROW_WIDTH // 2 - 2,
+                       ARROW_WIDTH + 4, ARROW_WIDTH + 4)
+
+
+def render_arrow(screen, x, y, angle):
+    """Teken een pijl in de richting van beweging (opzoeken van de sprite + één blit)"""
+    sprite, half_width, half_height = get_arrow_sprites()[get_arrow_angle_step(angle)]
+    screen.blit(sprite, (int(x) - half_width, int(y) - half_height))
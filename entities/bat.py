@@ -1,16 +1,17 @@
 import pygame
-import random
 from constants import (
-    HUD_HEIGHT, WALL_THICKNESS,
+    HUD_HEIGHT, WALL_THICKNESS, BAT_WIDTH, BAT_HEIGHT,
     BAT_BODY_COLOR, BAT_WING_COLOR, BAT_EYE_COLOR
 )
+from managers.sprite_atlas import get_sprite_atlas
+from world.random_streams import ai_random
 
 class Bat:
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.width = 25
-        self.height = 20
+        self.width = BAT_WIDTH
+        self.height = BAT_HEIGHT
         self.rect = pygame.Rect(x, y, self.width, self.height)
 
         self.alive = True
@@ -18,15 +19,10 @@ class Bat:
 
         # Beweging - vleermuizen bewegen sneller en meer chaotisch
         self.speed = 2.0
-        self.direction_x = random.choice([-1, 1])
-        self.direction_y = random.choice([-1, 1])
+        self.direction_x = ai_random.choice([-1, 1])
+        self.direction_y = ai_random.choice([-1, 1])
         self.direction_change_timer = 0
-        self.direction_change_interval = random.randint(30, 60)  # Snellere richting veranderingen
-
-        # Kleuren (zwarte vleermuis)
-        self.body_color = BAT_BODY_COLOR
-        self.wing_color = BAT_WING_COLOR
-        self.eye_color = BAT_EYE_COLOR
+        self.direction_change_interval = ai_random.randint(30, 60)  # Snellere richting veranderingen
 
         # Animatie voor vleugels
         self.wing_flap_timer = 0
@@ -56,10 +52,10 @@ class Bat:
         self.direction_change_timer += 1
         if self.direction_change_timer >= self.direction_change_interval:
             # Verander richting random
-            self.direction_x = random.choice([-1, 0, 1])
-            self.direction_y = random.choice([-1, 0, 1])
+            self.direction_x = ai_random.choice([-1, 0, 1])
+            self.direction_y = ai_random.choice([-1, 0, 1])
             self.direction_change_timer = 0
-            self.direction_change_interval = random.randint(30, 60)
+            self.direction_change_interval = ai_random.randint(30, 60)
 
         # Beweeg in de huidige richting
         new_x = self.x + self.direction_x * self.speed
@@ -90,42 +86,49 @@ class Bat:
             self.wings_up = not self.wings_up
             self.wing_flap_timer = 0
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent"""
+        return pygame.Rect(int(self.x) - 2, int(self.y) - 2, self.width + 4, self.height + 4)
+
     def render(self, screen):
         """Teken de vleermuis"""
         if not self.alive:
             return
 
-        # Teken lichaam (ovaal)
-        body_rect = pygame.Rect(
-            int(self.x + self.width // 4),
-            int(self.y + self.height // 3),
-            self.width // 2,
-            self.height // 2
-        )
-        pygame.draw.ellipse(screen, self.body_color, body_rect)
-
-        # Teken vleugels (driehoeken aan beide kanten)
-        wing_offset = 3 if self.wings_up else 6
-
-        # Linker vleugel
-        left_wing_points = [
-            (int(self.x + self.width // 4), int(self.y + self.height // 2)),  # Bij lichaam
-            (int(self.x), int(self.y + wing_offset)),  # Punt
-            (int(self.x), int(self.y + self.height - wing_offset))  # Onderkant
-        ]
-        pygame.draw.polygon(screen, self.wing_color, left_wing_points)
-
-        # Rechter vleugel
-        right_wing_points = [
-            (int(self.x + 3 * self.width // 4), int(self.y + self.height // 2)),  # Bij lichaam
-            (int(self.x + self.width), int(self.y + wing_offset)),  # Punt
-            (int(self.x + self.width), int(self.y + self.height - wing_offset))  # Onderkant
-        ]
-        pygame.draw.polygon(screen, self.wing_color, right_wing_points)
-
-        # Teken oogjes (kleine rode puntjes)
-        eye_radius = 2
-        left_eye_pos = (int(self.x + self.width // 3), int(self.y + self.height // 2))
-        right_eye_pos = (int(self.x + 2 * self.width // 3), int(self.y + self.height // 2))
-        pygame.draw.circle(screen, self.eye_color, left_eye_pos, eye_radius)
-        pygame.draw.circle(screen, self.eye_color, right_eye_pos, eye_radius)
+        get_sprite_atlas().blit(screen, ('bat', self.wings_up), int(self.x), int(self.y))
+
+
+def draw_bat(screen, x, y, wings_up):
+    """Teken een vleermuis met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    width = BAT_WIDTH
+    height = BAT_HEIGHT
+
+    # Teken lichaam (ovaal)
+    body_rect = pygame.Rect(x + width // 4, y + height // 3, width // 2, height // 2)
+    pygame.draw.ellipse(screen, BAT_BODY_COLOR, body_rect)
+
+    # Teken vleugels (driehoeken aan beide kanten)
+    wing_offset = 3 if wings_up else 6
+
+    # Linker vleugel
+    left_wing_points = [
+        (x + width // 4, y + height // 2),  # Bij lichaam
+        (x, y + wing_offset),  # Punt
+        (x, y + height - wing_offset)  # Onderkant
+    ]
+    pygame.draw.polygon(screen, BAT_WING_COLOR, left_wing_points)
+
+    # Rechter vleugel
+    right_wing_points = [
+        (x + 3 * width // 4, y + height // 2),  # Bij lichaam
+        (x + width, y + wing_offset),  # Punt
+        (x + width, y + height - wing_offset)  # Onderkant
+    ]
+    pygame.draw.polygon(screen, BAT_WING_COLOR, right_wing_points)
+
+    # Teken oogjes (kleine rode puntjes)
+    eye_radius = 2
+    left_eye_pos = (x + width // 3, y + height // 2)
+    right_eye_pos = (x + 2 * width // 3, y + height // 2)
+    pygame.draw.circle(screen, BAT_EYE_COLOR, left_eye_pos, eye_radius)
+    pygame.draw.circle(screen, BAT_EYE_COLOR, right_eye_pos, eye_radius)
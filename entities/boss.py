@@ -1,12 +1,17 @@
 import pygame
 import random
+from constants import (
+    BOSS_WIDTH, BOSS_HEIGHT, BOSS_BODY_COLOR, BOSS_BELLY_COLOR, BOSS_EYE_COLOR, BOSS_HORN_COLOR,
+    FIREBALL_RADIUS, FIRE_COLOR_1, FIRE_COLOR_2, FIRE_COLOR_3, BOSS_FIREBALL_COOLDOWN
+)
+from managers.sprite_atlas import get_sprite_atlas
 
 class Boss:
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.width = 60
-        self.height = 70
+        self.width = BOSS_WIDTH
+        self.height = BOSS_HEIGHT
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.alive = True
         self.health = 5  # 5 hits nodig om te verslaan
@@ -19,20 +24,13 @@ class Boss:
 
         # Fireball attack
         self.fireball_cooldown = 0
-        self.fireball_cooldown_max = 180  # 3 seconden @ 60 FPS
-        self.fireballs = []
+        self.fireball_cooldown_max = BOSS_FIREBALL_COOLDOWN
 
         # Damage cooldown (om te voorkomen dat je hem te snel meerdere keren raakt)
         self.damage_cooldown = 0
         self.damage_cooldown_max = 30
         self.hit_flash_timer = 0  # Timer voor knippereffect
 
-        # Colors
-        self.body_color = (150, 50, 50)  # Donkerrood
-        self.belly_color = (200, 100, 100)  # Lichter rood
-        self.eye_color = (255, 255, 0)  # Geel
-        self.horn_color = (80, 30, 30)  # Donkerder rood
-
     def take_damage(self):
         """Neem schade van zwaard"""
         if self.damage_cooldown == 0:
@@ -45,8 +43,8 @@ class Boss:
             return True
         return False
 
-    def update(self, player, hud_height, screen_width, screen_height, boss_sound=None):
-        """Update boss movement en fireball attacks"""
+    def update(self, player, hud_height, screen_width, screen_height, boss_sound=None, projectiles=None):
+        """Update boss movement en fireball attacks (vuurballen bewegen in de ProjectilePool)"""
         if not self.alive:
             return
 
@@ -74,23 +72,14 @@ class Boss:
             self.fireball_cooldown -= 1
         else:
             # Shoot fireball naar player
-            self.shoot_fireball(player.x, player.y)
+            self.shoot_fireball(player.x, player.y, projectiles)
             self.fireball_cooldown = self.fireball_cooldown_max
 
             # Speel boss geluid af
             if boss_sound:
                 boss_sound.play()
 
-        # Update fireballs
-        for fireball in self.fireballs[:]:
-            fireball.update()
-
-            # Verwijder fireballs die buiten scherm zijn
-            if (fireball.x < 0 or fireball.x > screen_width or
-                fireball.y < hud_height or fireball.y > hud_height + screen_height):
-                self.fireballs.remove(fireball)
-
-    def shoot_fireball(self, target_x, target_y):
+    def shoot_fireball(self, target_x, target_y, projectiles):
         """Schiet een vuurbal richting de speler"""
         # Bereken richting naar speler
         center_x = self.x + self.width // 2
@@ -106,8 +95,11 @@ class Boss:
             dy /= distance
 
         # Maak nieuwe fireball
-        fireball = Fireball(center_x, center_y, dx, dy)
-        self.fireballs.append(fireball)
+        projectiles.spawn_fireball(center_x, center_y, dx, dy, owner=self)
+
+    def get_render_rect(self):
+        """Gebied waarin render() tekent (staart en hoorns steken uit, zonder vuurballen)"""
+        return self.rect.inflate(30, 30)
 
     def render(self, screen):
         """Teken de boss (draak)"""
@@ -118,95 +110,88 @@ class Boss:
         if self.hit_flash_timer > 0 and (self.hit_flash_timer // 3) % 2 == 0:
             return
 
-        # Draak lichaam (ovaal)
-        body_rect = pygame.Rect(self.x + 10, self.y + 20, self.width - 20, self.height - 30)
-        pygame.draw.ellipse(screen, self.body_color, body_rect)
-
-        # Buik (lichtere kleur)
-        belly_rect = pygame.Rect(self.x + 20, self.y + 30, self.width - 40, self.height - 45)
-        pygame.draw.ellipse(screen, self.belly_color, belly_rect)
-
-        # Hoofd (cirkel)
-        head_x = self.x + self.width // 2
-        head_y = self.y + 15
-        pygame.draw.circle(screen, self.body_color, (head_x, head_y), 18)
-
-        # Ogen (geel, dreigend)
-        left_eye_x = head_x - 8
-        right_eye_x = head_x + 8
-        eye_y = head_y - 3
-        pygame.draw.circle(screen, self.eye_color, (left_eye_x, eye_y), 4)
-        pygame.draw.circle(screen, self.eye_color, (right_eye_x, eye_y), 4)
-
-        # Pupillen (zwart)
-        pygame.draw.circle(screen, (0, 0, 0), (left_eye_x, eye_y), 2)
-        pygame.draw.circle(screen, (0, 0, 0), (right_eye_x, eye_y), 2)
-
-        # Hoorns
-        left_horn = [
-            (head_x - 15, head_y - 10),
-            (head_x - 12, head_y - 18),
-            (head_x - 10, head_y - 10)
-        ]
-        right_horn = [
-            (head_x + 15, head_y - 10),
-            (head_x + 12, head_y - 18),
-            (head_x + 10, head_y - 10)
-        ]
-        pygame.draw.polygon(screen, self.horn_color, left_horn)
-        pygame.draw.polygon(screen, self.horn_color, right_horn)
-
-        # Poten (4 korte rechthoeken)
-        leg_width = 8
-        leg_height = 15
-        # Linker voorpoot
-        pygame.draw.rect(screen, self.body_color, (self.x + 15, self.y + self.height - leg_height, leg_width, leg_height))
-        # Rechter voorpoot
-        pygame.draw.rect(screen, self.body_color, (self.x + self.width - 15 - leg_width, self.y + self.height - leg_height, leg_width, leg_height))
-        # Linker achterpoot
-        pygame.draw.rect(screen, self.body_color, (self.x + 15, self.y + self.height - leg_height - 5, leg_width, leg_height))
-        # Rechter achterpoot
-        pygame.draw.rect(screen, self.body_color, (self.x + self.width - 15 - leg_width, self.y + self.height - leg_height - 5, leg_width, leg_height))
-
-        # Staart (driehoek aan de achterkant)
-        tail_points = [
-            (self.x + 10, self.y + 30),
-            (self.x - 10, self.y + 35),
-            (self.x + 10, self.y + 40)
-        ]
-        pygame.draw.polygon(screen, self.body_color, tail_points)
-
-        # Render fireballs
-        for fireball in self.fireballs:
-            fireball.render(screen)
-
-
-class Fireball:
-    def __init__(self, x, y, dx, dy):
-        self.x = x
-        self.y = y
-        self.dx = dx * 3  # Snelheid
-        self.dy = dy * 3
-        self.radius = 8
-        self.rect = pygame.Rect(x - self.radius, y - self.radius, self.radius * 2, self.radius * 2)
-
-        # Colors voor vuurbal effect
-        self.colors = [
-            (255, 69, 0),   # Oranje-rood
-            (255, 140, 0),  # Donker oranje
-            (255, 215, 0)   # Goud
-        ]
-
-    def update(self):
-        """Update fireball positie"""
-        self.x += self.dx
-        self.y += self.dy
-        self.rect.x = self.x - self.radius
-        self.rect.y = self.y - self.radius
-
-    def render(self, screen):
-        """Teken de vuurbal met een vuur effect"""
-        # Teken meerdere cirkels voor een gloeiend effect
-        pygame.draw.circle(screen, self.colors[0], (int(self.x), int(self.y)), self.radius)
-        pygame.draw.circle(screen, self.colors[1], (int(self.x), int(self.y)), self.radius - 2)
-        pygame.draw.circle(screen, self.colors[2], (int(self.x), int(self.y)), self.radius - 4)
+        get_sprite_atlas().blit(screen, ('boss',), int(self.x), int(self.y))
+
+
+def draw_boss(screen, x, y):
+    """Teken de boss met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    width = BOSS_WIDTH
+    height = BOSS_HEIGHT
+
+    # Draak lichaam (ovaal)
+    body_rect = pygame.Rect(x + 10, y + 20, width - 20, height - 30)
+    pygame.draw.ellipse(screen, BOSS_BODY_COLOR, body_rect)
+
+    # Buik (lichtere kleur)
+    belly_rect = pygame.Rect(x + 20, y + 30, width - 40, height - 45)
+    pygame.draw.ellipse(screen, BOSS_BELLY_COLOR, belly_rect)
+
+    # Hoofd (cirkel)
+    head_x = x + width // 2
+    head_y = y + 15
+    pygame.draw.circle(screen, BOSS_BODY_COLOR, (head_x, head_y), 18)
+
+    # Ogen (geel, dreigend)
+    left_eye_x = head_x - 8
+    right_eye_x = head_x + 8
+    eye_y = head_y - 3
+    pygame.draw.circle(screen, BOSS_EYE_COLOR, (left_eye_x, eye_y), 4)
+    pygame.draw.circle(screen, BOSS_EYE_COLOR, (right_eye_x, eye_y), 4)
+
+    # Pupillen (zwart)
+    pygame.draw.circle(screen, (0, 0, 0), (left_eye_x, eye_y), 2)
+    pygame.draw.circle(screen, (0, 0, 0), (right_eye_x, eye_y), 2)
+
+    # Hoorns
+    left_horn = [
+        (head_x - 15, head_y - 10),
+        (head_x - 12, head_y - 18),
+        (head_x - 10, head_y - 10)
+    ]
+    right_horn = [
+        (head_x + 15, head_y - 10),
+        (head_x + 12, head_y - 18),
+        (head_x + 10, head_y - 10)
+    ]
+    pygame.draw.polygon(screen, BOSS_HORN_COLOR, left_horn)
+    pygame.draw.polygon(screen, BOSS_HORN_COLOR, right_horn)
+
+    # Poten (4 korte rechthoeken)
+    leg_width = 8
+    leg_height = 15
+    # Linker voorpoot
+    pygame.draw.rect(screen, BOSS_BODY_COLOR, (x + 15, y + height - leg_height, leg_width, leg_height))
+    # Rechter voorpoot
+    pygame.draw.rect(screen, BOSS_BODY_COLOR, (x + width - 15 - leg_width, y + height - leg_height, leg_width, leg_height))
+    # Linker achterpoot
+    pygame.draw.rect(screen, BOSS_BODY_COLOR, (x + 15, y + height - leg_height - 5, leg_width, leg_height))
+    # Rechter achterpoot
+    pygame.draw.rect(screen, BOSS_BODY_COLOR, (x + width - 15 - leg_width, y + height - leg_height - 5, leg_width, leg_height))
+
+    # Staart (driehoek aan de achterkant)
+    tail_points = [
+        (x + 10, y + 30),
+        (x - 10, y + 35),
+        (x + 10, y + 40)
+    ]
+    pygame.draw.polygon(screen, BOSS_BODY_COLOR, tail_points)
+
+
+def get_fireball_render_rect(x, y):
+    """Gebied waarin render_fireball() tekent"""
+    return pygame.Rect(int(x) - FIREBALL_RADIUS - 1, int(y) - FIREBALL_RADIUS - 1,
+                       FIREBALL_RADIUS * 2 + 2, FIREBALL_RADIUS * 2 + 2)
+
+
+def render_fireball(screen, x, y):
+    """Teken een vuurbal (vuurballen leven in de ProjectilePool)"""
+    get_sprite_atlas().blit(screen, ('fireball',), int(x) - FIREBALL_RADIUS, int(y) - FIREBALL_RADIUS)
+
+
+def draw_fireball(screen, x, y):
+    """Teken een vuurbal met een vuur effect, linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    # Teken meerdere cirkels voor een gloeiend effect
+    center = (x + FIREBALL_RADIUS, y + FIREBALL_RADIUS)
+    pygame.draw.circle(screen, FIRE_COLOR_1, center, FIREBALL_RADIUS)
+    pygame.draw.circle(screen, FIRE_COLOR_2, center, FIREBALL_RADIUS - 2)
+    pygame.draw.circle(screen, FIRE_COLOR_3, center, FIREBALL_RADIUS - 4)
@@ -1,10 +1,11 @@
 import pygame
-import random
 from constants import (
     MONSTER_WIDTH, MONSTER_HEIGHT, MONSTER_SPEED, MONSTER_HEALTH,
     MONSTER_DAMAGE_COOLDOWN, WALL_THICKNESS, HUD_HEIGHT,
     MONSTER_BODY_COLOR, MONSTER_EYE_COLOR, MONSTER_PUPIL_COLOR
 )
+from managers.sprite_atlas import get_sprite_atlas
+from world.random_streams import ai_random
 
 class Monster:
     def __init__(self, x, y):
@@ -16,9 +17,9 @@ class Monster:
         self.rect = pygame.Rect(x, y, self.width, self.height)
 
         # Random bewegingsrichting
-        self.direction = random.choice(['left', 'right', 'up', 'down'])
+        self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
         self.direction_timer = 0
-        self.direction_change_interval = random.randint(60, 180)  # frames
+        self.direction_change_interval = ai_random.randint(60, 180)  # frames
 
         # Health
         self.health = MONSTER_HEALTH
@@ -35,9 +36,9 @@ class Monster:
         # Verander af en toe van richting
         self.direction_timer += 1
         if self.direction_timer >= self.direction_change_interval:
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
-            self.direction_change_interval = random.randint(60, 180)
+            self.direction_change_interval = ai_random.randint(60, 180)
 
         # Sla oude positie op
         old_x = self.x
@@ -61,13 +62,13 @@ class Monster:
         # Horizontale muren (links/rechts)
         if self.x < WALL_THICKNESS or self.x + self.width > screen_width - WALL_THICKNESS:
             self.x = old_x
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
 
         # Verticale muren (boven/onder) - rekening houdend met HUD
         if self.y < hud_height + WALL_THICKNESS or self.y + self.height > screen_height - WALL_THICKNESS:
             self.y = old_y
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
 
         # Check obstakel collisions
@@ -75,7 +76,7 @@ class Monster:
             if self.rect.colliderect(obstacle.rect):
                 self.x = old_x
                 self.y = old_y
-                self.direction = random.choice(['left', 'right', 'up', 'down'])
+                self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
                 self.direction_timer = 0
                 break
 
@@ -83,7 +84,7 @@ class Monster:
         if pushable_block and self.rect.colliderect(pushable_block.rect):
             self.x = old_x
             self.y = old_y
-            self.direction = random.choice(['left', 'right', 'up', 'down'])
+            self.direction = ai_random.choice(['left', 'right', 'up', 'down'])
             self.direction_timer = 0
 
         # Update rect met nieuwe positie
@@ -105,19 +106,28 @@ class Monster:
         self.can_damage = False
         self.damage_cooldown = MONSTER_DAMAGE_COOLDOWN
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent"""
+        return self.rect.inflate(4, 4)
+
     def render(self, screen):
         if not self.alive:
             return
 
-        # Eenvoudig monster: rood vierkant met ogen
-        # Lichaam
-        pygame.draw.rect(screen, MONSTER_BODY_COLOR, self.rect)
-
-        # Ogen
-        eye_y = self.y + 10
-        # Links oog
-        pygame.draw.circle(screen, MONSTER_EYE_COLOR, (int(self.x + 10), int(eye_y)), 4)
-        pygame.draw.circle(screen, MONSTER_PUPIL_COLOR, (int(self.x + 10), int(eye_y)), 2)
-        # Rechts oog
-        pygame.draw.circle(screen, MONSTER_EYE_COLOR, (int(self.x + 20), int(eye_y)), 4)
-        pygame.draw.circle(screen, MONSTER_PUPIL_COLOR, (int(self.x + 20), int(eye_y)), 2)
+        get_sprite_atlas().blit(screen, ('monster',), self.rect.x, self.rect.y)
+
+
+def draw_monster(screen, x, y):
+    """Teken een monster met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    # Eenvoudig monster: rood vierkant met ogen
+    # Lichaam
+    pygame.draw.rect(screen, MONSTER_BODY_COLOR, (x, y, MONSTER_WIDTH, MONSTER_HEIGHT))
+
+    # Ogen
+    eye_y = y + 10
+    # Links oog
+    pygame.draw.circle(screen, MONSTER_EYE_COLOR, (x + 10, eye_y), 4)
+    pygame.draw.circle(screen, MONSTER_PUPIL_COLOR, (x + 10, eye_y), 2)
+    # Rechts oog
+    pygame.draw.circle(screen, MONSTER_EYE_COLOR, (x + 20, eye_y), 4)
+    pygame.draw.circle(screen, MONSTER_PUPIL_COLOR, (x + 20, eye_y), 2)
@@ -3,6 +3,7 @@ from constants import (
     OLD_MAN_ROBE_COLOR, OLD_MAN_SKIN_COLOR,
     OLD_MAN_BEARD_COLOR, OLD_MAN_TEXT_COLOR
 )
+from managers.text_cache import get_text_cache
 
 class OldMan:
     def __init__(self, x, y):
@@ -38,12 +39,12 @@ class OldMan:
 
         # Teken tekst boven zijn hoofd
         try:
-            font = pygame.font.Font(None, 20)
-            text_surface = font.render(self.text, True, OLD_MAN_TEXT_COLOR)
+            text_cache = get_text_cache()
+            text_surface = text_cache.render(self.text, 20, OLD_MAN_TEXT_COLOR)
             text_rect = text_surface.get_rect(center=(self.x + 20, self.y - 30))
             screen.blit(text_surface, text_rect)
 
-            text_surface2 = font.render(self.text2, True, OLD_MAN_TEXT_COLOR)
+            text_surface2 = text_cache.render(self.text2, 20, OLD_MAN_TEXT_COLOR)
             text_rect2 = text_surface2.get_rect(center=(self.x + 20, self.y - 15))
             screen.blit(text_surface2, text_rect2)
         except:
@@ -6,6 +6,7 @@ from constants import (
     TUNIC_COLOR, SKIN_COLOR, HAIR_COLOR, BELT_COLOR,
     SWORD_BLADE_COLOR, SWORD_HANDLE_COLOR, SHIELD_COLOR, SHIELD_EDGE_COLOR
 )
+from managers.sprite_atlas import get_sprite_atlas
 
 class Player:
     def __init__(self, x, y):
@@ -124,126 +125,146 @@ class Player:
 
         return False
 
-    def get_attack_rect(self):
-        # Geef hitbox terug gebaseerd op facing richting
-        if self.facing == 'left':
+    def get_attack_rect(self, facing=None):
+        # Geef hitbox terug gebaseerd op facing richting (of een andere richting, voor de bot)
+        if facing is None:
+            facing = self.facing
+        if facing == 'left':
             return pygame.Rect(self.x - SWORD_LENGTH, self.y, SWORD_LENGTH, SWORD_WIDTH)
-        elif self.facing == 'right':
+        elif facing == 'right':
             return pygame.Rect(self.x + self.width, self.y, SWORD_LENGTH, SWORD_WIDTH)
-        elif self.facing == 'up':
+        elif facing == 'up':
             return pygame.Rect(self.x, self.y - SWORD_LENGTH, SWORD_WIDTH, SWORD_LENGTH)
         else:  # down
             return pygame.Rect(self.x, self.y + self.height, SWORD_WIDTH, SWORD_LENGTH)
     
     def get_attack_rect_for_render(self):
-        if self.facing == 'left':
-            return pygame.Rect(self.x - SWORD_LENGTH, self.y + HALF_PLAYER_WIDTH_MINUS_SWORD, SWORD_LENGTH, SWORD_WIDTH_RENDER)
-        elif self.facing == 'right':
-            return pygame.Rect(self.x + self.width, self.y + HALF_PLAYER_WIDTH_MINUS_SWORD, SWORD_LENGTH, SWORD_WIDTH_RENDER)
-        elif self.facing == 'up':
-            return pygame.Rect(self.x + HALF_PLAYER_WIDTH_MINUS_SWORD, self.y - SWORD_LENGTH, SWORD_WIDTH_RENDER, SWORD_LENGTH)
-        else:  # down
-            return pygame.Rect(self.x + HALF_PLAYER_WIDTH_MINUS_SWORD, self.y + self.height, SWORD_WIDTH_RENDER, SWORD_LENGTH)
+        return get_sword_render_rect(self.x, self.y, self.facing)
+
+    def get_render_rect(self):
+        """Gebied waarin render() tekent (inclusief zwaard tijdens aanval)"""
+        render_rect = self.rect.inflate(4, 4)
+        if self.attacking:
+            render_rect.union_ip(self.get_attack_rect_for_render())
+        return render_rect
 
     def render(self, screen):
         # Skip rendering elke paar frames als invincible (knipperen)
         if self.invincible and (self.invincible_timer // 5) % 2 == 0:
             return
 
-        cx = self.x + self.width // 2
-
-        if self.facing == 'down':
-            # Lichaam (tuniek) - eerst tekenen
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 8, self.y + 16, 24, 18))
-            # Hoofd
-            pygame.draw.circle(screen, SKIN_COLOR, (cx, self.y + 10), 8)
-            # Haar/pet
-            pygame.draw.circle(screen, HAIR_COLOR, (cx, self.y + 8), 9)
-            # Benen
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 10, self.y + 30, 8, 10))
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 22, self.y + 30, 8, 10))
-            # Riem
-            pygame.draw.rect(screen, BELT_COLOR, (self.x + 8, self.y + 23, 24, 3))
-
-            # Schild (over alles heen, aan de voorkant, als speler het heeft)
-            if self.has_shield:
-                shield_x = self.x + 4
-                shield_y = self.y + 16
-                shield_width = 14
-                shield_height = 20
-                # Schild vorm
-                pygame.draw.rect(screen, SHIELD_COLOR, (shield_x, shield_y, shield_width, shield_height))
-                # Donkere rand
-                pygame.draw.rect(screen, SHIELD_EDGE_COLOR, (shield_x, shield_y, shield_width, shield_height), 2)
-                # Decoratief kruisje
-                center_x_shield = shield_x + shield_width // 2
-                center_y_shield = shield_y + shield_height // 2
-                # Verticale lijn
-                pygame.draw.line(screen, SHIELD_EDGE_COLOR,
-                                (center_x_shield, shield_y + 4),
-                                (center_x_shield, shield_y + shield_height - 4), 2)
-                # Horizontale lijn
-                pygame.draw.line(screen, SHIELD_EDGE_COLOR,
-                                (shield_x + 3, center_y_shield),
-                                (shield_x + shield_width - 3, center_y_shield), 2)
-
-        elif self.facing == 'up':
-            # Lichaam (tuniek)
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 8, self.y + 12, 24, 18))
-            # Hoofd (achterkant)
-            pygame.draw.circle(screen, HAIR_COLOR, (cx, self.y + 8), 9)
-            # Benen
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 10, self.y + 26, 8, 10))
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 22, self.y + 26, 8, 10))
-            # Riem
-            pygame.draw.rect(screen, BELT_COLOR, (self.x + 8, self.y + 19, 24, 3))
-            # Geen schild rendering bij 'up' - schild is niet zichtbaar op de rug
-
-        elif self.facing == 'left':
-            # Lichaam (tuniek)
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 10, self.y + 16, 20, 18))
-            # Hoofd
-            pygame.draw.circle(screen, SKIN_COLOR, (self.x + 14, self.y + 10), 8)
-            # Haar/pet
-            pygame.draw.circle(screen, HAIR_COLOR, (self.x + 14, self.y + 8), 9)
-            # Benen
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 14, self.y + 30, 10, 10))
-            # Riem
-            pygame.draw.rect(screen, BELT_COLOR, (self.x + 10, self.y + 23, 20, 3))
-            # Schild (dunne streep aan de voorkant/zijkant)
-            if self.has_shield:
-                pygame.draw.line(screen, SHIELD_COLOR, (self.x + 8, self.y + 18), (self.x + 8, self.y + 32), 3)
-
-        elif self.facing == 'right':
-            # Lichaam (tuniek)
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 10, self.y + 16, 20, 18))
-            # Hoofd
-            pygame.draw.circle(screen, SKIN_COLOR, (self.x + 26, self.y + 10), 8)
-            # Haar/pet
-            pygame.draw.circle(screen, HAIR_COLOR, (self.x + 26, self.y + 8), 9)
-            # Benen
-            pygame.draw.rect(screen, TUNIC_COLOR, (self.x + 16, self.y + 30, 10, 10))
-            # Riem
-            pygame.draw.rect(screen, BELT_COLOR, (self.x + 10, self.y + 23, 20, 3))
-            # Schild (dunne streep aan de voorkant/zijkant)
-            if self.has_shield:
-                pygame.draw.line(screen, SHIELD_COLOR, (self.x + 32, self.y + 18), (self.x + 32, self.y + 32), 3)
-
-        # Teken zwaard tijdens aanval
-        if self.attacking:
-            attack_rect = self.get_attack_rect_for_render()
-
-            if self.facing in ['left', 'right']:
-                # Horizontaal zwaard
-                pygame.draw.rect(screen, SWORD_BLADE_COLOR, attack_rect)
-                if self.facing == 'left':
-                    pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.right - 8, attack_rect.y, 8, attack_rect.height))
-                else:
-                    pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.x, attack_rect.y, 8, attack_rect.height))
+        get_sprite_atlas().blit(screen, ('player', self.facing, self.has_shield, self.attacking),
+                                int(self.x), int(self.y))
+
+
+def get_sword_render_rect(x, y, facing):
+    """Gebied van het getekende zwaard voor een speler op (x, y)"""
+    if facing == 'left':
+        return pygame.Rect(x - SWORD_LENGTH, y + HALF_PLAYER_WIDTH_MINUS_SWORD, SWORD_LENGTH, SWORD_WIDTH_RENDER)
+    elif facing == 'right':
+        return pygame.Rect(x + PLAYER_WIDTH, y + HALF_PLAYER_WIDTH_MINUS_SWORD, SWORD_LENGTH, SWORD_WIDTH_RENDER)
+    elif facing == 'up':
+        return pygame.Rect(x + HALF_PLAYER_WIDTH_MINUS_SWORD, y - SWORD_LENGTH, SWORD_WIDTH_RENDER, SWORD_LENGTH)
+    else:  # down
+        return pygame.Rect(x + HALF_PLAYER_WIDTH_MINUS_SWORD, y + PLAYER_HEIGHT, SWORD_WIDTH_RENDER, SWORD_LENGTH)
+
+
+def draw_player(screen, x, y, facing, has_shield, attacking):
+    """Teken de speler met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    cx = x + PLAYER_WIDTH // 2
+
+    if facing == 'down':
+        # Lichaam (tuniek) - eerst tekenen
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 8, y + 16, 24, 18))
+        # Hoofd
+        pygame.draw.circle(screen, SKIN_COLOR, (cx, y + 10), 8)
+        # Haar/pet
+        pygame.draw.circle(screen, HAIR_COLOR, (cx, y + 8), 9)
+        # Benen
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 10, y + 30, 8, 10))
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 22, y + 30, 8, 10))
+        # Riem
+        pygame.draw.rect(screen, BELT_COLOR, (x + 8, y + 23, 24, 3))
+
+        # Schild (over alles heen, aan de voorkant, als speler het heeft)
+        if has_shield:
+            shield_x = x + 4
+            shield_y = y + 16
+            shield_width = 14
+            shield_height = 20
+            # Schild vorm
+            pygame.draw.rect(screen, SHIELD_COLOR, (shield_x, shield_y, shield_width, shield_height))
+            # Donkere rand
+            pygame.draw.rect(screen, SHIELD_EDGE_COLOR, (shield_x, shield_y, shield_width, shield_height), 2)
+            # Decoratief kruisje
+            center_x_shield = shield_x + shield_width // 2
+            center_y_shield = shield_y + shield_height // 2
+            # Verticale lijn
+            pygame.draw.line(screen, SHIELD_EDGE_COLOR,
+                            (center_x_shield, shield_y + 4),
+                            (center_x_shield, shield_y + shield_height - 4), 2)
+            # Horizontale lijn
+            pygame.draw.line(screen, SHIELD_EDGE_COLOR,
+                            (shield_x + 3, center_y_shield),
+                            (shield_x + shield_width - 3, center_y_shield), 2)
+
+    elif facing == 'up':
+        # Lichaam (tuniek)
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 8, y + 12, 24, 18))
+        # Hoofd (achterkant)
+        pygame.draw.circle(screen, HAIR_COLOR, (cx, y + 8), 9)
+        # Benen
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 10, y + 26, 8, 10))
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 22, y + 26, 8, 10))
+        # Riem
+        pygame.draw.rect(screen, BELT_COLOR, (x + 8, y + 19, 24, 3))
+        # Geen schild rendering bij 'up' - schild is niet zichtbaar op de rug
+
+    elif facing == 'left':
+        # Lichaam (tuniek)
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 10, y + 16, 20, 18))
+        # Hoofd
+        pygame.draw.circle(screen, SKIN_COLOR, (x + 14, y + 10), 8)
+        # Haar/pet
+        pygame.draw.circle(screen, HAIR_COLOR, (x + 14, y + 8), 9)
+        # Benen
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 14, y + 30, 10, 10))
+        # Riem
+        pygame.draw.rect(screen, BELT_COLOR, (x + 10, y + 23, 20, 3))
+        # Schild (dunne streep aan de voorkant/zijkant)
+        if has_shield:
+            pygame.draw.line(screen, SHIELD_COLOR, (x + 8, y + 18), (x + 8, y + 32), 3)
+
+    elif facing == 'right':
+        # Lichaam (tuniek)
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 10, y + 16, 20, 18))
+        # Hoofd
+        pygame.draw.circle(screen, SKIN_COLOR, (x + 26, y + 10), 8)
+        # Haar/pet
+        pygame.draw.circle(screen, HAIR_COLOR, (x + 26, y + 8), 9)
+        # Benen
+        pygame.draw.rect(screen, TUNIC_COLOR, (x + 16, y + 30, 10, 10))
+        # Riem
+        pygame.draw.rect(screen, BELT_COLOR, (x + 10, y + 23, 20, 3))
+        # Schild (dunne streep aan de voorkant/zijkant)
+        if has_shield:
+            pygame.draw.line(screen, SHIELD_COLOR, (x + 32, y + 18), (x + 32, y + 32), 3)
+
+    # Teken zwaard tijdens aanval
+    if attacking:
+        attack_rect = get_sword_render_rect(x, y, facing)
+
+        if facing in ['left', 'right']:
+            # Horizontaal zwaard
+            pygame.draw.rect(screen, SWORD_BLADE_COLOR, attack_rect)
+            if facing == 'left':
+                pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.right - 8, attack_rect.y, 8, attack_rect.height))
+            else:
+                pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.x, attack_rect.y, 8, attack_rect.height))
+        else:
+            # Verticaal zwaard
+            pygame.draw.rect(screen, SWORD_BLADE_COLOR, attack_rect)
+            if facing == 'up':
+                pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.x, attack_rect.bottom - 8, attack_rect.width, 8))
             else:
-                # Verticaal zwaard
-                pygame.draw.rect(screen, SWORD_BLADE_COLOR, attack_rect)
-                if self.facing == 'up':
-                    pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.x, attack_rect.bottom - 8, attack_rect.width, 8))
-                else:
-                    pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.x, attack_rect.y, attack_rect.width, 8))
\ No newline at end of file
+                pygame.draw.rect(screen, SWORD_HANDLE_COLOR, (attack_rect.x, attack_rect.y, attack_rect.width, 8))
@@ -1,9 +1,11 @@
 import pygame
-import random
 from constants import (
     HUD_HEIGHT, WALL_THICKNESS,
+    SLIME_LARGE_WIDTH, SLIME_LARGE_HEIGHT, SLIME_SMALL_WIDTH, SLIME_SMALL_HEIGHT,
     SLIME_LARGE_COLOR, SLIME_SMALL_COLOR, SLIME_HIGHLIGHT_COLOR
 )
+from managers.sprite_atlas import get_sprite_atlas
+from world.random_streams import ai_random
 
 class Slime:
     def __init__(self, x, y, is_large=True):
@@ -13,13 +15,13 @@ class Slime:
 
         # Grootte afhankelijk van type
         if is_large:
-            self.width = 40
-            self.height = 35
+            self.width = SLIME_LARGE_WIDTH
+            self.height = SLIME_LARGE_HEIGHT
             self.health = 1  # 1 slag splits hem
             self.color = SLIME_LARGE_COLOR
         else:
-            self.width = 20
-            self.height = 18
+            self.width = SLIME_SMALL_WIDTH
+            self.height = SLIME_SMALL_HEIGHT
             self.health = 1  # 1 slag doodt kleine slime
             self.color = SLIME_SMALL_COLOR
 
@@ -28,10 +30,10 @@ class Slime:
 
         # Beweging - slimes bewegen langzaam
         self.speed = 0.8 if is_large else 1.2  # Kleine slimes iets sneller
-        self.direction_x = random.choice([-1, 1])
-        self.direction_y = random.choice([-1, 1])
+        self.direction_x = ai_random.choice([-1, 1])
+        self.direction_y = ai_random.choice([-1, 1])
         self.direction_change_timer = 0
-        self.direction_change_interval = random.randint(60, 120)  # Langzame richting veranderingen
+        self.direction_change_interval = ai_random.randint(60, 120)  # Langzame richting veranderingen
 
         # Animatie - slimes "wiebelen"
         self.wobble_timer = 0
@@ -71,10 +73,10 @@ class Slime:
         self.direction_change_timer += 1
         if self.direction_change_timer >= self.direction_change_interval:
             # Verander richting random
-            self.direction_x = random.choice([-1, 0, 1])
-            self.direction_y = random.choice([-1, 0, 1])
+            self.direction_x = ai_random.choice([-1, 0, 1])
+            self.direction_y = ai_random.choice([-1, 0, 1])
             self.direction_change_timer = 0
-            self.direction_change_interval = random.randint(60, 120)
+            self.direction_change_interval = ai_random.randint(60, 120)
 
         # Beweeg in de huidige richting
         new_x = self.x + self.direction_x * self.speed
@@ -101,35 +103,39 @@ class Slime:
         # Update wobble animatie
         self.wobble_timer += 1
         if self.wobble_timer % 20 == 0:
-            self.wobble_offset = random.randint(-2, 2)
+            self.wobble_offset = ai_random.randint(-2, 2)
+
+    def get_render_rect(self):
+        """Gebied waarin render() tekent (inclusief wiebelen en druppeltop)"""
+        return pygame.Rect(int(self.x) - 2, int(self.y) - self.width // 3 - 4,
+                           self.width + 4, self.height + self.width // 3 + 8)
 
     def render(self, screen):
         """Teken de slime als een druppelvorm"""
         if not self.alive:
             return
 
-        # Teken hoofdlichaam (grote ellips/druppelvorm)
-        body_rect = pygame.Rect(
-            int(self.x),
-            int(self.y + self.wobble_offset),
-            self.width,
-            int(self.height * 0.8)
-        )
-        pygame.draw.ellipse(screen, self.color, body_rect)
-
-        # Teken bovenkant (kleinere cirkel voor druppelvorm)
-        top_radius = self.width // 3
-        top_center = (
-            int(self.x + self.width // 2),
-            int(self.y + top_radius // 2 + self.wobble_offset)
-        )
-        pygame.draw.circle(screen, self.color, top_center, top_radius)
-
-        # Teken highlight (voor 3D effect)
-        highlight_offset = 5
-        highlight_radius = max(3, self.width // 6)
-        highlight_center = (
-            int(self.x + self.width // 3 + highlight_offset),
-            int(self.y + self.height // 4 + self.wobble_offset)
-        )
-        pygame.draw.circle(screen, SLIME_HIGHLIGHT_COLOR, highlight_center, highlight_radius)
+        get_sprite_atlas().blit(screen, ('slime', self.is_large, self.wobble_offset), int(self.x), int(self.y))
+
+
+def draw_slime(screen, x, y, is_large, wobble_offset):
+    """Teken een slime met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    if is_large:
+        width, height, color = SLIME_LARGE_WIDTH, SLIME_LARGE_HEIGHT, SLIME_LARGE_COLOR
+    else:
+        width, height, color = SLIME_SMALL_WIDTH, SLIME_SMALL_HEIGHT, SLIME_SMALL_COLOR
+
+    # Teken hoofdlichaam (grote ellips/druppelvorm)
+    body_rect = pygame.Rect(x, y + wobble_offset, width, int(height * 0.8))
+    pygame.draw.ellipse(screen, color, body_rect)
+
+    # Teken bovenkant (kleinere cirkel voor druppelvorm)
+    top_radius = width // 3
+    top_center = (x + width // 2, y + top_radius // 2 + wobble_offset)
+    pygame.draw.circle(screen, color, top_center, top_radius)
+
+    # Teken highlight (voor 3D effect)
+    highlight_offset = 5
+    highlight_radius = max(3, width // 6)
+    highlight_center = (x + width // 3 + highlight_offset, y + height // 4 + wobble_offset)
+    pygame.draw.circle(screen, SLIME_HIGHLIGHT_COLOR, highlight_center, highlight_radius)
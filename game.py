@@ -1,6 +1,7 @@
 import pygame
 import sys
-import random
+import time
+import argparse
 from entities.player import Player
 from rooms.room import RoomManager
 from managers.collision_manager import CollisionManager
@@ -14,20 +15,52 @@ from managers.combat_manager import CombatManager
 from managers.transition_manager import TransitionManager
 from managers.audio_manager import AudioManager
 from managers.dungeon_interaction_manager import DungeonInteractionManager
+from managers.input_manager import KeyboardInput, ScriptedInput
+from managers.render_manager import DirtyRectRenderer
+from managers.save_manager import SaveManager
+from managers.input_recorder import InputRecorder, ReplayInput, Recording
+from managers.profiler import Profiler
+from managers.telemetry import Telemetry
+from managers.allocation_tracker import AllocationTracker
+from managers.explorer_bot import ExplorerBot
+from managers.sprite_atlas import get_sprite_atlas
+from managers.text_cache import get_text_cache
+from world.random_streams import generation_random, seed_streams, new_world_seed
 from constants import (
     GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT,
-    FPS, WALL_THICKNESS, EXIT_SIZE
+    FPS, WALL_THICKNESS, EXIT_SIZE, CAVE_EXIT_SIZE, WORLD_WIDTH, WORLD_HEIGHT, BOT_FRAMES
 )
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, headless=False, input_source=None, dirty_rects=False, sprite_cache=None, seed=None):
+        # Headless: geen venster, geen mixer en geen FPS limiet (voor soak/balance tests)
+        self.headless = headless
+
+        # World seed: dezelfde seed (en input) geeft dezelfde wereld en simulatie
+        self.seed = new_world_seed() if seed is None else seed
+        seed_streams(self.seed)
+
+        if headless:
+            # Offscreen surface zodat renderers nog steeds een doel hebben
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.clock = None
+        else:
+            pygame.init()
+
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("The Legend of Smellda")
+            self.clock = pygame.time.Clock()
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("The Legend of Smellda")
-        self.clock = pygame.time.Clock()
+            # Bak alle entity sprites vooraf (optioneel uit een cache map op disk);
+            # headless wordt er niet gerenderd en bakt de atlas pas bij het eerste gebruik
+            get_sprite_atlas().bake(sprite_cache)
         self.running = True
 
+        # Input komt van het toetsenbord of (headless) van een script
+        if input_source is None:
+            input_source = ScriptedInput() if headless else KeyboardInput()
+        self.input_source = input_source
+
         # Initialiseer player
         self.player = Player(GAME_WIDTH // 2, GAME_HEIGHT // 2 + HUD_HEIGHT)
 
@@ -47,7 +80,7 @@ class Game:
         self.cave_entrances[(0, 2)] = (shop_entrance, shop_exit_pos)
 
         # Maak room manager (nu met cave entrance informatie)
-        self.room_manager = RoomManager(GAME_WIDTH, GAME_HEIGHT, 3, 3, self.cave_entrances)
+        self.room_manager = RoomManager(GAME_WIDTH, GAME_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, self.cave_entrances)
         self.collision_manager = CollisionManager()
 
         # Cave system
@@ -65,14 +98,24 @@ class Game:
         self.game_won = False
 
         # Initialiseer managers
-        self.audio_manager = AudioManager()
+        self.audio_manager = AudioManager(enabled=not headless)
         self.hud_renderer = HUDRenderer(self.screen)
+        # Dirty-rect rendering (alleen met een echt display)
+        self.dirty_rect_renderer = DirtyRectRenderer(self.screen) if dirty_rects and not headless else None
         self.combat_manager = CombatManager(self.collision_manager, self.audio_manager.hurt_sound, self.audio_manager.shield_sound)
         self.transition_manager = TransitionManager(self.collision_manager)
         self.dungeon_interaction_manager = DungeonInteractionManager(
             self.audio_manager.get_item_sound,
             self.audio_manager.get_heart_sound
         )
+        self.save_manager = SaveManager()
+
+        # Tijd per subsysteem (F3 toont de overlay, uit kost het vrijwel niets)
+        self.profiler = Profiler()
+        self.profiler.register(self.combat_manager, 'combat')
+        self.profiler.register(self.dungeon_interaction_manager, 'dungeon')
+        self.telemetry = None  # Per-frame records naar een bestand (opt-in)
+        self.allocation_tracker = None  # Diagnose mode: allocaties en GC pauzes per scope
 
         # Zorg dat speler niet op een obstakel spawnt
         self.fix_player_spawn()
@@ -80,7 +123,7 @@ class Game:
     def create_cave_entrance(self):
         """Maak een cave entrance langs een random rand van de starting room"""
         # Kies een random kant: 0=noord, 1=oost, 2=zuid, 3=west
-        side = random.randint(0, 3)
+        side = generation_random.randint(0, 3)
 
         entrance_width = EXIT_SIZE // 2
         entrance_height = WALL_THICKNESS
@@ -95,12 +138,12 @@ class Game:
             exit_zone_end = center_x + EXIT_SIZE // 2 + 100
 
             # Kies random positie links of rechts van de exit zone
-            if random.choice([True, False]):
+            if generation_random.choice([True, False]):
                 # Links van exit zone
-                x = random.randint(WALL_THICKNESS, exit_zone_start - entrance_width)
+                x = generation_random.randint(WALL_THICKNESS, exit_zone_start - entrance_width)
             else:
                 # Rechts van exit zone
-                x = random.randint(exit_zone_end, GAME_WIDTH - WALL_THICKNESS - entrance_width)
+                x = generation_random.randint(exit_zone_end, GAME_WIDTH - WALL_THICKNESS - entrance_width)
 
             y = HUD_HEIGHT
             cave_exit_pos = (x + entrance_width // 2, y + entrance_height + 80)
@@ -111,12 +154,12 @@ class Game:
             exit_zone_end = center_y + EXIT_SIZE // 2 + 100
 
             # Kies random positie boven of onder de exit zone
-            if random.choice([True, False]):
+            if generation_random.choice([True, False]):
                 # Boven exit zone
-                y = random.randint(HUD_HEIGHT + WALL_THICKNESS, exit_zone_start - entrance_width)
+                y = generation_random.randint(HUD_HEIGHT + WALL_THICKNESS, exit_zone_start - entrance_width)
             else:
                 # Onder exit zone
-                y = random.randint(exit_zone_end, HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS - entrance_width)
+                y = generation_random.randint(exit_zone_end, HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS - entrance_width)
 
             x = GAME_WIDTH - WALL_THICKNESS
             entrance_width, entrance_height = entrance_height, entrance_width  # Wissel voor verticaal
@@ -128,12 +171,12 @@ class Game:
             exit_zone_end = center_x + EXIT_SIZE // 2 + 100
 
             # Kies random positie links of rechts van de exit zone
-            if random.choice([True, False]):
+            if generation_random.choice([True, False]):
                 # Links van exit zone
-                x = random.randint(WALL_THICKNESS, exit_zone_start - entrance_width)
+                x = generation_random.randint(WALL_THICKNESS, exit_zone_start - entrance_width)
             else:
                 # Rechts van exit zone
-                x = random.randint(exit_zone_end, GAME_WIDTH - WALL_THICKNESS - entrance_width)
+                x = generation_random.randint(exit_zone_end, GAME_WIDTH - WALL_THICKNESS - entrance_width)
 
             y = HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS
             cave_exit_pos = (x + entrance_width // 2, y - 50)
@@ -144,12 +187,12 @@ class Game:
             exit_zone_end = center_y + EXIT_SIZE // 2 + 100
 
             # Kies random positie boven of onder de exit zone
-            if random.choice([True, False]):
+            if generation_random.choice([True, False]):
                 # Boven exit zone
-                y = random.randint(HUD_HEIGHT + WALL_THICKNESS, exit_zone_start - entrance_width)
+                y = generation_random.randint(HUD_HEIGHT + WALL_THICKNESS, exit_zone_start - entrance_width)
             else:
                 # Onder exit zone
-                y = random.randint(exit_zone_end, HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS - entrance_width)
+                y = generation_random.randint(exit_zone_end, HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS - entrance_width)
 
             x = 0
             entrance_width, entrance_height = entrance_height, entrance_width  # Wissel voor verticaal
@@ -162,60 +205,121 @@ class Game:
         current_room = self.room_manager.get_current_room()
 
         # Check of speler op een obstakel staat
-        for obstacle in current_room.obstacles:
-            if self.player.rect.colliderect(obstacle.rect):
-                # Zoek een veilige spawn positie
-                safe_spawn_found = False
-
-                # Probeer posities rondom het midden
-                for offset_x in range(-100, 101, 50):
-                    for offset_y in range(-100, 101, 50):
-                        test_x = GAME_WIDTH // 2 + offset_x
-                        test_y = GAME_HEIGHT // 2 + HUD_HEIGHT + offset_y
-
-                        # Check of positie binnen bounds is
-                        if not self.collision_manager.is_within_bounds(
-                            test_x, test_y, self.player.width, self.player.height):
-                            continue
-
-                        # Check overlap met obstakels
-                        test_rect = pygame.Rect(test_x, test_y, self.player.width, self.player.height)
-                        overlap = False
-                        for obs in current_room.obstacles:
-                            if test_rect.colliderect(obs.rect):
-                                overlap = True
-                                break
-
-                        if not overlap:
-                            # Veilige positie gevonden
-                            self.player.x = test_x
-                            self.player.y = test_y
-                            self.player.rect.x = test_x
-                            self.player.rect.y = test_y
-                            safe_spawn_found = True
-                            break
-
-                    if safe_spawn_found:
-                        break
+        if not current_room.rect_hits_obstacle(self.player.rect):
+            return
 
-                return
+        # Zoek een veilige spawn positie rondom het midden
+        for offset_x in range(-100, 101, 50):
+            for offset_y in range(-100, 101, 50):
+                test_x = GAME_WIDTH // 2 + offset_x
+                test_y = GAME_HEIGHT // 2 + HUD_HEIGHT + offset_y
+
+                # Check of positie binnen bounds is
+                if not self.collision_manager.is_within_bounds(
+                    test_x, test_y, self.player.width, self.player.height):
+                    continue
+
+                # Check overlap met obstakels
+                test_rect = pygame.Rect(test_x, test_y, self.player.width, self.player.height)
+                if not current_room.rect_hits_obstacle(test_rect):
+                    # Veilige positie gevonden
+                    self.player.x = test_x
+                    self.player.y = test_y
+                    self.player.rect.x = test_x
+                    self.player.rect.y = test_y
+                    return
 
     def cleanup(self):
         self.audio_manager.stop()
         pygame.quit()
 
+    def start_telemetry(self, path):
+        """Schrijf vanaf nu elke frame een record naar path (.csv of .jsonl)"""
+        self.stop_telemetry()
+        # De tijden per scope komen uit de profiler
+        self.profiler.set_enabled(True)
+        self.profiler.take_frame()
+        self.telemetry = Telemetry(path, self.profiler)
+
+    def stop_telemetry(self):
+        if self.telemetry:
+            telemetry, self.telemetry = self.telemetry, None
+            telemetry.close()
+            if telemetry.dropped_frames:
+                print(f"telemetry: {telemetry.dropped_frames} frames overgeslagen (disk te traag)")
+
+    def toggle_profiler_overlay(self):
+        """F3: overlay aan/uit; de profiler blijft meten zolang telemetry of de tracker hem nodig heeft"""
+        visible = not self.profiler.overlay_visible
+        self.profiler.show_overlay(visible)
+        if not visible and not self.telemetry and not self.allocation_tracker:
+            self.profiler.set_enabled(False)
+        # Overlay weg (of erbij): HUD opnieuw naar het display
+        self.hud_renderer.mark_dirty()
+
+    def start_allocation_tracking(self):
+        """Rapporteer vanaf nu elke ALLOC_REPORT_FRAMES frames wie er alloceert (maakt de game traag)"""
+        if not self.allocation_tracker:
+            self.allocation_tracker = AllocationTracker(self.profiler)
+        self.allocation_tracker.start()
+
+    def stop_allocation_tracking(self):
+        if self.allocation_tracker:
+            self.allocation_tracker.stop()
+            report = self.allocation_tracker.take_report()
+            if report:
+                print(report)
+            self.allocation_tracker = None
+
+    def end_frame(self):
+        """Diagnose na elke frame: telemetry record en allocatie rapporten"""
+        if self.telemetry:
+            self.telemetry.record(self)
+        if self.allocation_tracker:
+            report = self.allocation_tracker.end_frame()
+            if report:
+                print(report)
+
     def run(self):
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
+            with self.profiler.scope('frame'):
+                with self.profiler.scope('events'):
+                    self.handle_events()
+                self.update()
+                self.render()
+            self.end_frame()
             self.clock.tick(FPS)
 
+        self.stop_allocation_tracking()
+        self.stop_telemetry()
         pygame.quit()
         sys.exit()
 
+    def run_headless(self, max_frames=None):
+        """Draai de simulatie zonder render en zonder clock.tick, zo snel als de CPU toelaat
+        Returns: aantal gesimuleerde frames"""
+        frames = 0
+        while self.running and (max_frames is None or frames < max_frames):
+            with self.profiler.scope('frame'):
+                with self.profiler.scope('events'):
+                    self.handle_events()
+
+                # Stop als het input script op is
+                if getattr(self.input_source, 'finished', False):
+                    break
+
+                self.update()
+            self.end_frame()
+            frames += 1
+
+            # Er valt niets meer te simuleren als het spel voorbij is
+            if not self.player.alive or self.game_won:
+                break
+
+        return frames
+
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.input_source.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -223,6 +327,12 @@ class Game:
                     self.running = False
                 elif event.key == pygame.K_m:
                     self.audio_manager.toggle_mute()
+                elif event.key == pygame.K_F5:
+                    self.save_manager.save(self)
+                elif event.key == pygame.K_F9:
+                    self.save_manager.load(self)
+                elif event.key == pygame.K_F3:
+                    self.toggle_profiler_overlay()
                 elif event.key == pygame.K_SPACE:
                     # Alleen attack als speler leeft en het spel niet gewonnen is
                     if self.player.alive and not self.game_won and self.player.attack():
@@ -236,7 +346,7 @@ class Game:
             return
 
         # Haal keyboard state op
-        keys = pygame.key.get_pressed()
+        keys = self.input_source.get_pressed()
 
         # Sla oude positie op
         old_x = self.player.x
@@ -246,11 +356,14 @@ class Game:
         self.player.update(keys)
 
         if self.in_dungeon:
-            self.update_dungeon(old_x, old_y)
+            with self.profiler.scope('update.dungeon'):
+                self.update_dungeon(old_x, old_y)
         elif self.in_cave:
-            self.update_cave()
+            with self.profiler.scope('update.cave'):
+                self.update_cave()
         else:
-            self.update_overworld(old_x, old_y)
+            with self.profiler.scope('update.overworld'):
+                self.update_overworld(old_x, old_y)
 
     def update_dungeon(self, old_x, old_y):
         """Update logic voor dungeon"""
@@ -350,6 +463,7 @@ class Game:
                     self.player.has_sword = True
                     # Verberg oude man en tekst
                     self.sword_cave_room.old_man.visible = False
+                    self.sword_cave_room.invalidate_static_layer()
                     # Speel get-item geluid af
                     if self.audio_manager.get_item_sound:
                         self.audio_manager.get_item_sound.play()
@@ -376,10 +490,10 @@ class Game:
             self.player.y = HUD_HEIGHT + WALL_THICKNESS
         # Bottom wall (except at exit area)
         if self.player.y + self.player.height > HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS:
-            # Check if player is in the exit area (center 50px wide)
+            # Check if player is in the exit area (center CAVE_EXIT_SIZE wide)
             player_center_x = self.player.x + self.player.width // 2
-            exit_left = GAME_WIDTH // 2 - 25
-            exit_right = GAME_WIDTH // 2 + 25
+            exit_left = GAME_WIDTH // 2 - CAVE_EXIT_SIZE // 2
+            exit_right = GAME_WIDTH // 2 + CAVE_EXIT_SIZE // 2
             if not (exit_left < player_center_x < exit_right):
                 # Not in exit area, block the wall
                 self.player.y = HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS - self.player.height
@@ -474,9 +588,9 @@ class Game:
         """Check collisions met obstakels en blokken"""
         current_room = self.room_manager.get_current_room()
 
-        # Check obstakels
+        # Check obstakels (alleen die in de tiles rond de speler)
         self.collision_manager.check_obstacle_collisions(
-            self.player, current_room.obstacles, old_x, old_y)
+            self.player, current_room.get_obstacles_near(self.player.rect), old_x, old_y)
 
         # Check duwbaar blok
         self.collision_manager.check_pushable_block_collision(
@@ -537,6 +651,9 @@ class Game:
                 if not current_room.pushable_block.rect.colliderect(current_room.hidden_stairs.rect):
                     current_room.hidden_stairs.reveal()
 
+            # Blok en trap zitten in de statische laag - opnieuw tekenen
+            current_room.invalidate_static_layer()
+
         return block_was_pushed
 
     def render_win_screen(self):
@@ -608,47 +725,70 @@ class Game:
         pygame.draw.polygon(self.screen, dark_gold, right_points, 2)
 
         # Teken "YOU WON" tekst
-        font = pygame.font.Font(None, 72)
-        text = font.render("YOU WON", True, (255, 215, 0))
+        text = get_text_cache().render("YOU WON", 72, (255, 215, 0))
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
         self.screen.blit(text, text_rect)
 
-    def render(self):
+    def get_current_scene(self):
+        """Geef de room terug waar de speler nu is (overworld, dungeon of cave)"""
         if self.in_dungeon:
-            # Render dungeon room
-            dungeon_room = self.dungeon_manager.get_current_room()
-            dungeon_room.render(self.screen, HUD_HEIGHT)
-
-            # Render player
-            self.player.render(self.screen)
-
-        elif self.in_cave:
-            # Render juiste cave room
+            return self.dungeon_manager.get_current_room()
+        if self.in_cave:
             if self.current_cave == 'sword':
-                self.sword_cave_room.render(self.screen, HUD_HEIGHT)
+                return self.sword_cave_room
             elif self.current_cave == 'hint':
-                self.hint_cave_room.render(self.screen, HUD_HEIGHT)
-            elif self.current_cave == 'shop':
-                self.shop_cave_room.render(self.screen, HUD_HEIGHT)
-
-            # Render player
+                return self.hint_cave_room
+            return self.shop_cave_room
+        return self.room_manager.get_current_room()
+
+    def get_dirty_rects(self, scene):
+        """Rects van alles wat deze frame bovenop de statische laag getekend wordt"""
+        rects = scene.get_dirty_rects()
+        rects.append(self.player.get_render_rect())
+        return rects
+
+    def render_dirty(self, scene):
+        """Render alleen de veranderde gebieden en update alleen die op het display"""
+        with self.profiler.scope('render.scene'):
+            # Herstel de statische laag onder wat vorige frame getekend is
+            self.dirty_rect_renderer.restore_background(scene, HUD_HEIGHT)
+
+            # Teken alle dynamische entities en de speler
+            scene.render_dynamic(self.screen)
             self.player.render(self.screen)
-        else:
-            # Render current room (met HUD offset)
-            current_room = self.room_manager.get_current_room()
-            current_room.render(self.screen, HUD_HEIGHT)
 
-            # Render cave entrance (voor alle rooms met een cave)
-            current_room_pos = self.room_manager.current_room
-            if current_room_pos in self.cave_entrances:
-                cave_entrance, _ = self.cave_entrances[current_room_pos]
-                cave_entrance.render(self.screen)
+        # Render HUD bar bovenaan (naar het display alleen als hij veranderd is)
+        with self.profiler.scope('render.hud'):
+            hud_changed = self.hud_renderer.render_hud(self.player, self.room_manager, self.in_dungeon, self.dungeon_manager)
+        if self.profiler.overlay_visible:
+            self.profiler.render_overlay(self.screen)
+            hud_changed = True
+
+        with self.profiler.scope('display'):
+            self.dirty_rect_renderer.present(scene, self.get_dirty_rects(scene), hud_changed)
+
+    def render(self):
+        scene = self.get_current_scene()
+
+        # Dirty-rect mode, behalve bij overlays en nieuwe scenes (dan volledige flip)
+        overlay_active = not self.player.alive or self.game_won
+        if self.dirty_rect_renderer:
+            if overlay_active:
+                self.dirty_rect_renderer.request_full_redraw()
+            elif not self.dirty_rect_renderer.needs_full_redraw(scene):
+                self.render_dirty(scene)
+                return
+
+        # Render huidige room, dungeon room of cave (met HUD offset)
+        with self.profiler.scope('render.scene'):
+            scene.render(self.screen, HUD_HEIGHT)
 
             # Render player
             self.player.render(self.screen)
 
         # Render HUD bar bovenaan
-        self.hud_renderer.render_hud(self.player, self.room_manager, self.in_dungeon, self.dungeon_manager)
+        with self.profiler.scope('render.hud'):
+            self.hud_renderer.render_hud(self.player, self.room_manager, self.in_dungeon, self.dungeon_manager)
 
         # Render game over screen als speler dood is
         self.hud_renderer.render_game_over(self.player)
@@ -657,8 +797,116 @@ class Game:
         if self.game_won:
             self.render_win_screen()
 
-        pygame.display.flip()
+        # Profiler overlay over de HUD
+        self.profiler.render_overlay(self.screen)
+
+        # Headless is er geen display om naar te flippen
+        if self.headless:
+            return
+
+        with self.profiler.scope('display'):
+            if self.dirty_rect_renderer:
+                self.dirty_rect_renderer.present_full(scene, self.get_dirty_rects(scene))
+            else:
+                pygame.display.flip()
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="The Legend of Smellda")
+    parser.add_argument('--headless', action='store_true',
+                        help="Draai zonder venster en audio, zo snel mogelijk")
+    parser.add_argument('--frames', type=int,
+                        help=f"Aantal frames om headless te simuleren (standaard 3600, met --bot {BOT_FRAMES})")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="Update alleen veranderde gebieden van het scherm")
+    parser.add_argument('--sprite-cache', metavar='DIR',
+                        help="Bewaar de gebakken sprite atlas in DIR en laad hem daar de volgende keer uit")
+    parser.add_argument('--seed', type=int,
+                        help="World seed (zelfde seed = zelfde wereld en simulatie)")
+    parser.add_argument('--load', metavar='FILE',
+                        help="Start vanuit een save bestand")
+    parser.add_argument('--save', metavar='FILE',
+                        help="Schrijf na een headless run een save bestand")
+    parser.add_argument('--record', metavar='FILE',
+                        help="Neem de input van deze sessie op in FILE")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="Speel een opgenomen sessie af (met de seed uit de opname)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Zet de profiler aan (headless: print de tijden per subsysteem)")
+    parser.add_argument('--telemetry', metavar='FILE',
+                        help="Schrijf per frame tijden en entity aantallen naar FILE (.csv of .jsonl)")
+    parser.add_argument('--track-allocations', action='store_true',
+                        help="Print elke 1000 frames de scopes en regels die het meest alloceren (traag)")
+    parser.add_argument('--bot', action='store_true',
+                        help="Laat de explorer bot het spel uitspelen (soak en load tests)")
+    args = parser.parse_args()
+    if args.bot and args.replay:
+        parser.error("--bot en --replay gaan niet samen")
+
+    # Input bron: opname afspelen, of de normale bron (eventueel opgenomen)
+    seed = args.seed
+    input_source = None
+    bot = None
+    if args.bot:
+        input_source = bot = ExplorerBot()
+    if args.replay:
+        recording = Recording.load(args.replay)
+        seed = recording.seed
+        input_source = ReplayInput(recording)
+    recorder = None
+    if args.record:
+        # Seed hier al kiezen, zodat hij in de opname komt
+        seed = new_world_seed() if seed is None else seed
+        source = input_source or (ScriptedInput() if args.headless else KeyboardInput())
+        input_source = recorder = InputRecorder(source, seed)
+
+    if args.headless:
+        game = Game(headless=True, input_source=input_source, seed=seed)
+        if bot:
+            bot.attach(game)
+        game.profiler.set_enabled(args.profile)
+        if args.load:
+            game.save_manager.load(game, args.load)
+        if args.telemetry:
+            game.start_telemetry(args.telemetry)
+        if args.track_allocations:
+            game.start_allocation_tracking()
+        start = time.perf_counter()
+        # Een replay loopt tot de opname op is
+        if args.replay:
+            max_frames = None
+        elif args.frames is not None:
+            max_frames = args.frames
+        else:
+            max_frames = BOT_FRAMES if bot else 3600
+        frames = game.run_headless(max_frames)
+        elapsed = time.perf_counter() - start
+        game.stop_allocation_tracking()
+        game.stop_telemetry()
+        fps = frames / elapsed if elapsed > 0 else 0.0
+        print(f"seed {game.seed}: {frames} frames in {elapsed:.3f}s ({fps:.0f} frames/s)")
+        if bot:
+            print(bot.summary())
+        if args.profile:
+            print(game.profiler.report())
+        if args.save:
+            game.save_manager.save(game, args.save)
+        if recorder:
+            recorder.save(args.record)
+    else:
+        game = Game(input_source=input_source, dirty_rects=args.dirty_rects,
+                    sprite_cache=args.sprite_cache, seed=seed)
+        if bot:
+            bot.attach(game)
+        game.profiler.show_overlay(args.profile)
+        if args.load:
+            game.save_manager.load(game, args.load)
+        if args.telemetry:
+            game.start_telemetry(args.telemetry)
+        if args.track_allocations:
+            game.start_allocation_tracking()
+        try:
+            game.run()
+        finally:
+            # run() eindigt met sys.exit()
+            if recorder:
+                recorder.save(args.record)
@@ -30,6 +30,10 @@ class HealthDrop:
         """Verzamel het hartje"""
         self.collected = True
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent"""
+        return self.rect.inflate(4, 4)
+
     def render(self, screen):
         """Teken een klein rood hartje"""
         if self.collected:
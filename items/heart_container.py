@@ -17,6 +17,10 @@ class HeartContainer:
         """Update (niet meer nodig zonder animatie)"""
         pass
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent"""
+        return self.rect.inflate(6, 6)
+
     def render(self, screen):
         """Teken de heart container met witte outline en rode vulling"""
         if self.collected:
@@ -20,6 +20,10 @@ class Item:
         """Markeer item als gecollecteerd"""
         self.collected = True
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent"""
+        return self.rect.inflate(4, 4)
+
     def render(self, screen):
         if self.collected:
             return
@@ -16,6 +16,10 @@ class Key:
     def collect(self):
         self.collected = True
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent"""
+        return self.rect.inflate(4, 4)
+
     def render(self, screen):
         if self.collected:
             return
@@ -1,4 +1,6 @@
 import pygame
+from constants import RUPEE_SIZE
+from managers.sprite_atlas import get_sprite_atlas
 
 class Rupee:
     """Een rupee (geld item) die de speler kan oppakken"""
@@ -10,7 +12,7 @@ class Rupee:
         self.x = x
         self.y = y
         self.value = value
-        self.size = 16
+        self.size = RUPEE_SIZE
         self.rect = pygame.Rect(x, y, self.size, self.size)
         self.collected = False
 
@@ -44,6 +46,10 @@ class Rupee:
         """Markeer als verzameld"""
         self.collected = True
 
+    def get_render_rect(self):
+        """Gebied waarin render() tekent (inclusief bounce)"""
+        return self.rect.inflate(4, 12)
+
     def render(self, screen):
         """Teken de rupee"""
         if self.collected:
@@ -55,42 +61,48 @@ class Rupee:
             if (self.lifetime // 10) % 2 == 0:
                 return  # Skip rendering dit frame
 
-        # Bereken centrum voor rotatie effect
-        center_x = self.x + self.size // 2
-        center_y = self.y + self.size // 2
-
         # Lichte bounce animatie
         bounce = int(abs(pygame.math.Vector2(0, 3).rotate(self.animation_offset * 50).y))
-        adjusted_y = center_y - bounce
-
-        # Diamant vorm (4 punten)
-        points = [
-            (center_x, adjusted_y - self.size // 2),  # Boven
-            (center_x + self.size // 2, adjusted_y),  # Rechts
-            (center_x, adjusted_y + self.size // 2),  # Onder
-            (center_x - self.size // 2, adjusted_y),  # Links
-        ]
-
-        # Kleur gebaseerd op waarde
-        if self.value == 1:
-            # Groen-gele rupee (waarde 1)
-            base_color = (100, 200, 50)
-            dark_color = (50, 100, 25)
-            highlight_color = (200, 255, 150)
-        else:  # value == 5
-            # Groen-blauwe rupee (waarde 5)
-            base_color = (50, 150, 200)
-            dark_color = (25, 75, 100)
-            highlight_color = (150, 220, 255)
-
-        # Teken diamant
-        pygame.draw.polygon(screen, base_color, points)
-        pygame.draw.polygon(screen, dark_color, points, 2)
-
-        # Glans effect
-        highlight_points = [
-            (center_x - 3, adjusted_y - 3),
-            (center_x + 3, adjusted_y - 3),
-            (center_x, adjusted_y + 2),
-        ]
-        pygame.draw.polygon(screen, highlight_color, highlight_points)
+        get_sprite_atlas().blit(screen, ('rupee', self.value, bounce), int(self.x), int(self.y))
+
+
+def draw_rupee(screen, x, y, value, bounce):
+    """Teken een rupee met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    size = RUPEE_SIZE
+
+    # Bereken centrum voor rotatie effect
+    center_x = x + size // 2
+    center_y = y + size // 2
+    adjusted_y = center_y - bounce
+
+    # Diamant vorm (4 punten)
+    points = [
+        (center_x, adjusted_y - size // 2),  # Boven
+        (center_x + size // 2, adjusted_y),  # Rechts
+        (center_x, adjusted_y + size // 2),  # Onder
+        (center_x - size // 2, adjusted_y),  # Links
+    ]
+
+    # Kleur gebaseerd op waarde
+    if value == 1:
+        # Groen-gele rupee (waarde 1)
+        base_color = (100, 200, 50)
+        dark_color = (50, 100, 25)
+        highlight_color = (200, 255, 150)
+    else:  # value == 5
+        # Groen-blauwe rupee (waarde 5)
+        base_color = (50, 150, 200)
+        dark_color = (25, 75, 100)
+        highlight_color = (150, 220, 255)
+
+    # Teken diamant
+    pygame.draw.polygon(screen, base_color, points)
+    pygame.draw.polygon(screen, dark_color, points, 2)
+
+    # Glans effect
+    highlight_points = [
+        (center_x - 3, adjusted_y - 3),
+        (center_x + 3, adjusted_y - 3),
+        (center_x, adjusted_y + 2),
+    ]
+    pygame.draw.polygon(screen, highlight_color, highlight_points)
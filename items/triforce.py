@@ -1,11 +1,13 @@
 import pygame
+from constants import TRIFORCE_WIDTH, TRIFORCE_HEIGHT
+from managers.sprite_atlas import get_sprite_atlas
 
 class Triforce:
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.width = 40
-        self.height = 35
+        self.width = TRIFORCE_WIDTH
+        self.height = TRIFORCE_HEIGHT
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.collected = False
 
@@ -21,52 +23,69 @@ class Triforce:
         """Update animatie"""
         self.pulse_timer += 1
         # Pulserende animatie
-        self.pulse_scale = 1.0 + 0.15 * abs((self.pulse_timer % 60) - 30) / 30
+        self.pulse_scale = get_pulse_scale(self.pulse_timer)
+
+    def get_render_rect(self):
+        """Gebied waarin render() tekent (de driehoeken steken rechts en onder de rect uit)"""
+        return pygame.Rect(self.x - 6, self.y + 8, self.width + 50, self.height + 28)
 
     def render(self, screen):
         """Teken de triforce (gouden driehoek)"""
         if self.collected:
             return
 
-        # Gouden kleur
-        gold = (255, 215, 0)
-        dark_gold = (218, 165, 32)
-
-        # Bereken gepulseerde grootte
-        pulsed_width = int(self.width * self.pulse_scale)
-        pulsed_height = int(self.height * self.pulse_scale)
-        offset_x = (pulsed_width - self.width) // 2
-        offset_y = (pulsed_height - self.height) // 2
-
-        center_x = self.x + self.width // 2 - offset_x
-        center_y = self.y + self.height // 2 - offset_y
-
-        # Triforce bestaat uit 3 driehoeken
-        triangle_size = pulsed_height // 2
-
-        # Bovenste driehoek
-        top_points = [
-            (center_x + pulsed_width // 2, center_y),  # Top
-            (center_x + pulsed_width // 2 - triangle_size, center_y + triangle_size),  # Links onder
-            (center_x + pulsed_width // 2 + triangle_size, center_y + triangle_size)  # Rechts onder
-        ]
-        pygame.draw.polygon(screen, gold, top_points)
-        pygame.draw.polygon(screen, dark_gold, top_points, 2)
-
-        # Linker onderste driehoek
-        left_points = [
-            (center_x + pulsed_width // 2 - triangle_size, center_y + triangle_size),  # Top
-            (center_x + pulsed_width // 2 - 2 * triangle_size, center_y + 2 * triangle_size),  # Links onder
-            (center_x + pulsed_width // 2, center_y + 2 * triangle_size)  # Rechts onder
-        ]
-        pygame.draw.polygon(screen, gold, left_points)
-        pygame.draw.polygon(screen, dark_gold, left_points, 2)
-
-        # Rechter onderste driehoek
-        right_points = [
-            (center_x + pulsed_width // 2 + triangle_size, center_y + triangle_size),  # Top
-            (center_x + pulsed_width // 2, center_y + 2 * triangle_size),  # Links onder
-            (center_x + pulsed_width // 2 + 2 * triangle_size, center_y + 2 * triangle_size)  # Rechts onder
-        ]
-        pygame.draw.polygon(screen, gold, right_points)
-        pygame.draw.polygon(screen, dark_gold, right_points, 2)
+        get_sprite_atlas().blit(screen, ('triforce',) + get_pulsed_size(self.pulse_scale),
+                                int(self.x), int(self.y))
+
+
+def get_pulse_scale(pulse_timer):
+    """Schaal van de pulserende animatie op een bepaald moment"""
+    return 1.0 + 0.15 * abs((pulse_timer % 60) - 30) / 30
+
+
+def get_pulsed_size(pulse_scale):
+    """Gepulseerde (breedte, hoogte) van de triforce"""
+    return int(TRIFORCE_WIDTH * pulse_scale), int(TRIFORCE_HEIGHT * pulse_scale)
+
+
+def draw_triforce(screen, x, y, pulsed_width, pulsed_height):
+    """Teken de triforce met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    # Gouden kleur
+    gold = (255, 215, 0)
+    dark_gold = (218, 165, 32)
+
+    offset_x = (pulsed_width - TRIFORCE_WIDTH) // 2
+    offset_y = (pulsed_height - TRIFORCE_HEIGHT) // 2
+
+    center_x = x + TRIFORCE_WIDTH // 2 - offset_x
+    center_y = y + TRIFORCE_HEIGHT // 2 - offset_y
+
+    # Triforce bestaat uit 3 driehoeken
+    triangle_size = pulsed_height // 2
+
+    # Bovenste driehoek
+    top_points = [
+        (center_x + pulsed_width // 2, center_y),  # Top
+        (center_x + pulsed_width // 2 - triangle_size, center_y + triangle_size),  # Links onder
+        (center_x + pulsed_width // 2 + triangle_size, center_y + triangle_size)  # Rechts onder
+    ]
+    pygame.draw.polygon(screen, gold, top_points)
+    pygame.draw.polygon(screen, dark_gold, top_points, 2)
+
+    # Linker onderste driehoek
+    left_points = [
+        (center_x + pulsed_width // 2 - triangle_size, center_y + triangle_size),  # Top
+        (center_x + pulsed_width // 2 - 2 * triangle_size, center_y + 2 * triangle_size),  # Links onder
+        (center_x + pulsed_width // 2, center_y + 2 * triangle_size)  # Rechts onder
+    ]
+    pygame.draw.polygon(screen, gold, left_points)
+    pygame.draw.polygon(screen, dark_gold, left_points, 2)
+
+    # Rechter onderste driehoek
+    right_points = [
+        (center_x + pulsed_width // 2 + triangle_size, center_y + triangle_size),  # Top
+        (center_x + pulsed_width // 2, center_y + 2 * triangle_size),  # Links onder
+        (center_x + pulsed_width // 2 + 2 * triangle_size, center_y + 2 * triangle_size)  # Rechts onder
+    ]
+    pygame.draw.polygon(screen, gold, right_points)
+    pygame.draw.polygon(screen, dark_gold, right_points, 2)
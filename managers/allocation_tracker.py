@@ -0,0 +1,202 @@
+"""
+AllocationTracker - Welke regels en subsystemen per frame geheugen alloceren (en GC pauzes)
+"""
+import os
+import gc
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from constants import ALLOC_REPORT_FRAMES, ALLOC_TOP_SITES
+import managers.profiler
+import managers.telemetry
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NO_SCOPE = 'overig'
+
+# Eigen diagnose code telt niet mee
+IGNORED_FILES = {os.path.abspath(__file__), os.path.abspath(managers.profiler.__file__),
+                 os.path.abspath(managers.telemetry.__file__)}
+# De wrappers rond geregistreerde methodes: zelf niet meetellen, wat ze aanroepen wel
+TRANSPARENT_CODES = {const for const in managers.profiler.Profiler._timed.__code__.co_consts
+                     if hasattr(const, 'co_code')}
+
+
+class AllocationTracker:
+    """Diagnose mode: tracemalloc + een line tracer + gc callbacks
+
+    Na elke regel Python code kijkt de tracer hoeveel het getraceerde geheugen gegroeid
+    is; die groei gaat naar die regel (call site) en naar de binnenste open profiler
+    scope. Wat binnen één regel gemaakt en weer opgeruimd wordt, is dus niet te zien;
+    een Rect uit get_attack_rect() of een kopie als health_drops[:] wel. GC pauzes
+    (gc.callbacks) worden ook aan de open scope toegekend.
+
+    Elke ALLOC_REPORT_FRAMES frames geeft end_frame() een rapport terug en begint de
+    telling opnieuw. De line tracer maakt de game veel trager, ook de profiler tijden.
+    """
+
+    def __init__(self, profiler, report_frames=ALLOC_REPORT_FRAMES, top_sites=ALLOC_TOP_SITES):
+        self.profiler = profiler
+        self.report_frames = report_frames
+        self.top_sites = top_sites
+        self.active = False
+        self.stack = []  # Open scopes, binnenste laatst
+        self.site = None  # (code, regel) die nu draait, None = niet meetellen
+        self.last = 0  # Getraceerd geheugen na de vorige meting
+        self.gc_start = 0
+        self.ignored_codes = {}  # code object -> True als het bestand genegeerd wordt
+        # Vaste bound methods: aan f_trace is te zien of een frame genegeerd wordt
+        self.trace_frame = self._trace_frame
+        self.trace_ignored = self._trace_ignored
+        self.trace_transparent = self._trace_transparent
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.site_bytes = Counter()
+        self.site_hits = Counter()
+        self.scope_bytes = Counter()
+        self.gc_counts = Counter()  # scope -> aantal collections
+        self.gc_time = Counter()  # scope -> nanoseconden
+        self.gc_generations = Counter()
+
+    def start(self):
+        if self.active:
+            return
+        self.active = True
+        self.started_tracemalloc = not tracemalloc.is_tracing()
+        if self.started_tracemalloc:
+            tracemalloc.start()
+        # Scopes moeten de tracker laten weten welk subsysteem bezig is
+        self.profiler.set_enabled(True)
+        self.profiler.set_tracker(self)
+        gc.callbacks.append(self._gc_callback)
+        self.last = tracemalloc.get_traced_memory()[0]
+        sys.settrace(self._trace)
+
+    def stop(self):
+        if not self.active:
+            return
+        sys.settrace(None)
+        gc.callbacks.remove(self._gc_callback)
+        self.profiler.set_tracker(None)
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+        self.stack.clear()
+        self.active = False
+
+    # Aangeroepen door de profiler scopes
+    def enter(self, name):
+        self.stack.append(name)
+
+    def exit(self):
+        self.stack.pop()
+
+    def _ignored(self, code):
+        ignored = self.ignored_codes.get(code)
+        if ignored is None:
+            ignored = self.ignored_codes[code] = os.path.abspath(code.co_filename) in IGNORED_FILES
+        return ignored
+
+    def _account(self, overhead=0):
+        current = tracemalloc.get_traced_memory()[0]
+        growth = current - self.last - overhead
+        if growth > 0 and self.site is not None:
+            self.site_bytes[self.site] += growth
+            self.site_hits[self.site] += 1
+            self.scope_bytes[self.stack[-1] if self.stack else NO_SCOPE] += growth
+
+    def _trace(self, frame, event, arg):
+        """Globale tracer: elke nieuwe Python frame (event 'call')"""
+        # Het frame object bestaat alleen omdat er getraced wordt
+        self._account(sys.getsizeof(frame))
+        caller = frame.f_back
+        if frame.f_code in TRANSPARENT_CODES:
+            self.site = None
+            frame.f_trace_lines = False
+            tracer = self.trace_transparent
+        elif self._ignored(frame.f_code) or (caller is not None and caller.f_trace is self.trace_ignored):
+            # Allocaties in de diagnose code zelf (en wat die aanroept) niet meetellen
+            self.site = None
+            frame.f_trace_lines = False
+            tracer = self.trace_ignored
+        else:
+            self.site = (frame.f_code, frame.f_lineno)
+            tracer = self.trace_frame
+        # Eigen allocaties van de tracer niet meetellen
+        self.last = tracemalloc.get_traced_memory()[0]
+        return tracer
+
+    def _return_to(self, caller):
+        # Terug naar de regel van de aanroeper
+        if caller is None or caller.f_trace is self.trace_ignored or caller.f_trace is self.trace_transparent:
+            self.site = None
+        else:
+            self.site = (caller.f_code, caller.f_lineno)
+
+    def _trace_frame(self, frame, event, arg):
+        """Lokale tracer: regels en return binnen een gevolgde frame"""
+        self._account()
+        if event == 'return':
+            self._return_to(frame.f_back)
+        else:
+            self.site = (frame.f_code, frame.f_lineno)
+        self.last = tracemalloc.get_traced_memory()[0]
+        return self.trace_frame
+
+    def _trace_ignored(self, frame, event, arg):
+        """Lokale tracer van genegeerde frames: alleen de return is interessant"""
+        if event == 'return':
+            self._return_to(frame.f_back)
+            self.last = tracemalloc.get_traced_memory()[0]
+        return self.trace_ignored
+
+    def _trace_transparent(self, frame, event, arg):
+        self._trace_ignored(frame, event, arg)
+        return self.trace_transparent
+
+    def _gc_callback(self, phase, info):
+        if phase == 'start':
+            self.gc_start = time.perf_counter_ns()
+            return
+        scope = self.stack[-1] if self.stack else NO_SCOPE
+        self.gc_counts[scope] += 1
+        self.gc_time[scope] += time.perf_counter_ns() - self.gc_start
+        self.gc_generations[info['generation']] += 1
+
+    def end_frame(self):
+        """Aanroepen na elke frame; geeft elke report_frames frames een rapport (anders None)"""
+        self.frames += 1
+        if self.frames < self.report_frames:
+            return None
+        return self.take_report()
+
+    def take_report(self):
+        """Rapport over de frames sinds het vorige rapport, daarna opnieuw tellen"""
+        if not self.frames:
+            return None
+        # Het rapport maken zelf niet tracen
+        sys.settrace(None)
+        report = self.report()
+        self.reset()
+        if self.active:
+            self.last = tracemalloc.get_traced_memory()[0]
+            sys.settrace(self._trace)
+        return report
+
+    def report(self):
+        frames = self.frames
+        lines = [f"allocaties over {frames} frames",
+                 f"{'scope':<44} {'KiB/frame':>10} {'gc':>5} {'gc ms':>8}"]
+        scopes = set(self.scope_bytes) | set(self.gc_counts)
+        for scope in sorted(scopes, key=lambda name: -self.scope_bytes[name]):
+            lines.append(f"{scope:<44} {self.scope_bytes[scope] / frames / 1024:10.3f} "
+                         f"{self.gc_counts[scope]:5d} {self.gc_time[scope] / 1e6:8.3f}")
+        generations = ', '.join(f"gen {gen}: {count}" for gen, count in sorted(self.gc_generations.items()))
+        lines.append(f"gc collections: {generations or 'geen'}")
+
+        lines.append(f"{'call site':<60} {'KiB/frame':>10} {'keer/frame':>10}")
+        for (code, lineno), size in self.site_bytes.most_common(self.top_sites):
+            site = f"{os.path.relpath(code.co_filename, ROOT)}:{lineno} ({code.co_name})"
+            lines.append(f"{site:<60} {size / frames / 1024:10.3f} {self.site_hits[code, lineno] / frames:10.2f}")
+        return '\n'.join(lines)
@@ -1,12 +1,25 @@
 import pygame
 
+SOUND_NAMES = [
+    'push_sound', 'sword_sound', 'get_item_sound', 'hurt_sound', 'boss_sound',
+    'get_heart_sound', 'get_rupee_sound', 'shield_sound'
+]
+
 class AudioManager:
-    def __init__(self):
-        pygame.mixer.init()
+    def __init__(self, enabled=True):
+        # Zonder audio (headless) wordt de mixer nooit geïnitialiseerd
+        self.enabled = enabled
 
         self.audio_muted = False
         self.overworld_music_playing = False
 
+        if not self.enabled:
+            for name in SOUND_NAMES:
+                setattr(self, name, None)
+            return
+
+        pygame.mixer.init()
+
         # Laad muziek en geluiden
         self.load_music()
         self.load_sounds()
@@ -81,6 +94,8 @@ class AudioManager:
 
     def switch_to_dungeon_music(self):
         """Switch naar dungeon muziek"""
+        if not self.enabled:
+            return
         if self.overworld_music_playing:
             try:
                 pygame.mixer.music.load('assets/music/dungeon-theme.ogg')
@@ -92,6 +107,8 @@ class AudioManager:
 
     def switch_to_overworld_music(self):
         """Switch terug naar overworld muziek"""
+        if not self.enabled:
+            return
         if not self.overworld_music_playing:
             try:
                 pygame.mixer.music.load('assets/music/zelda-theme.ogg')
@@ -105,6 +122,9 @@ class AudioManager:
         """Toggle alle audio aan/uit"""
         self.audio_muted = not self.audio_muted
 
+        if not self.enabled:
+            return
+
         if self.audio_muted:
             # Mute alles
             pygame.mixer.music.set_volume(0.0)
@@ -146,4 +166,5 @@ class AudioManager:
 
     def stop(self):
         """Stop de muziek netjes"""
-        pygame.mixer.music.stop()
+        if self.enabled:
+            pygame.mixer.music.stop()
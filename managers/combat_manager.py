@@ -1,7 +1,9 @@
-import random
+from world.random_streams import drops_random
 from items.health_drop import HealthDrop
 from items.rupee import Rupee
-from constants import WALL_THICKNESS, HUD_HEIGHT
+from constants import (
+    WALL_THICKNESS, HUD_HEIGHT, DROP_ROLL, DROP_HEALTH_ROLLS, DROP_RUPEE_ROLLS, DROP_BIG_RUPEE_ROLLS
+)
 
 class CombatManager:
     def __init__(self, collision_manager, hurt_sound=None, shield_sound=None):
@@ -12,20 +14,24 @@ class CombatManager:
     def _try_spawn_drop(self, x, y, room):
         """Probeer een drop te spawnen op deze positie
         Een vijand geeft OF een health drop OF een rupee drop (niet beide)"""
-        rand = random.randint(1, 20)
-        if rand <= 3:  # 1-3 = health drop (15% kans)
+        rand = drops_random.randint(1, DROP_ROLL)
+        if rand <= DROP_HEALTH_ROLLS:  # Standaard 1-3 = health drop
             health_drop = HealthDrop(x, y)
             room.health_drops.append(health_drop)
-        elif rand <= 9:  # 4-9 = 1-rupee (30% kans)
+        elif rand <= DROP_HEALTH_ROLLS + DROP_RUPEE_ROLLS:  # 4-9 = 1-rupee
             rupee = Rupee(x, y, value=1)
             room.rupee_drops.append(rupee)
-        elif rand <= 12:  # 10-12 = 5-rupee (15% kans)
+        elif rand <= DROP_HEALTH_ROLLS + DROP_RUPEE_ROLLS + DROP_BIG_RUPEE_ROLLS:  # 10-12 = 5-rupee
             rupee = Rupee(x, y, value=5)
             room.rupee_drops.append(rupee)
 
     def check_sword_hits(self, player, room):
         """Check of het zwaard monsters raakt"""
-        hit_monsters = self.collision_manager.check_sword_hits(player, room.monsters)
+        if not player.attacking:
+            return
+
+        nearby = room.get_monsters_near(player.get_attack_rect())
+        hit_monsters = self.collision_manager.check_sword_hits(player, nearby)
         for monster in hit_monsters:
             monster.take_damage()
             # Als monster dood is, probeer een drop te spawnen (health OF rupee)
@@ -34,7 +40,8 @@ class CombatManager:
 
     def check_monster_damage(self, player, room):
         """Check of monsters de speler raken"""
-        damaged, damage_amount, monster = self.collision_manager.check_monster_damage(player, room.monsters)
+        nearby = room.get_monsters_near(player.rect)
+        damaged, damage_amount, monster = self.collision_manager.check_monster_damage(player, nearby)
 
         if damaged:
             hurt = player.take_damage(damage_amount)
@@ -52,8 +59,8 @@ class CombatManager:
         if not sword_rect:
             return
 
-        # Check collision met alle vleermuizen
-        for bat in dungeon_room.bats:
+        # Check collision met vleermuizen in de buurt van het zwaard
+        for bat in dungeon_room.get_bats_near(sword_rect):
             if bat.alive and sword_rect.colliderect(bat.rect):
                 bat.take_damage(1)  # Vleermuizen sterven in 1 slag
                 # Als bat dood is, probeer een drop te spawnen (health OF rupee)
@@ -62,7 +69,7 @@ class CombatManager:
 
     def check_bat_player_collision(self, player, dungeon_room):
         """Check of een vleermuis de speler raakt"""
-        for bat in dungeon_room.bats:
+        for bat in dungeon_room.get_bats_near(player.rect):
             if not bat.alive:
                 continue
 
@@ -139,9 +146,9 @@ class CombatManager:
         # Import Slime hier om circular import te voorkomen
         from entities.slime import Slime
 
-        # Check collision met alle slimes
+        # Check collision met slimes in de buurt van het zwaard
         slimes_to_add = []
-        for slime in dungeon_room.slimes[:]:  # Copy list to modify during iteration
+        for slime in dungeon_room.get_slimes_near(sword_rect):
             if slime.alive and sword_rect.colliderect(slime.rect):
                 should_split = slime.take_damage(1)
 
@@ -168,11 +175,12 @@ class CombatManager:
                 break
 
         # Voeg nieuwe kleine slimes toe
-        dungeon_room.slimes.extend(slimes_to_add)
+        for small_slime in slimes_to_add:
+            dungeon_room.add_slime(small_slime)
 
     def check_slime_player_collision(self, player, dungeon_room):
         """Check of een slime de speler raakt"""
-        for slime in dungeon_room.slimes:
+        for slime in dungeon_room.get_slimes_near(player.rect):
             if not slime.alive:
                 continue
 
@@ -200,6 +208,9 @@ class CombatManager:
         # Check collision met boss
         if sword_rect.colliderect(dungeon_room.boss.rect):
             boss_died = dungeon_room.boss.take_damage()
+            if not dungeon_room.boss.alive:
+                # Vuurballen van een dode boss verdwijnen
+                dungeon_room.projectiles.release_owner(dungeon_room.boss)
             # Als boss dood is, maak pushable block pushable en speel secret geluid
             if not dungeon_room.boss.alive and hasattr(dungeon_room, 'pushable_block'):
                 dungeon_room.pushable_block_pushable = True
@@ -225,14 +236,14 @@ class CombatManager:
         if not dungeon_room.boss or not dungeon_room.boss.alive:
             return
 
-        for fireball in dungeon_room.boss.fireballs[:]:
-            if player.rect.colliderect(fireball.rect):
-                # Vuurbal raakt speler = 2 HP schade (heel hartje)
-                hurt = player.take_damage(2)
-                if hurt and self.hurt_sound:
-                    self.hurt_sound.play()
-                # Verwijder vuurbal na hit
-                dungeon_room.boss.fireballs.remove(fireball)
+        projectiles = dungeon_room.projectiles
+        for slot in projectiles.colliding(player.rect):
+            # Vuurbal raakt speler = 2 HP schade (heel hartje)
+            hurt = player.take_damage(2)
+            if hurt and self.hurt_sound:
+                self.hurt_sound.play()
+            # Verwijder vuurbal na hit
+            projectiles.release(slot)
 
     def check_archer_sword_collision(self, player, room):
         """Check of het zwaard een archer raakt"""
@@ -243,17 +254,19 @@ class CombatManager:
         if not sword_rect:
             return
 
-        # Check collision met alle archers
-        for archer in room.archers:
+        # Check collision met archers in de buurt van het zwaard
+        for archer in room.get_archers_near(sword_rect):
             if archer.alive and sword_rect.colliderect(archer.rect):
                 archer.take_damage()
                 # Als archer dood is, probeer een drop te spawnen (health OF rupee)
                 if not archer.alive:
+                    # Pijlen van een dode archer verdwijnen
+                    room.projectiles.release_owner(archer)
                     self._try_spawn_drop(archer.x, archer.y, room)
 
     def check_archer_player_collision(self, player, room):
         """Check of een archer de speler raakt (contact damage)"""
-        for archer in room.archers:
+        for archer in room.get_archers_near(player.rect):
             if not archer.alive:
                 continue
 
@@ -268,47 +281,30 @@ class CombatManager:
 
     def check_arrow_player_collision(self, player, room):
         """Check of een pijl de speler raakt"""
-        for archer in room.archers:
-            if not archer.alive:
+        projectiles = room.projectiles
+        for slot in projectiles.colliding(player.rect):
+            # Check of het schild de pijl kan blokkeren
+            if player.can_block_arrow(projectiles.x[slot], projectiles.y[slot],
+                                      projectiles.dx[slot], projectiles.dy[slot]):
+                # Pijl wordt geblokkeerd door schild!
+                projectiles.release(slot)
+                # Speel shield geluid af
+                if self.shield_sound:
+                    self.shield_sound.play()
                 continue
 
-            for arrow in archer.arrows[:]:
-                if player.rect.colliderect(arrow.rect):
-                    # Check of het schild de pijl kan blokkeren
-                    if player.can_block_arrow(arrow.x, arrow.y, arrow.dx, arrow.dy):
-                        # Pijl wordt geblokkeerd door schild!
-                        archer.arrows.remove(arrow)
-                        # Speel shield geluid af
-                        if self.shield_sound:
-                            self.shield_sound.play()
-                        continue
-
-                    # Pijl raakt speler = 1 HP schade (half hartje)
-                    hurt = player.take_damage(1)
-                    if hurt and self.hurt_sound:
-                        self.hurt_sound.play()
-                    # Verwijder pijl na hit
-                    archer.arrows.remove(arrow)
+            # Pijl raakt speler = 1 HP schade (half hartje)
+            hurt = player.take_damage(1)
+            if hurt and self.hurt_sound:
+                self.hurt_sound.play()
+            # Verwijder pijl na hit
+            projectiles.release(slot)
 
     def check_arrow_obstacle_collision(self, room, screen_width, screen_height):
         """Check of pijlen obstakels of muren raken en verwijder ze"""
-        for archer in room.archers:
-            if not archer.alive:
-                continue
+        # Muren
+        room.projectiles.cull(WALL_THICKNESS, HUD_HEIGHT + WALL_THICKNESS,
+                              screen_width - WALL_THICKNESS, screen_height - WALL_THICKNESS)
 
-            for arrow in archer.arrows[:]:
-                # Check muren
-                hit_wall = (arrow.x < WALL_THICKNESS or
-                           arrow.x > screen_width - WALL_THICKNESS or
-                           arrow.y < HUD_HEIGHT + WALL_THICKNESS or
-                           arrow.y > screen_height - WALL_THICKNESS)
-
-                if hit_wall:
-                    archer.arrows.remove(arrow)
-                    continue
-
-                # Check obstakels (rotsen, water, bomen)
-                for obstacle in room.obstacles:
-                    if arrow.rect.colliderect(obstacle.rect):
-                        archer.arrows.remove(arrow)
-                        break
+        # Obstakels (rotsen, water, bomen) op de tiles onder de pijlen
+        room.projectiles.cull_obstacles(room)
@@ -43,6 +43,8 @@ class DungeonInteractionManager:
                     )
                     if can_push:
                         dungeon_room.pushable_block.push(player.facing)
+                        # Blok zit in de statische laag
+                        dungeon_room.invalidate_static_layer()
                         return
 
                 # Als niet pushable of niet kan duwen, reset speler positie
@@ -0,0 +1,497 @@
+"""
+ExplorerBot - Input bron die het hele spel zelf uitspeelt (headless soak en load tests)
+"""
+import math
+import random
+from collections import deque
+import pygame
+from managers.input_manager import ScriptedInput
+from world.scene_queries import get_enemies, get_location
+from constants import (
+    GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS, TILE_SIZE, PLAYER_WIDTH, PLAYER_HEIGHT,
+    PLAYER_SPEED, BOT_ENGAGE_DISTANCE, BOT_DROP_DISTANCE, BOT_CHASE_DISTANCE, BOT_GIVE_UP_FRAMES,
+    BOT_IGNORE_FRAMES, BOT_STUCK_FRAMES, BOT_DETOUR_FRAMES
+)
+
+# De tile grid van een room (zelfde als de obstakels en barriers): binnen de muren
+ORIGIN_X = WALL_THICKNESS
+ORIGIN_Y = HUD_HEIGHT + WALL_THICKNESS
+COLUMNS = (GAME_WIDTH - 2 * WALL_THICKNESS) // TILE_SIZE
+ROWS = (GAME_HEIGHT - 2 * WALL_THICKNESS) // TILE_SIZE
+
+SWORD_CAVE_ROOM = (1, 1)  # Zie Game.__init__ en RoomManager.generate_secret_stairs
+STAIRS_ROOM = (2, 2)
+ALIGN = PLAYER_SPEED // 2  # Zo ver mag de speler naast het midden van een tile staan
+FIGHT_ALIGN = 15  # Zo ver naast een vijand staat die nog binnen het zwaard
+
+FACING_KEYS = {'left': pygame.K_LEFT, 'right': pygame.K_RIGHT, 'up': pygame.K_UP, 'down': pygame.K_DOWN}
+FACING_STEPS = {'left': (-1, 0), 'right': (1, 0), 'up': (0, -1), 'down': (0, 1)}
+MOVE_KEYS = tuple(FACING_KEYS.values())
+# Exits: de tile ervoor en de kant waar de speler dan op loopt
+EXIT_CELLS = {'north': (COLUMNS // 2, 0), 'south': (COLUMNS // 2, ROWS - 1),
+              'west': (0, ROWS // 2), 'east': (COLUMNS - 1, ROWS // 2)}
+EXIT_FACINGS = {'north': 'up', 'south': 'down', 'west': 'left', 'east': 'right'}
+EXIT_STEPS = {'north': (0, -1), 'south': (0, 1), 'west': (-1, 0), 'east': (1, 0)}
+# Wat de bot in de dungeon ophaalt, in deze volgorde
+DUNGEON_ITEMS = ('key', 'heart_container', 'triforce')
+
+
+def cell_of(x, y):
+    """Tile (kolom, rij) onder een punt op het scherm, begrensd tot de grid"""
+    column = (x - ORIGIN_X) // TILE_SIZE
+    row = (y - ORIGIN_Y) // TILE_SIZE
+    return min(max(column, 0), COLUMNS - 1), min(max(row, 0), ROWS - 1)
+
+
+def cell_position(cell):
+    """Positie (linksboven) van de speler in het midden van een tile"""
+    return (ORIGIN_X + cell[0] * TILE_SIZE + (TILE_SIZE - PLAYER_WIDTH) // 2,
+            ORIGIN_Y + cell[1] * TILE_SIZE + (TILE_SIZE - PLAYER_HEIGHT) // 2)
+
+
+def in_grid(cell):
+    return 0 <= cell[0] < COLUMNS and 0 <= cell[1] < ROWS
+
+
+def blocked_cells(scene):
+    """Tiles waar de speler niet kan staan: obstakels, barriers en het duwbare blok"""
+    rects = [obstacle.rect for obstacle in getattr(scene, 'obstacles', ())]
+    rects.extend(getattr(scene, 'barrier_blocks', ()))
+    block = getattr(scene, 'pushable_block', None)
+    if block:
+        rects.append(block.rect)
+    blocked = set()
+    for rect in rects:
+        left, top = cell_of(rect.left, rect.top)
+        right, bottom = cell_of(rect.right - 1, rect.bottom - 1)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                blocked.add((column, row))
+    return blocked
+
+
+def find_path(start, goals, neighbors):
+    """Breadth-first van start naar een van de goals: de stappen na start, None als onbereikbaar
+
+    Werkt voor de tile grid van een room en voor de room graaf (neighbors geeft de buren).
+    """
+    if start in goals:
+        return []
+    previous = {start: None}
+    queue = deque((start,))
+    while queue:
+        node = queue.popleft()
+        for neighbor in neighbors(node):
+            if neighbor in previous:
+                continue
+            previous[neighbor] = node
+            if neighbor in goals:
+                path = []
+                while neighbor != start:
+                    path.append(neighbor)
+                    neighbor = previous[neighbor]
+                path.reverse()
+                return path
+            queue.append(neighbor)
+    return None
+
+
+class ExplorerBot:
+    """Input bron die zelf speelt, zodat soak en load tests alle code paden raken
+
+    Na attach(game) kiest de bot elke frame toetsen uit de toestand van de game, in
+    deze volgorde:
+      1. vechten: vijanden in de buurt (in de dungeon alle vijanden van de room)
+      2. drops en items in de buurt oppakken
+      3. het volgende doel: het zwaard in de sword cave, het blok in room (2,2) wegduwen
+         en de trap af, dan in de dungeon de sleutel, de heart container, de boss, het
+         blok voor de triforce en de triforce zelf.
+    Routes worden in twee lagen gepland met dezelfde breadth-first search: over de room
+    graaf (exits, locked doors alleen met sleutel) naar de goede room, en binnen de room
+    over de tile grid om obstakels, barriers en blokken heen. De speler loopt tile voor
+    tile over één as tegelijk, netjes uitgelijnd, zodat hij nergens achter blijft haken.
+
+    Loopt hij toch vast, dan gaat hij even een willekeurige kant op. De bot heeft een
+    eigen Random met de world seed: een run is net zo reproduceerbaar als de game zelf
+    (en kan met --record opgenomen worden).
+    """
+
+    def __init__(self):
+        self.input = ScriptedInput()
+        self.game = None
+        self.interactive = False
+        self.rng = random.Random(0)
+        self.frame = 0
+        self.location = None
+        self.locations = set()
+        self.position = None
+        self.still = 0
+        self.detour = 0
+        self.detour_key = None
+        self.target = None
+        self.target_frames = 0
+        self.ignored = {}  # vijand -> frame tot wanneer hij genegeerd wordt
+        self.wander_goal = None
+        self.blocked_key = None
+        self.blocked = set()
+
+    def attach(self, game):
+        """Speel voortaan deze game (de bot is al de input bron van de game)"""
+        self.game = game
+        # Met een venster de echte events doorgeven (sluiten, ESC, F3)
+        self.interactive = not game.headless
+        self.rng = random.Random(game.seed)
+        self.frame = 0
+        self.location = None
+        self.locations = set()
+
+    def get_events(self):
+        events = []
+        if self.interactive:
+            events = [event for event in pygame.event.get() if event.type == pygame.QUIT or
+                      (event.type == pygame.KEYDOWN and event.key not in MOVE_KEYS)]
+        if self.game is not None:
+            held, pressed = self.next_keys()
+            self.input.set_keys(held, pressed)
+        return events + self.input.get_events()
+
+    def get_pressed(self):
+        return self.input.get_pressed()
+
+    def summary(self):
+        game = self.game
+        player = game.player
+        result = 'gewonnen' if game.game_won else ('dood' if not player.alive else 'bezig')
+        return (f"bot: {result} na {self.frame} frames, health {player.health}/{player.max_health}, "
+                f"{player.rupees} rupees, {len(self.locations)} locaties bezocht")
+
+    def next_keys(self):
+        """Toetsen voor het volgende frame: (vastgehouden, KEYDOWN)"""
+        game = self.game
+        player = game.player
+        if not player.alive or game.game_won:
+            return (), ()
+        self.frame += 1
+
+        location = get_location(game)
+        if location != self.location:
+            # Nieuwe room: opnieuw beginnen met vijanden en vastlopen
+            self.location = location
+            self.locations.add(location)
+            self.ignored.clear()
+            self.target = None
+            self.detour = 0
+            self.still = 0
+        if self.detour:
+            self.detour -= 1
+            return (self.detour_key,), ()
+
+        held, pressed = self.choose_keys(game.get_current_scene())
+
+        # Vast tegen een obstakel (of vijand): even een willekeurige andere kant op
+        position = (player.x, player.y)
+        self.still = self.still + 1 if held and position == self.position else 0
+        self.position = position
+        if self.still >= BOT_STUCK_FRAMES:
+            self.still = 0
+            self.detour = BOT_DETOUR_FRAMES
+            self.detour_key = self.rng.choice(MOVE_KEYS)
+            return (self.detour_key,), ()
+        return held, pressed
+
+    def choose_keys(self, scene):
+        if self.game.player.has_sword:
+            enemy = self.pick_enemy(scene)
+            if enemy:
+                return self.fight(scene, enemy)
+        drop = self.pick_drop(scene)
+        if drop:
+            held = self.walk_to_rect(scene, drop.rect)
+            if held is not None:
+                return held, ()
+        return self.goal_keys(scene), ()
+
+    # Plannen over de tile grid
+
+    def get_blocked(self, scene):
+        """Geblokkeerde tiles, opnieuw bepaald als de statische laag van de scene verandert"""
+        key = (scene, getattr(scene, 'static_version', 0))
+        if key != self.blocked_key:
+            self.blocked = blocked_cells(scene)
+            self.blocked_key = key
+        return self.blocked
+
+    def player_cell(self):
+        return cell_of(*self.game.player.rect.center)
+
+    def find_cell_path(self, scene, goals):
+        blocked = self.get_blocked(scene)
+
+        def neighbors(cell):
+            column, row = cell
+            for neighbor in ((column + 1, row), (column - 1, row), (column, row + 1), (column, row - 1)):
+                if neighbor not in blocked and in_grid(neighbor):
+                    yield neighbor
+
+        return find_path(self.player_cell(), goals, neighbors)
+
+    def step_keys(self, cell, next_cell):
+        """Eén stap van cell naar de buur next_cell: eerst uitlijnen, dan lopen"""
+        player = self.game.player
+        x, y = cell_position(cell)
+        if next_cell[0] != cell[0]:
+            if abs(player.y - y) > ALIGN:
+                return (pygame.K_UP if y < player.y else pygame.K_DOWN,)
+            return (pygame.K_RIGHT if next_cell[0] > cell[0] else pygame.K_LEFT,)
+        if abs(player.x - x) > ALIGN:
+            return (pygame.K_LEFT if x < player.x else pygame.K_RIGHT,)
+        return (pygame.K_DOWN if next_cell[1] > cell[1] else pygame.K_UP,)
+
+    def approach(self, x, y):
+        """Direct (zonder tiles) naar een positie van de speler, eerst x dan y"""
+        player = self.game.player
+        if abs(player.x - x) > ALIGN:
+            return (pygame.K_LEFT if x < player.x else pygame.K_RIGHT,)
+        if abs(player.y - y) > ALIGN:
+            return (pygame.K_UP if y < player.y else pygame.K_DOWN,)
+        return ()
+
+    def walk_to_cell(self, scene, cell):
+        """Toetsen richting cell, () als de speler er al is, None als hij onbereikbaar is"""
+        path = self.find_cell_path(scene, {cell})
+        if path is None:
+            return None
+        if not path:
+            return ()
+        return self.step_keys(self.player_cell(), path[0])
+
+    def walk_to_rect(self, scene, rect):
+        """Naar de tile van rect en dan er recht op af (items, drops, trap, vijanden)"""
+        held = self.walk_to_cell(scene, cell_of(*rect.center))
+        if held == ():
+            return self.approach(rect.centerx - PLAYER_WIDTH // 2, rect.centery - PLAYER_HEIGHT // 2)
+        return held
+
+    def push_from(self, scene, cell, facing):
+        """Naar cell, uitlijnen en dan de kant van facing op lopen (exit, cave of blok)"""
+        if self.player_cell() != cell:
+            return self.walk_to_cell(scene, cell)
+        player = self.game.player
+        x, y = cell_position(cell)
+        if facing in ('left', 'right'):
+            if abs(player.y - y) > ALIGN:
+                return (pygame.K_UP if y < player.y else pygame.K_DOWN,)
+        elif abs(player.x - x) > ALIGN:
+            return (pygame.K_LEFT if x < player.x else pygame.K_RIGHT,)
+        return (FACING_KEYS[facing],)
+
+    def push_block(self, scene, block):
+        """Duw het blok naar een vrije tile, vanaf de bereikbare kant die het dichtst bij is"""
+        blocked = self.get_blocked(scene)
+        column, row = cell_of(*block.rect.center)
+        options = []
+        for facing, (dx, dy) in FACING_STEPS.items():
+            target = (column + dx, row + dy)
+            stand = (column - dx, row - dy)
+            if not (in_grid(target) and in_grid(stand)) or target in blocked or stand in blocked:
+                continue
+            path = self.find_cell_path(scene, {stand})
+            if path is not None:
+                options.append((len(path), facing, stand))
+        if not options:
+            return None
+        _, facing, stand = min(options)
+        return self.push_from(scene, stand, facing)
+
+    def enter(self, scene, rect):
+        """Loop een cave ingang in de muur in"""
+        if rect.top <= HUD_HEIGHT:
+            cell, facing = cell_of(rect.centerx, ORIGIN_Y), 'up'
+        elif rect.bottom >= HUD_HEIGHT + GAME_HEIGHT:
+            cell, facing = cell_of(rect.centerx, HUD_HEIGHT + GAME_HEIGHT), 'down'
+        elif rect.left <= 0:
+            cell, facing = cell_of(ORIGIN_X, rect.centery), 'left'
+        else:
+            cell, facing = cell_of(GAME_WIDTH, rect.centery), 'right'
+        return self.push_from(scene, cell, facing)
+
+    def leave(self, scene, direction):
+        return self.push_from(scene, EXIT_CELLS[direction], EXIT_FACINGS[direction])
+
+    # Plannen over de room graaf
+
+    def travel(self, scene, start, goal, neighbors):
+        """Eén stap richting de room goal: naar de exit van de eerste room op de route"""
+        path = find_path(start, {goal}, neighbors)
+        if not path:
+            return None
+        step = (path[0][0] - start[0], path[0][1] - start[1])
+        direction = next(direction for direction, offset in EXIT_STEPS.items() if offset == step)
+        return self.leave(scene, direction)
+
+    def dungeon_neighbors(self, pos):
+        rooms = self.game.dungeon_manager.rooms
+        room = rooms[pos]
+        for direction, open_exit in room.exits.items():
+            if not open_exit or (room.locked_exits[direction] and not self.game.player.has_key):
+                continue
+            dx, dy = EXIT_STEPS[direction]
+            neighbor = (pos[0] + dx, pos[1] + dy)
+            if neighbor in rooms:
+                yield neighbor
+
+    # Doelen
+
+    def goal_keys(self, scene):
+        game = self.game
+        held = None
+        if game.in_cave:
+            if game.current_cave == 'sword' and not scene.sword.collected:
+                held = self.walk_to_rect(scene, scene.sword.rect)
+            else:
+                held = self.leave(scene, 'south')
+        elif self.wander_goal is None:
+            held = self.dungeon_goal(scene) if game.in_dungeon else self.overworld_goal(scene)
+        if held is None:
+            # Geen haalbaar doel (bijv. een blok dat klem zit): rondlopen door de wereld
+            held = self.wander(scene)
+        return held or ()
+
+    def wander(self, scene):
+        """Naar een willekeurige room van de overworld of dungeon, daarna weer het doel"""
+        game = self.game
+        if game.in_dungeon:
+            manager, neighbors = game.dungeon_manager, self.dungeon_neighbors
+            rooms = sorted(manager.rooms)
+        else:
+            manager, neighbors = game.room_manager, game.room_manager.get_neighbors
+            rooms = [(x, y) for x in range(manager.world_width) for y in range(manager.world_height)]
+        if self.wander_goal is None or self.wander_goal[0] != game.in_dungeon:
+            choices = [room for room in rooms if room != manager.current_room]
+            self.wander_goal = (game.in_dungeon, self.rng.choice(choices))
+        goal = self.wander_goal[1]
+        if goal == manager.current_room:
+            self.wander_goal = None
+            return ()
+        held = self.travel(scene, manager.current_room, goal, neighbors)
+        if held is None:
+            self.wander_goal = None
+        return held
+
+    def overworld_goal(self, scene):
+        game = self.game
+        room_manager = game.room_manager
+        room = room_manager.current_room
+        goal = STAIRS_ROOM if game.player.has_sword else SWORD_CAVE_ROOM
+        if room != goal:
+            return self.travel(scene, room, goal, room_manager.get_neighbors)
+
+        if not game.player.has_sword:
+            entrance, _ = game.cave_entrances[room]
+            return self.enter(scene, entrance.rect)
+        stairs = scene.hidden_stairs
+        if not stairs:
+            return None
+        if not stairs.revealed:
+            return self.push_block(scene, scene.pushable_block)
+        # Op de trap wachten tot hij open is
+        return self.walk_to_rect(scene, stairs.rect)
+
+    def dungeon_goal(self, scene):
+        game = self.game
+        dungeon = game.dungeon_manager
+        for name in DUNGEON_ITEMS:
+            if name == 'key' and game.player.has_key:
+                continue
+            for pos, room in dungeon.rooms.items():
+                item = getattr(room, name)
+                if item and not item.collected:
+                    break
+            else:
+                continue
+            if pos != dungeon.current_room:
+                return self.travel(scene, dungeon.current_room, pos, self.dungeon_neighbors)
+            held = self.walk_to_rect(scene, item.rect)
+            if held is None and getattr(room, 'pushable_block_pushable', False):
+                # Het item ligt achter het blok
+                held = self.push_block(scene, room.pushable_block)
+            return held
+        return None
+
+    # Vechten en oppakken
+
+    def pick_enemy(self, scene):
+        """Dichtstbijzijnde vijand om aan te vallen (None als er geen is)"""
+        player = self.game.player
+        center_x, center_y = player.rect.center
+        in_dungeon = self.game.in_dungeon
+        nearest = None
+        nearest_distance = 0
+        for enemy in get_enemies(scene):
+            if not enemy.alive or self.ignored.get(enemy, 0) > self.frame:
+                continue
+            distance = math.hypot(enemy.rect.centerx - center_x, enemy.rect.centery - center_y)
+            if not in_dungeon and distance > BOT_ENGAGE_DISTANCE:
+                continue
+            if nearest is None or distance < nearest_distance:
+                nearest = enemy
+                nearest_distance = distance
+
+        # Vijanden die maar niet te raken zijn een tijd negeren
+        if nearest is not self.target:
+            self.target = nearest
+            self.target_frames = 0
+        elif nearest is not None:
+            self.target_frames += 1
+            if self.target_frames > BOT_GIVE_UP_FRAMES:
+                self.ignored[nearest] = self.frame + BOT_IGNORE_FRAMES
+                self.target = None
+                return None
+        return nearest
+
+    def fight(self, scene, enemy):
+        """Slaan als de vijand binnen het zwaard is, anders erheen"""
+        player = self.game.player
+        for facing, key in FACING_KEYS.items():
+            if player.get_attack_rect(facing).colliderect(enemy.rect):
+                if player.attack_cooldown == 0:
+                    return (key,), (pygame.K_SPACE,)
+                return (), ()
+
+        dx = enemy.rect.centerx - player.rect.centerx
+        dy = enemy.rect.centery - player.rect.centery
+        if player.rect.colliderect(enemy.rect):
+            # Te dichtbij voor het zwaard: een stukje terug
+            if abs(dx) >= abs(dy):
+                return (pygame.K_LEFT if dx > 0 else pygame.K_RIGHT,), ()
+            return (pygame.K_UP if dy > 0 else pygame.K_DOWN,), ()
+        if abs(dx) + abs(dy) > BOT_CHASE_DISTANCE:
+            held = self.walk_to_rect(scene, enemy.rect)
+            if held:
+                return held, ()
+        # Dichtbij: eerst op één lijn, dan ernaartoe
+        if abs(dx) >= abs(dy):
+            if abs(dy) > FIGHT_ALIGN:
+                return (pygame.K_DOWN if dy > 0 else pygame.K_UP,), ()
+            return (pygame.K_RIGHT if dx > 0 else pygame.K_LEFT,), ()
+        if abs(dx) > FIGHT_ALIGN:
+            return (pygame.K_RIGHT if dx > 0 else pygame.K_LEFT,), ()
+        return (pygame.K_DOWN if dy > 0 else pygame.K_UP,), ()
+
+    def pick_drop(self, scene):
+        """Dichtstbijzijnde drop of item om op te pakken (health alleen als dat nodig is)"""
+        player = self.game.player
+        drops = [drop for drop in getattr(scene, 'rupee_drops', ()) if not drop.collected]
+        if player.health < player.max_health:
+            drops.extend(drop for drop in getattr(scene, 'health_drops', ()) if not drop.collected)
+        drops.extend(item for item in getattr(scene, 'items', ()) if not item.collected)
+        center_x, center_y = player.rect.center
+        in_dungeon = self.game.in_dungeon
+        nearest = None
+        nearest_distance = 0
+        for drop in drops:
+            distance = math.hypot(drop.rect.centerx - center_x, drop.rect.centery - center_y)
+            if (in_dungeon or distance <= BOT_DROP_DISTANCE) and (nearest is None or distance < nearest_distance):
+                nearest = drop
+                nearest_distance = distance
+        return nearest
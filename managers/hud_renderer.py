@@ -2,24 +2,58 @@ import pygame
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, HUD_HEIGHT, GAME_HEIGHT,
     HUD_BG_COLOR, HUD_BORDER_COLOR,
-    MINIMAP_ROOM_SIZE, MINIMAP_ROOM_SPACING, MINIMAP_START_X,
+    MINIMAP_ROOM_SIZE, MINIMAP_ROOM_SPACING, MINIMAP_START_X, MINIMAP_WINDOW_WIDTH, MINIMAP_WINDOW_HEIGHT,
     MINIMAP_VISITED_ROOM_COLOR, MINIMAP_CURRENT_ROOM_COLOR, MINIMAP_UNVISITED_ROOM_COLOR,
     HEART_SIZE, HEART_SPACING, HEART_FULL_COLOR, HEART_EMPTY_COLOR,
     KEY_COLOR, KEY_DARK_COLOR,
     GAME_OVER_TEXT_COLOR, GAME_OVER_SUBTITLE_COLOR, OVERLAY_COLOR
 )
+from managers.text_cache import get_text_cache
 
 class HUDRenderer:
     def __init__(self, screen):
         self.screen = screen
 
+        # Gecachte HUD laag (de rand onderaan loopt één pixel door in het speelveld)
+        self.hud_surface = pygame.Surface((SCREEN_WIDTH, HUD_HEIGHT + 1))
+        self.hud_state = None  # State waarmee hud_surface voor het laatst getekend is
+        self.dirty = True
+
+    def mark_dirty(self):
+        """Forceer dat de HUD laag bij de volgende render opnieuw getekend wordt"""
+        self.dirty = True
+
+    def get_hud_state(self, player, room_manager, in_dungeon, dungeon_manager):
+        """Alles waar de HUD van afhangt - de laag wordt alleen herbouwd als dit verandert"""
+        if in_dungeon:
+            minimap_state = (dungeon_manager.current_room, tuple(sorted(dungeon_manager.visited_rooms)))
+        else:
+            minimap_state = (room_manager.current_room, room_manager.world_width, room_manager.world_height)
+        return (player.health, player.max_health, player.rupees, player.has_key,
+                in_dungeon, minimap_state)
+
     def render_hud(self, player, room_manager, in_dungeon, dungeon_manager):
-        """Render de HUD bar bovenaan het scherm"""
+        """Render de HUD bar bovenaan het scherm
+
+        Returns: True als de HUD er anders uitziet dan bij de vorige render
+        """
+        state = self.get_hud_state(player, room_manager, in_dungeon, dungeon_manager)
+        changed = self.dirty or state != self.hud_state
+        if changed:
+            self.build_hud(player, room_manager, in_dungeon, dungeon_manager)
+            self.hud_state = state
+            self.dirty = False
+
+        self.screen.blit(self.hud_surface, (0, 0))
+        return changed
+
+    def build_hud(self, player, room_manager, in_dungeon, dungeon_manager):
+        """Teken de complete HUD op de gecachte laag"""
         # Teken HUD achtergrond
-        pygame.draw.rect(self.screen, HUD_BG_COLOR, (0, 0, SCREEN_WIDTH, HUD_HEIGHT))
+        pygame.draw.rect(self.hud_surface, HUD_BG_COLOR, (0, 0, SCREEN_WIDTH, HUD_HEIGHT))
 
         # Teken een rand onderaan de HUD
-        pygame.draw.line(self.screen, HUD_BORDER_COLOR, (0, HUD_HEIGHT - 1), (SCREEN_WIDTH, HUD_HEIGHT - 1), 2)
+        pygame.draw.line(self.hud_surface, HUD_BORDER_COLOR, (0, HUD_HEIGHT - 1), (SCREEN_WIDTH, HUD_HEIGHT - 1), 2)
 
         # Render minimap (links)
         self.render_minimap(room_manager, in_dungeon, dungeon_manager)
@@ -70,27 +104,33 @@ class HUDRenderer:
                     color = MINIMAP_UNVISITED_ROOM_COLOR
 
                 # Teken room blokje
-                pygame.draw.rect(self.screen, color,
+                pygame.draw.rect(self.hud_surface, color,
                                (screen_x, screen_y, MINIMAP_ROOM_SIZE, MINIMAP_ROOM_SIZE))
         else:
-            # Render overworld minimap
-            start_y = (HUD_HEIGHT - (room_manager.world_height * (MINIMAP_ROOM_SIZE + MINIMAP_ROOM_SPACING))) // 2
-
-            # Teken alle rooms in de wereld
-            for y in range(room_manager.world_height):
-                for x in range(room_manager.world_width):
+            # Render overworld minimap - in grote werelden alleen een venster rond de huidige room
+            window_width = min(room_manager.world_width, MINIMAP_WINDOW_WIDTH)
+            window_height = min(room_manager.world_height, MINIMAP_WINDOW_HEIGHT)
+            current_x, current_y = room_manager.current_room
+            window_x = max(0, min(current_x - window_width // 2, room_manager.world_width - window_width))
+            window_y = max(0, min(current_y - window_height // 2, room_manager.world_height - window_height))
+
+            start_y = (HUD_HEIGHT - (window_height * (MINIMAP_ROOM_SIZE + MINIMAP_ROOM_SPACING))) // 2
+
+            # Teken alle rooms in het venster
+            for row in range(window_height):
+                for column in range(window_width):
                     # Bereken positie van dit room blokje
-                    block_x = MINIMAP_START_X + (x * (MINIMAP_ROOM_SIZE + MINIMAP_ROOM_SPACING))
-                    block_y = start_y + (y * (MINIMAP_ROOM_SIZE + MINIMAP_ROOM_SPACING))
+                    block_x = MINIMAP_START_X + (column * (MINIMAP_ROOM_SIZE + MINIMAP_ROOM_SPACING))
+                    block_y = start_y + (row * (MINIMAP_ROOM_SIZE + MINIMAP_ROOM_SPACING))
 
                     # Check of dit de huidige room is
-                    if (x, y) == room_manager.current_room:
+                    if (window_x + column, window_y + row) == room_manager.current_room:
                         color = MINIMAP_CURRENT_ROOM_COLOR
                     else:
                         color = MINIMAP_VISITED_ROOM_COLOR
 
                     # Teken het room blokje
-                    pygame.draw.rect(self.screen, color, (block_x, block_y, MINIMAP_ROOM_SIZE, MINIMAP_ROOM_SIZE))
+                    pygame.draw.rect(self.hud_surface, color, (block_x, block_y, MINIMAP_ROOM_SIZE, MINIMAP_ROOM_SIZE))
 
     def render_hearts(self, player):
         """Teken hartjes in de HUD"""
@@ -120,8 +160,8 @@ class HUDRenderer:
 
         # Teken een simpel hart met cirkels en een driehoek
         # Twee bovencirkels
-        pygame.draw.circle(self.screen, heart_color, (x + size // 4, y + size // 3), size // 4)
-        pygame.draw.circle(self.screen, heart_color, (x + 3 * size // 4, y + size // 3), size // 4)
+        pygame.draw.circle(self.hud_surface, heart_color, (x + size // 4, y + size // 3), size // 4)
+        pygame.draw.circle(self.hud_surface, heart_color, (x + 3 * size // 4, y + size // 3), size // 4)
 
         # Onderste driehoek
         points = [
@@ -129,17 +169,17 @@ class HUDRenderer:
             (x + size, y + size // 3),
             (x + size // 2, y + size)
         ]
-        pygame.draw.polygon(self.screen, heart_color, points)
+        pygame.draw.polygon(self.hud_surface, heart_color, points)
 
         # Als half hart, teken grijze helft over de rechterkant
         if state == 'half':
-            pygame.draw.circle(self.screen, HEART_EMPTY_COLOR, (x + 3 * size // 4, y + size // 3), size // 4)
+            pygame.draw.circle(self.hud_surface, HEART_EMPTY_COLOR, (x + 3 * size // 4, y + size // 3), size // 4)
             right_points = [
                 (x + size // 2, y + size // 3),
                 (x + size, y + size // 3),
                 (x + size // 2, y + size)
             ]
-            pygame.draw.polygon(self.screen, HEART_EMPTY_COLOR, right_points)
+            pygame.draw.polygon(self.hud_surface, HEART_EMPTY_COLOR, right_points)
 
     def render_inventory(self, player):
         """Render inventory items in de HUD (midden-rechts)"""
@@ -170,10 +210,10 @@ class HUDRenderer:
         ]
 
         # Groen-geel gradient effect: teken meerdere lagen
-        pygame.draw.polygon(self.screen, (100, 200, 50), points)  # Groen-geel basis
+        pygame.draw.polygon(self.hud_surface, (100, 200, 50), points)  # Groen-geel basis
 
         # Donkere rand voor contrast
-        pygame.draw.polygon(self.screen, (50, 100, 25), points, 2)
+        pygame.draw.polygon(self.hud_surface, (50, 100, 25), points, 2)
 
         # Highlight voor glans effect (kleine witte driehoek bovenin)
         highlight_points = [
@@ -181,12 +221,11 @@ class HUDRenderer:
             (rupee_center_x + 4, rupee_center_y - 4),
             (rupee_center_x, rupee_center_y + 2),
         ]
-        pygame.draw.polygon(self.screen, (200, 255, 150), highlight_points)
+        pygame.draw.polygon(self.hud_surface, (200, 255, 150), highlight_points)
 
         # Teken teller rechts naast het symbool
-        font = pygame.font.Font(None, 28)
-        count_text = font.render(f"x {count}", True, (255, 255, 255))
-        self.screen.blit(count_text, (x + rupee_size + 8, y + 5))
+        count_text = get_text_cache().render(f"x {count}", 28, (255, 255, 255))
+        self.hud_surface.blit(count_text, (x + rupee_size + 8, y + 5))
 
     def draw_key_icon(self, x, y, size):
         """Teken een sleutel icoon in de HUD"""
@@ -197,13 +236,13 @@ class HUDRenderer:
         # Hoofd van de sleutel (cirkel)
         head_radius = size // 3
         head_center = (x + head_radius, y + head_radius)
-        pygame.draw.circle(self.screen, color, head_center, head_radius)
-        pygame.draw.circle(self.screen, dark_color, head_center, head_radius // 2)
+        pygame.draw.circle(self.hud_surface, color, head_center, head_radius)
+        pygame.draw.circle(self.hud_surface, dark_color, head_center, head_radius // 2)
 
         # Steel van de sleutel
         shaft_start = (x + head_radius, y + head_radius * 2)
         shaft_end = (x + head_radius, y + size)
-        pygame.draw.line(self.screen, color, shaft_start, shaft_end, 4)
+        pygame.draw.line(self.hud_surface, color, shaft_start, shaft_end, 4)
 
         # Tanden van de sleutel
         tooth_width = 6
@@ -211,9 +250,9 @@ class HUDRenderer:
         tooth1_y = y + size - 10
         tooth2_y = y + size - 5
 
-        pygame.draw.rect(self.screen, color,
+        pygame.draw.rect(self.hud_surface, color,
                         (x + head_radius, tooth1_y, tooth_width, tooth_height))
-        pygame.draw.rect(self.screen, color,
+        pygame.draw.rect(self.hud_surface, color,
                         (x + head_radius, tooth2_y, tooth_width, tooth_height))
 
     def render_game_over(self, player):
@@ -227,13 +266,12 @@ class HUDRenderer:
 
             # Game Over tekst
             try:
-                font = pygame.font.Font(None, 74)
-                text = font.render('GAME OVER', True, GAME_OVER_TEXT_COLOR)
+                text_cache = get_text_cache()
+                text = text_cache.render('GAME OVER', 74, GAME_OVER_TEXT_COLOR)
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
                 self.screen.blit(text, text_rect)
 
-                font_small = pygame.font.Font(None, 36)
-                restart_text = font_small.render('Press ESC to quit', True, GAME_OVER_SUBTITLE_COLOR)
+                restart_text = text_cache.render('Press ESC to quit', 36, GAME_OVER_SUBTITLE_COLOR)
                 restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
                 self.screen.blit(restart_text, restart_rect)
             except:
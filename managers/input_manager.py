@@ -0,0 +1,76 @@
+"""
+Input bronnen - het toetsenbord voor normaal spelen, of een script voor headless simulatie
+"""
+import pygame
+
+
+class KeyboardInput:
+    """Leest input rechtstreeks van pygame (normaal spel met venster)"""
+
+    def get_events(self):
+        """Geef de events van dit frame terug"""
+        return pygame.event.get()
+
+    def get_pressed(self):
+        """Geef de ingedrukte toetsen terug (zelfde vorm als pygame.key.get_pressed)"""
+        return pygame.key.get_pressed()
+
+
+class KeyState:
+    """Minimale vervanger van pygame.key.get_pressed() op basis van een set toetsen"""
+
+    def __init__(self, held=frozenset()):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    """Voert een vooraf bepaald script van toetsen af, één entry per frame
+
+    Elke entry is óf een verzameling vastgehouden toetsen (KEYDOWN events worden
+    afgeleid uit de toetsen die dit frame nieuw zijn), óf een tuple (held, pressed)
+    met expliciete KEYDOWN toetsen. Zonder script kan de input per frame gezet
+    worden met set_keys().
+    """
+
+    def __init__(self, script=None):
+        self.script = iter(script) if script is not None else None
+        self.finished = False
+        self.held = frozenset()
+        self.pressed = frozenset()
+        self.key_state = KeyState(self.held)
+
+    def set_keys(self, held, pressed=None):
+        """Zet de input voor het volgende frame"""
+        held = frozenset(held)
+        if pressed is None:
+            # Nieuw ingedrukte toetsen geven een KEYDOWN event
+            pressed = held - self.held
+        self.held = held
+        self.pressed = frozenset(pressed)
+        self.key_state = KeyState(held)
+
+    def get_events(self):
+        """Ga naar het volgende frame van het script en geef de KEYDOWN events terug"""
+        if self.script is not None:
+            try:
+                entry = next(self.script)
+            except StopIteration:
+                # Script is op - laat alle toetsen los
+                self.finished = True
+                entry = ()
+
+            if isinstance(entry, tuple) and len(entry) == 2 and not isinstance(entry[0], int):
+                self.set_keys(entry[0], entry[1])
+            else:
+                self.set_keys(entry)
+
+        pressed = self.pressed
+        # KEYDOWN events gelden maar één frame
+        self.pressed = frozenset()
+        return [pygame.event.Event(pygame.KEYDOWN, key=key) for key in pressed]
+
+    def get_pressed(self):
+        return self.key_state
@@ -0,0 +1,161 @@
+"""
+InputRecorder en ReplayInput - Sessies opnemen als compacte bitmasks en frame-exact afspelen
+"""
+import os
+import struct
+import pygame
+from managers.input_manager import KeyState
+
+RECORDING_MAGIC = b'SMIR'
+RECORDING_VERSION = 1
+
+# Toetsen die vastgehouden worden (beweging) en toetsen die alleen als KEYDOWN tellen.
+# F5/F9 (quicksave/quickload) gaan bewust niet mee: die hangen af van een bestand op disk.
+HELD_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+EVENT_KEYS = (pygame.K_SPACE, pygame.K_m, pygame.K_ESCAPE)
+
+# Eén frame = één 16-bit mask: vastgehouden toetsen, KEYDOWN toetsen en QUIT
+EVENT_SHIFT = len(HELD_KEYS)
+QUIT_BIT = 1 << (EVENT_SHIFT + len(EVENT_KEYS))
+MAX_RUN = 0xFFFF
+
+_HEADER = struct.Struct('<4sHQI')  # magic, versie, world seed, aantal frames
+_RUN = struct.Struct('<HH')  # frame mask, aantal frames achter elkaar
+
+
+def held_mask(key_state):
+    """Bitmask van de vastgehouden toetsen (uit get_pressed())"""
+    mask = 0
+    for bit, key in enumerate(HELD_KEYS):
+        if key_state[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def event_mask(events):
+    """Bitmask van de KEYDOWN events en QUIT die de game gebruikt"""
+    mask = 0
+    for event in events:
+        if event.type == pygame.QUIT:
+            mask |= QUIT_BIT
+        elif event.type == pygame.KEYDOWN and event.key in EVENT_KEYS:
+            mask |= 1 << (EVENT_SHIFT + EVENT_KEYS.index(event.key))
+    return mask
+
+
+def mask_to_input(mask):
+    """Zet een frame mask terug om naar (vastgehouden toetsen, events)"""
+    held = frozenset(key for bit, key in enumerate(HELD_KEYS) if mask & (1 << bit))
+    events = [pygame.event.Event(pygame.KEYDOWN, key=key) for bit, key in enumerate(EVENT_KEYS)
+              if mask & (1 << (EVENT_SHIFT + bit))]
+    if mask & QUIT_BIT:
+        events.append(pygame.event.Event(pygame.QUIT))
+    return held, events
+
+
+class Recording:
+    """Run-length encoded input van een sessie: een lijst van [mask, aantal frames]"""
+
+    def __init__(self, seed=0, runs=None):
+        self.seed = seed
+        self.runs = runs if runs is not None else []
+
+    def __len__(self):
+        return sum(count for _, count in self.runs)
+
+    def append(self, mask):
+        """Voeg één frame toe (verlengt de laatste run als de input gelijk bleef)"""
+        if self.runs and self.runs[-1][0] == mask and self.runs[-1][1] < MAX_RUN:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+
+    def frames(self):
+        """Alle frame masks achter elkaar"""
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
+
+    def to_bytes(self):
+        parts = [_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, self.seed, len(self))]
+        parts.extend(_RUN.pack(mask, count) for mask, count in self.runs)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, frame_count = _HEADER.unpack_from(data, 0)
+        if magic != RECORDING_MAGIC:
+            raise ValueError("Geen input opname")
+        if version != RECORDING_VERSION:
+            raise ValueError(f"Onbekende opname versie {version}")
+        runs = [list(run) for run in _RUN.iter_unpack(data[_HEADER.size:])]
+        recording = cls(seed, runs)
+        if len(recording) != frame_count:
+            raise ValueError("Opname is afgekapt")
+        return recording
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class InputRecorder:
+    """Input bron die een andere bron doorgeeft en elk frame opneemt
+
+    get_events() leest de events en de toetsen van de onderliggende bron één keer per
+    frame; get_pressed() geeft daarna precies de opgenomen toetsen terug. De game ziet
+    dus dezelfde input als een latere replay, ook als er tussendoor toetsen veranderen.
+    """
+
+    def __init__(self, source, seed=0):
+        self.source = source
+        self.recording = Recording(seed)
+        self.key_state = KeyState()
+
+    @property
+    def finished(self):
+        return getattr(self.source, 'finished', False)
+
+    def get_events(self):
+        events = self.source.get_events()
+        mask = held_mask(self.source.get_pressed())
+        self.key_state = KeyState(mask_to_input(mask)[0])
+        self.recording.append(mask | event_mask(events))
+        return events
+
+    def get_pressed(self):
+        return self.key_state
+
+    def save(self, path):
+        self.recording.save(path)
+
+
+class ReplayInput:
+    """Speelt een Recording frame voor frame af via dezelfde update route als het toetsenbord"""
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.frames = recording.frames()
+        self.finished = False
+        self.key_state = KeyState()
+
+    def get_events(self):
+        mask = next(self.frames, None)
+        if mask is None:
+            # Opname is op - laat alle toetsen los
+            self.finished = True
+            mask = 0
+        held, events = mask_to_input(mask)
+        self.key_state = KeyState(held)
+        return events
+
+    def get_pressed(self):
+        return self.key_state
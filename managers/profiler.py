@@ -0,0 +1,245 @@
+"""
+Profiler - Tijd per subsysteem (perf_counter_ns scopes) met een overlay in de HUD
+"""
+import time
+import numpy as np
+import pygame
+from constants import (
+    SCREEN_WIDTH, HUD_HEIGHT, PROFILER_WINDOW, PROFILER_REFRESH_FRAMES,
+    PROFILER_FONT_SIZE, PROFILER_BG_COLOR, PROFILER_TEXT_COLOR
+)
+from managers.text_cache import get_text_cache
+
+# De scopes die Game zelf meet (naast de geregistreerde check_* methodes)
+FRAME_SCOPES = ('frame', 'events', 'update.overworld', 'update.cave', 'update.dungeon',
+                'render.scene', 'render.hud', 'display')
+
+
+class _NullScope:
+    """Scope die niets doet (profiler uit)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _TrackedScope(_Scope):
+    """Scope die de allocation tracker ook laat weten welk subsysteem bezig is"""
+    __slots__ = ()
+
+    def __enter__(self):
+        self.profiler.tracker.enter(self.name)
+        return super().__enter__()
+
+    def __exit__(self, *exc):
+        super().__exit__(*exc)
+        self.profiler.tracker.exit()
+        return False
+
+
+class Profiler:
+    """Meet hoeveel tijd elk subsysteem per frame kost
+
+    Code meet een stuk met `with profiler.scope('naam'):`; managers kunnen met
+    register() in één keer worden aangesloten (elke check_* methode wordt een scope).
+    Per scope blijven de laatste `window` metingen in een ring buffer staan, waar
+    p50/p95/p99 uit berekend worden.
+
+    Uitgeschakeld geeft scope() een gedeelde lege context terug en zijn de
+    geregistreerde methodes weer de originele, dus de kosten zijn dan vrijwel nul.
+    Of de overlay te zien is staat daar los van (overlay_visible): telemetry en de
+    allocation tracker meten ook zonder overlay.
+    """
+
+    def __init__(self, window=PROFILER_WINDOW, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.samples = {}  # scope naam -> ring buffer met nanoseconden
+        self.counts = {}  # scope naam -> totaal aantal metingen
+        self.frame = {}  # scope naam -> nanoseconden in de huidige frame (voor telemetry)
+        self.registered = []  # (object, prefix, methode namen)
+        self.tracker = None  # AllocationTracker die de open scopes moet weten
+        self.overlay_visible = False
+        self.overlay = None
+        self.overlay_age = 0
+
+    def scope(self, name):
+        """Context manager die de tijd van het blok onder `name` bijhoudt"""
+        if not self.enabled:
+            return _NULL_SCOPE
+        if self.tracker:
+            return _TrackedScope(self, name)
+        return _Scope(self, name)
+
+    def add(self, name, nanoseconds):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = np.zeros(self.window, dtype=np.int64)
+            self.counts[name] = 0
+        count = self.counts[name]
+        samples[count % self.window] = nanoseconds
+        self.counts[name] = count + 1
+        self.frame[name] = self.frame.get(name, 0) + nanoseconds
+
+    def take_frame(self):
+        """Tijden van de afgelopen frame per scope (ns) - begint daarna een nieuwe frame"""
+        frame = self.frame
+        self.frame = {}
+        return frame
+
+    def scope_names(self):
+        """Alle scopes die gemeten kunnen worden (ook als ze nog niet voorkwamen)"""
+        names = list(FRAME_SCOPES)
+        for _, prefix, methods in self.registered:
+            names.extend(f"{prefix}.{name}" for name in methods)
+        return names
+
+    def register(self, obj, prefix, methods=None):
+        """Meet alle check_* methodes (of `methods`) van obj als scope 'prefix.methode'"""
+        if methods is None:
+            methods = [name for name in dir(type(obj))
+                       if name.startswith('check_') and callable(getattr(obj, name))]
+        self.registered.append((obj, prefix, methods))
+        if self.enabled:
+            self._wrap(obj, prefix, methods)
+
+    def _wrap(self, obj, prefix, methods):
+        for name in methods:
+            setattr(obj, name, self._timed(getattr(obj, name), f"{prefix}.{name}"))
+
+    @staticmethod
+    def _unwrap(obj, methods):
+        # De wrapper staat op de instance, de originele methode op de class
+        for name in methods:
+            obj.__dict__.pop(name, None)
+
+    def _timed(self, method, name):
+        add = self.add
+        perf_counter_ns = time.perf_counter_ns
+        tracker = self.tracker
+
+        if tracker:
+            def timed(*args, **kwargs):
+                tracker.enter(name)
+                start = perf_counter_ns()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    add(name, perf_counter_ns() - start)
+                    tracker.exit()
+            return timed
+
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                add(name, perf_counter_ns() - start)
+        return timed
+
+    def set_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        if not enabled and self.tracker:
+            # Zonder scopes zou de tracker alles aan 'overig' toeschrijven
+            raise RuntimeError("Profiler kan niet uit zolang er een allocation tracker aan hangt")
+        self.enabled = enabled
+        for obj, prefix, methods in self.registered:
+            if enabled:
+                self._wrap(obj, prefix, methods)
+            else:
+                self._unwrap(obj, methods)
+        self.overlay = None
+
+    def set_tracker(self, tracker):
+        """Koppel een AllocationTracker aan de scopes (None = loskoppelen)"""
+        self.tracker = tracker
+        if self.enabled:
+            # Wrappers opnieuw maken, met of zonder tracker
+            for obj, prefix, methods in self.registered:
+                self._unwrap(obj, methods)
+                self._wrap(obj, prefix, methods)
+
+    def show_overlay(self, visible):
+        """Overlay tonen of verbergen; tonen zet de profiler ook aan, verbergen zet hem niet uit"""
+        self.overlay_visible = visible
+        self.overlay = None
+        if visible:
+            self.set_enabled(True)
+
+    def reset(self):
+        self.samples.clear()
+        self.counts.clear()
+        self.frame = {}
+
+    def get_percentiles(self, name):
+        """(p50, p95, p99) in milliseconden over de laatste metingen van een scope"""
+        samples = self.samples[name][:min(self.counts[name], self.window)]
+        return tuple(np.percentile(samples, (50, 95, 99)) / 1e6)
+
+    def get_stats(self):
+        """[(naam, p50, p95, p99)] gesorteerd op p95, duurste eerst"""
+        stats = [(name,) + self.get_percentiles(name) for name in self.samples]
+        stats.sort(key=lambda row: -row[2])
+        return stats
+
+    def report(self):
+        """Tabel met alle scopes als tekst (bijv. na een headless run)"""
+        lines = [f"{'scope':<44} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)"]
+        for name, p50, p95, p99 in self.get_stats():
+            lines.append(f"{name:<44} {p50:8.3f} {p95:8.3f} {p99:8.3f}")
+        return '\n'.join(lines)
+
+    def render_overlay(self, screen):
+        """Teken de duurste scopes over de HUD (alleen als de overlay aan staat)
+
+        De tekst wordt maar eens per PROFILER_REFRESH_FRAMES frames opnieuw gerenderd.
+        """
+        if not self.overlay_visible or not self.enabled:
+            return
+        self.overlay_age += 1
+        if self.overlay is None or self.overlay_age >= PROFILER_REFRESH_FRAMES:
+            self.overlay = self._build_overlay()
+            self.overlay_age = 0
+        screen.blit(self.overlay, (0, 0))
+
+    def _build_overlay(self):
+        overlay = pygame.Surface((SCREEN_WIDTH, HUD_HEIGHT))
+        overlay.fill(PROFILER_BG_COLOR)
+        # Direct via het font: steeds andere getallen zouden de text cache leegspoelen
+        font = get_text_cache().get_font(PROFILER_FONT_SIZE)
+        line_height = font.get_linesize()
+        rows = max(1, (HUD_HEIGHT - 4) // line_height)
+        column_width = SCREEN_WIDTH // 2
+        number_width = column_width // 8
+        for i, (name, *percentiles) in enumerate(self.get_stats()[:rows * 2]):
+            x = (i // rows) * column_width + 4
+            y = (i % rows) * line_height + 2
+            overlay.blit(font.render(name.replace('.check_', '.'), True, PROFILER_TEXT_COLOR), (x, y))
+            # p50, p95 en p99 rechts uitgelijnd in de laatste drie kolommen
+            numbers_right = x + column_width - 12
+            for j, value in enumerate(percentiles):
+                text = font.render(f"{value:.2f}", True, PROFILER_TEXT_COLOR)
+                overlay.blit(text, (numbers_right - (2 - j) * number_width - text.get_width(), y))
+        return overlay
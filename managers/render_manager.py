@@ -0,0 +1,66 @@
+"""
+DirtyRectRenderer - Stuurt alleen de veranderde delen van het scherm naar het display
+"""
+import pygame
+from constants import GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, SCREEN_WIDTH
+
+
+class DirtyRectRenderer:
+    """Houdt bij welke rects vorige frame getekend zijn en herstelt alleen die
+
+    Per frame: de rects van vorige frame worden hersteld vanuit de statische laag van
+    de scene, de dynamische entities worden getekend en alleen de oude + nieuwe rects
+    gaan naar pygame.display.update(). Bij een nieuwe scene (room transition), een
+    verouderde statische laag of een overlay valt de game terug op een volledige flip.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.game_area = pygame.Rect(0, HUD_HEIGHT, GAME_WIDTH, GAME_HEIGHT)
+        self.hud_area = pygame.Rect(0, 0, SCREEN_WIDTH, HUD_HEIGHT)
+        self.scene = None
+        self.previous_rects = []
+        self.force_full_redraw = True
+
+    def request_full_redraw(self):
+        """Forceer een volledige flip bij de volgende frame"""
+        self.force_full_redraw = True
+
+    def needs_full_redraw(self, scene):
+        """Check of deze frame een volledige redraw nodig heeft"""
+        return (self.force_full_redraw or scene is not self.scene or
+                scene.static_layer is None)
+
+    def _clip(self, rects):
+        """Knip rects bij tot het speelveld en gooi lege rects weg"""
+        clipped = []
+        for rect in rects:
+            rect = rect.clip(self.game_area)
+            if rect.width > 0 and rect.height > 0:
+                clipped.append(rect)
+        return clipped
+
+    def restore_background(self, scene, hud_height=HUD_HEIGHT):
+        """Herstel de statische laag onder alles wat vorige frame getekend is"""
+        layer = scene.get_static_layer(hud_height)
+        for rect in self.previous_rects:
+            self.screen.blit(layer, rect, rect)
+
+    def present(self, scene, rects, hud_changed=True):
+        """Stuur alleen de oude en nieuwe dirty rects naar het display"""
+        rects = self._clip(rects)
+        update_rects = self.previous_rects + rects
+        if hud_changed:
+            update_rects.append(self.hud_area)
+        pygame.display.update(update_rects)
+
+        self.scene = scene
+        self.previous_rects = rects
+
+    def present_full(self, scene, rects):
+        """Volledige flip - onthoud de rects zodat de volgende frame weer dirty kan renderen"""
+        pygame.display.flip()
+
+        self.scene = scene
+        self.previous_rects = self._clip(rects)
+        self.force_full_redraw = False
@@ -0,0 +1,341 @@
+"""
+SaveManager - Binaire snapshot van de volledige game state (checkpoint en restore)
+"""
+import os
+import struct
+from entities.bat import Bat
+from entities.slime import Slime
+from rooms.cave_entrance import CaveEntrance
+from rooms.room_codec import COUNT, pack_list, pack_drops, unpack_drops
+from world.random_streams import STREAMS, seed_streams
+from constants import SAVE_FILE
+
+SAVE_MAGIC = b'SMSV'
+SAVE_VERSION = 1
+
+CAVE_CODES = {None: 0, 'sword': 1, 'hint': 2, 'shop': 3}
+CAVE_NAMES = {code: name for name, code in CAVE_CODES.items()}
+FACINGS = ('down', 'up', 'left', 'right')
+EXIT_DIRECTIONS = ('north', 'south', 'east', 'west')
+
+_HEADER = struct.Struct('<4sHQ')  # magic, versie, world seed
+_RANDOM_STATE = struct.Struct('<B625I?d')  # versie, Mersenne Twister state, gauss_next
+_GAME = struct.Struct('<??B?')  # in_cave, in_dungeon, huidige cave, game_won
+# x, y, facing, has_sword, attacking, attack cooldown, attack timer, has_key, rupees,
+# has_shield, max health, health, invincible, invincible timer, alive
+_PLAYER = struct.Struct('<ddB??HH?I?hh?H?')
+_POSITION = struct.Struct('<hh')
+_CAVE_ENTRANCE = struct.Struct('<hhhhhhhh')  # room x, y, rect x, y, breedte, hoogte, exit x, y
+_ROOM_HEADER = struct.Struct('<hhI')  # room x, y, lengte van de room bytes
+_WORLD = struct.Struct('<HHhh')  # breedte, hoogte, huidige room
+_CAVES = struct.Struct('<????????')  # zwaard + oude man, hint oude man, shop hart/schild/oude man
+_FIRE = struct.Struct('<IB')  # animatie timer, flicker offset
+_DUNGEON_ROOM = struct.Struct('<B??????')  # locked exits, key, heart container en triforce flags
+_TRIFORCE = struct.Struct('<Id')  # pulse timer, pulse scale
+_BLOCK = struct.Struct('<hh??')  # x, y, has_been_pushed, pushable
+# x, y, alive, health, richting x/y, timer, interval, vleugel timer, vleugels omhoog, damage cooldown
+_BAT = struct.Struct('<dd?bbbHHH?H')
+# x, y, groot, alive, health, richting x/y, timer, interval, wobble timer/offset, damage cooldown, gesplitst
+_SLIME = struct.Struct('<dd??bbbHHHbH?')
+# x, y, alive, health, richting, fireball cooldown, damage cooldown, hit flash
+_BOSS = struct.Struct('<dd?bbHHH')
+
+
+class SaveError(Exception):
+    """Snapshot is beschadigd of van een onbekende versie"""
+
+
+class _Reader:
+    """Leest structs achter elkaar uit een snapshot"""
+
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+
+    def read(self, layout):
+        try:
+            values = layout.unpack_from(self.data, self.offset)
+        except struct.error as e:
+            raise SaveError(f"Snapshot is afgekapt: {e}") from e
+        self.offset += layout.size
+        return values
+
+    def read_list(self, layout):
+        count, = self.read(COUNT)
+        return [self.read(layout) for _ in range(count)]
+
+    def read_with(self, decode, *args):
+        """Lees met een decoder uit de room codec: decode(data, offset, *args) -> nieuwe offset"""
+        try:
+            self.offset = decode(self.data, self.offset, *args)
+        except struct.error as e:
+            raise SaveError(f"Snapshot is afgekapt: {e}") from e
+
+    def read_bytes(self, size):
+        if self.offset + size > len(self.data):
+            raise SaveError("Snapshot is afgekapt")
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return chunk
+
+
+class SaveManager:
+    """Schrijft en leest een geversioneerde binaire snapshot van een Game
+
+    De snapshot bevat de world seed en de RNG streams, de speler, de game flags, de
+    cave entrances, elke overworld room waar de speler geweest is (via encode_room,
+    rooms die nog ongerept zijn worden na het laden opnieuw uit de seed gegenereerd),
+    de dungeon en de caves. Alles is struct data zonder pickle, dus een snapshot laden
+    voert geen code uit en kost een paar milliseconden.
+
+    Wat er niet in zit: pijlen en vuurballen in de lucht en de batch RNG van de
+    entity stores. Dezelfde snapshot geeft na het laden steeds hetzelfde verloop,
+    maar niet exact hetzelfde als het spel vanaf het moment van opslaan.
+    """
+
+    def __init__(self, path=SAVE_FILE):
+        self.path = path
+
+    def snapshot(self, game):
+        """Volledige game state als bytes"""
+        parts = [_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, game.seed)]
+        for stream in STREAMS.values():
+            version, state, gauss_next = stream.getstate()
+            parts.append(_RANDOM_STATE.pack(version, *state, gauss_next is not None, gauss_next or 0.0))
+
+        parts.append(_GAME.pack(game.in_cave, game.in_dungeon, CAVE_CODES[game.current_cave], game.game_won))
+        self._pack_player(parts, game.player)
+
+        pack_list(parts, _CAVE_ENTRANCE, [
+            (room_x, room_y, entrance.x, entrance.y, entrance.width, entrance.height, exit_x, exit_y)
+            for (room_x, room_y), (entrance, (exit_x, exit_y)) in sorted(game.cave_entrances.items())])
+
+        self._pack_overworld(parts, game.room_manager)
+        self._pack_caves(parts, game)
+        self._pack_dungeon(parts, game.dungeon_manager)
+        return b''.join(parts)
+
+    def restore(self, game, data):
+        """Zet een Game terug naar de toestand uit snapshot()"""
+        reader = _Reader(data)
+        magic, version, seed = reader.read(_HEADER)
+        if magic != SAVE_MAGIC:
+            raise SaveError("Geen save bestand")
+        if version != SAVE_VERSION:
+            raise SaveError(f"Onbekende save versie {version}")
+        random_states = [reader.read(_RANDOM_STATE) for _ in STREAMS]
+
+        # Ongerepte rooms worden uit de seed gegenereerd, dus eerst de seed terug
+        game.seed = seed
+        seed_streams(seed)
+
+        game.in_cave, game.in_dungeon, cave_code, game.game_won = reader.read(_GAME)
+        game.current_cave = CAVE_NAMES[cave_code]
+        self._restore_player(reader, game.player)
+
+        # Zelfde dict object: RoomManager en TransitionManager delen hem
+        game.cave_entrances.clear()
+        for room_x, room_y, x, y, width, height, exit_x, exit_y in reader.read_list(_CAVE_ENTRANCE):
+            game.cave_entrances[(room_x, room_y)] = (CaveEntrance(x, y, width, height), (exit_x, exit_y))
+
+        self._restore_overworld(reader, game.room_manager)
+        self._restore_caves(reader, game)
+        self._restore_dungeon(reader, game.dungeon_manager)
+
+        # RNG streams pas als laatste: het opbouwen van de rooms trekt zelf getallen
+        for stream, (version, *state, has_gauss, gauss_next) in zip(STREAMS.values(), random_states):
+            stream.setstate((version, tuple(state), gauss_next if has_gauss else None))
+
+        # Alles opnieuw tekenen en de juiste muziek
+        game.hud_renderer.mark_dirty()
+        if game.dirty_rect_renderer:
+            game.dirty_rect_renderer.request_full_redraw()
+        if game.in_dungeon:
+            game.audio_manager.switch_to_dungeon_music()
+        else:
+            game.audio_manager.switch_to_overworld_music()
+
+    def save(self, game, path=None):
+        """Schrijf een snapshot naar disk (via een tijdelijk bestand, dus nooit half geschreven)"""
+        path = path or self.path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(self.snapshot(game))
+        os.replace(temp_path, path)
+
+    def load(self, game, path=None):
+        """Laad een snapshot van disk
+
+        Returns: False als er geen save bestand is
+        """
+        path = path or self.path
+        if not os.path.exists(path):
+            return False
+        with open(path, 'rb') as f:
+            self.restore(game, f.read())
+        return True
+
+    def _pack_player(self, parts, player):
+        parts.append(_PLAYER.pack(
+            player.x, player.y, FACINGS.index(player.facing), player.has_sword, player.attacking,
+            player.attack_cooldown, player.attack_timer, player.has_key, player.rupees,
+            player.has_shield, player.max_health, player.health, player.invincible,
+            player.invincible_timer, player.alive))
+
+    def _restore_player(self, reader, player):
+        (player.x, player.y, facing, player.has_sword, player.attacking, player.attack_cooldown,
+         player.attack_timer, player.has_key, player.rupees, player.has_shield, player.max_health,
+         player.health, player.invincible, player.invincible_timer, player.alive) = reader.read(_PLAYER)
+        player.facing = FACINGS[facing]
+        player.rect.x = player.x
+        player.rect.y = player.y
+
+    def _pack_overworld(self, parts, room_manager):
+        x, y = room_manager.current_room
+        parts.append(_WORLD.pack(room_manager.world_width, room_manager.world_height, x, y))
+        encoded = room_manager.encode_rooms()
+        parts.append(COUNT.pack(len(encoded)))
+        for (room_x, room_y), data in sorted(encoded.items()):
+            parts.append(_ROOM_HEADER.pack(room_x, room_y, len(data)))
+            parts.append(data)
+
+    def _restore_overworld(self, reader, room_manager):
+        world_width, world_height, x, y = reader.read(_WORLD)
+        room_manager.world_width = world_width
+        room_manager.world_height = world_height
+        count, = reader.read(COUNT)
+        encoded = {}
+        for _ in range(count):
+            room_x, room_y, size = reader.read(_ROOM_HEADER)
+            encoded[(room_x, room_y)] = reader.read_bytes(size)
+        room_manager.restore_rooms((x, y), encoded)
+
+    def _pack_fires(self, parts, fires):
+        parts.extend(_FIRE.pack(fire.animation_timer, fire.flicker_offset) for fire in fires)
+
+    def _restore_fires(self, reader, fires):
+        for fire in fires:
+            fire.animation_timer, fire.flicker_offset = reader.read(_FIRE)
+
+    def _pack_caves(self, parts, game):
+        sword_cave, hint_cave, shop_cave = game.sword_cave_room, game.hint_cave_room, game.shop_cave_room
+        parts.append(_CAVES.pack(
+            sword_cave.sword.collected, sword_cave.old_man.visible, hint_cave.old_man.visible,
+            shop_cave.heart_purchased, shop_cave.heart_container.collected,
+            shop_cave.shield_purchased, shop_cave.shield.collected, shop_cave.old_man.visible))
+        for cave in (sword_cave, hint_cave, shop_cave):
+            self._pack_fires(parts, cave.fires)
+
+    def _restore_caves(self, reader, game):
+        sword_cave, hint_cave, shop_cave = game.sword_cave_room, game.hint_cave_room, game.shop_cave_room
+        (sword_cave.sword.collected, sword_cave.old_man.visible, hint_cave.old_man.visible,
+         shop_cave.heart_purchased, shop_cave.heart_container.collected,
+         shop_cave.shield_purchased, shop_cave.shield.collected, shop_cave.old_man.visible) = reader.read(_CAVES)
+        for cave in (sword_cave, hint_cave, shop_cave):
+            self._restore_fires(reader, cave.fires)
+            cave.invalidate_static_layer()
+
+    def _pack_dungeon(self, parts, dungeon_manager):
+        parts.append(_POSITION.pack(*dungeon_manager.current_room))
+        pack_list(parts, _POSITION, sorted(dungeon_manager.visited_rooms))
+
+        # De layout van de dungeon ligt vast, alleen de toestand per room gaat mee
+        for _, room in sorted(dungeon_manager.rooms.items()):
+            locked = sum(1 << i for i, direction in enumerate(EXIT_DIRECTIONS) if room.locked_exits[direction])
+            parts.append(_DUNGEON_ROOM.pack(
+                locked, room.key_revealed, bool(room.key and room.key.collected),
+                room.heart_container_revealed, bool(room.heart_container and room.heart_container.collected),
+                room.triforce_revealed, bool(room.triforce and room.triforce.collected)))
+            if room.triforce:
+                parts.append(_TRIFORCE.pack(room.triforce.pulse_timer, room.triforce.pulse_scale))
+            block = getattr(room, 'pushable_block', None)
+            if block:
+                parts.append(_BLOCK.pack(block.x, block.y, block.has_been_pushed,
+                                         getattr(room, 'pushable_block_pushable', False)))
+            self._pack_fires(parts, room.fires)
+
+            pack_list(parts, _BAT, [
+                (bat.x, bat.y, bat.alive, bat.health, bat.direction_x, bat.direction_y,
+                 bat.direction_change_timer, bat.direction_change_interval, bat.wing_flap_timer,
+                 bat.wings_up, bat.damage_cooldown)
+                for bat in room.bats])
+            pack_list(parts, _SLIME, [
+                (slime.x, slime.y, slime.is_large, slime.alive, slime.health, slime.direction_x,
+                 slime.direction_y, slime.direction_change_timer, slime.direction_change_interval,
+                 slime.wobble_timer, slime.wobble_offset, slime.damage_cooldown, slime.has_split)
+                for slime in room.slimes])
+            boss = room.boss
+            if boss:
+                parts.append(_BOSS.pack(boss.x, boss.y, boss.alive, boss.health, boss.direction,
+                                        boss.fireball_cooldown, boss.damage_cooldown, boss.hit_flash_timer))
+
+            pack_drops(parts, room)
+
+    def _restore_dungeon(self, reader, dungeon_manager):
+        dungeon_manager.current_room = reader.read(_POSITION)
+        dungeon_manager.visited_rooms = set(reader.read_list(_POSITION))
+
+        for _, room in sorted(dungeon_manager.rooms.items()):
+            (locked, room.key_revealed, key_collected, room.heart_container_revealed, heart_collected,
+             room.triforce_revealed, triforce_collected) = reader.read(_DUNGEON_ROOM)
+            for i, direction in enumerate(EXIT_DIRECTIONS):
+                room.locked_exits[direction] = bool(locked & (1 << i))
+            if room.key:
+                room.key.collected = key_collected
+            if room.heart_container:
+                room.heart_container.collected = heart_collected
+            if room.triforce:
+                room.triforce.collected = triforce_collected
+                room.triforce.pulse_timer, room.triforce.pulse_scale = reader.read(_TRIFORCE)
+            block = getattr(room, 'pushable_block', None)
+            if block:
+                block.x, block.y, block.has_been_pushed, room.pushable_block_pushable = reader.read(_BLOCK)
+                block.rect.topleft = (block.x, block.y)
+            self._restore_fires(reader, room.fires)
+
+            room.bats.clear()
+            room.bat_grid.clear()
+            for (x, y, alive, health, direction_x, direction_y, timer, interval, wing_flap_timer,
+                 wings_up, damage_cooldown) in reader.read_list(_BAT):
+                bat = Bat(x, y)
+                bat.rect.topleft = (int(x), int(y))
+                bat.health = health
+                bat.direction_x, bat.direction_y = direction_x, direction_y
+                bat.direction_change_timer = timer
+                bat.direction_change_interval = interval
+                bat.wing_flap_timer = wing_flap_timer
+                bat.wings_up = wings_up
+                bat.damage_cooldown = damage_cooldown
+                room.add_bat(bat)
+                bat.alive = alive
+
+            room.slimes.clear()
+            room.slime_grid.clear()
+            for (x, y, is_large, alive, health, direction_x, direction_y, timer, interval, wobble_timer,
+                 wobble_offset, damage_cooldown, has_split) in reader.read_list(_SLIME):
+                slime = Slime(x, y, is_large)
+                slime.health = health
+                slime.direction_x, slime.direction_y = direction_x, direction_y
+                slime.direction_change_timer = timer
+                slime.direction_change_interval = interval
+                slime.wobble_timer = wobble_timer
+                slime.wobble_offset = wobble_offset
+                slime.damage_cooldown = damage_cooldown
+                slime.has_split = has_split
+                room.add_slime(slime)
+                slime.alive = alive
+
+            boss = room.boss
+            if boss:
+                (boss.x, boss.y, boss.alive, boss.health, boss.direction, boss.fireball_cooldown,
+                 boss.damage_cooldown, boss.hit_flash_timer) = reader.read(_BOSS)
+                boss.rect.x = boss.x
+                boss.rect.y = boss.y
+            room.projectiles.clear()
+
+            reader.read_with(unpack_drops, room)
+
+            room.invalidate_static_layer()
@@ -0,0 +1,229 @@
+"""
+SpriteAtlas - Vooraf gebakken sprites voor alle procedureel getekende entities
+"""
+import os
+import json
+import hashlib
+import inspect
+import pygame
+from constants import (
+    SPRITE_CANVAS_MARGIN, SPRITE_ATLAS_WIDTH,
+    PLAYER_WIDTH, PLAYER_HEIGHT, MONSTER_WIDTH, MONSTER_HEIGHT,
+    ARCHER_WIDTH, ARCHER_HEIGHT, BAT_WIDTH, BAT_HEIGHT,
+    SLIME_LARGE_WIDTH, SLIME_LARGE_HEIGHT, BOSS_WIDTH, BOSS_HEIGHT, FIREBALL_RADIUS,
+    RUPEE_SIZE, TRIFORCE_WIDTH, TRIFORCE_HEIGHT, FIRE_WIDTH, FIRE_HEIGHT
+)
+
+ATLAS_IMAGE_NAME = 'sprite_atlas.png'
+ATLAS_INDEX_NAME = 'sprite_atlas.json'
+
+
+def _sprite_definitions():
+    """Alle sprites in de atlas: soort -> (teken functie, entity grootte, states)
+
+    De teken functie tekent één frame met de linkerbovenhoek van de entity op (x, y)
+    en krijgt de state als extra argumenten. De atlas key is (soort, *state).
+    """
+    # Pas hier importeren: de entities importeren deze module zelf voor render()
+    from entities.player import draw_player
+    from entities.monster import draw_monster
+    from entities.archer import draw_archer
+    from entities.bat import draw_bat
+    from entities.slime import draw_slime
+    from entities.boss import draw_boss, draw_fireball
+    from items.rupee import draw_rupee
+    from items.triforce import draw_triforce, get_pulse_scale, get_pulsed_size
+    from world.fire import draw_fire
+
+    slime_states = [(is_large, wobble) for is_large in (True, False) for wobble in range(-2, 3)]
+    # Pulse grootte bij de start (pulse_scale 1.0) en in elke fase van de animatie
+    triforce_states = sorted({get_pulsed_size(scale) for scale in
+                              [1.0] + [get_pulse_scale(timer) for timer in range(60)]})
+
+    return {
+        'player': (draw_player, (PLAYER_WIDTH, PLAYER_HEIGHT),
+                   [(facing, has_shield, attacking) for facing in ('down', 'up', 'left', 'right')
+                    for has_shield in (False, True) for attacking in (False, True)]),
+        'monster': (draw_monster, (MONSTER_WIDTH, MONSTER_HEIGHT), [()]),
+        'archer': (draw_archer, (ARCHER_WIDTH, ARCHER_HEIGHT), [()]),
+        'bat': (draw_bat, (BAT_WIDTH, BAT_HEIGHT), [(True,), (False,)]),
+        'slime': (draw_slime, (SLIME_LARGE_WIDTH, SLIME_LARGE_HEIGHT), slime_states),
+        'boss': (draw_boss, (BOSS_WIDTH, BOSS_HEIGHT), [()]),
+        'fireball': (draw_fireball, (FIREBALL_RADIUS * 2, FIREBALL_RADIUS * 2), [()]),
+        'rupee': (draw_rupee, (RUPEE_SIZE, RUPEE_SIZE),
+                  [(value, bounce) for value in (1, 5) for bounce in range(4)]),
+        'triforce': (draw_triforce, (TRIFORCE_WIDTH, TRIFORCE_HEIGHT), triforce_states),
+        'fire': (draw_fire, (FIRE_WIDTH, FIRE_HEIGHT), [(0,), (5,)]),
+    }
+
+
+class SpriteAtlas:
+    """Alle frames, richtingen en states van de entities als kant-en-klare Surfaces
+
+    bake() tekent elke state één keer met de bestaande pygame.draw code op een
+    transparant canvas, knipt het bij tot de getekende pixels en pakt alle frames in
+    één sheet. render() van een entity is daarna één dict lookup plus één blit, dus
+    de kosten per frame schalen met het aantal entities in plaats van het aantal
+    primitieven. Met een cache map wordt de sheet als PNG + JSON index opgeslagen en
+    de volgende keer ingeladen zolang de teken code niet veranderd is.
+
+    Een onbekende key (bijv. een state buiten de lijst) wordt bij het eerste gebruik
+    alsnog gebakken, dus de atlas hoeft nooit compleet te zijn.
+    """
+
+    def __init__(self):
+        self.frames = {}  # key -> (surface, offset_x, offset_y)
+        self.sheet = None
+        self.definitions = None
+        self.baked = False
+
+    def _get_definitions(self):
+        if self.definitions is None:
+            self.definitions = _sprite_definitions()
+        return self.definitions
+
+    def _draw_frame(self, key):
+        """Teken één frame en knip het bij tot de getekende pixels
+
+        Returns: (surface, offset_x, offset_y) met de offset t.o.v. de positie van de entity
+        """
+        draw, (width, height), _ = self._get_definitions()[key[0]]
+        margin = SPRITE_CANVAS_MARGIN
+        canvas = pygame.Surface((width + 2 * margin, height + 2 * margin), pygame.SRCALPHA)
+        draw(canvas, margin, margin, *key[1:])
+
+        bounds = canvas.get_bounding_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            bounds = pygame.Rect(margin, margin, 1, 1)
+        return canvas.subsurface(bounds).copy(), bounds.x - margin, bounds.y - margin
+
+    def get_signature(self):
+        """Hash van de bronbestanden met teken code en van de states
+
+        Na een wijziging in een van die bestanden wordt een oude disk cache genegeerd.
+        """
+        digest = hashlib.sha1()
+        source_files = {__file__}
+        for kind, (draw, size, states) in sorted(self._get_definitions().items()):
+            source_files.add(inspect.getsourcefile(draw))
+            digest.update(repr((kind, size, states)).encode())
+        for path in sorted(source_files):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def bake(self, cache_dir=None):
+        """Bak alle sprites (of laad ze uit cache_dir als die up-to-date is)"""
+        self.frames = {}
+        signature = self.get_signature() if cache_dir else None
+        if cache_dir and self.load(cache_dir, signature):
+            self.baked = True
+            return
+
+        drawn = {}
+        for kind, (_, _, states) in self._get_definitions().items():
+            for state in states:
+                key = (kind,) + tuple(state)
+                drawn[key] = self._draw_frame(key)
+        self._pack(drawn)
+        self.baked = True
+
+        if cache_dir:
+            self.save(cache_dir, signature)
+
+    def _pack(self, drawn):
+        """Pak alle frames in één sheet (shelf packing, hoogste frames eerst)"""
+        placements = {}
+        x = y = shelf_height = 0
+        for key in sorted(drawn, key=lambda k: -drawn[k][0].get_height()):
+            surface = drawn[key][0]
+            width, height = surface.get_size()
+            if x + width > SPRITE_ATLAS_WIDTH:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            placements[key] = pygame.Rect(x, y, width, height)
+            x += width
+            shelf_height = max(shelf_height, height)
+
+        self.sheet = pygame.Surface((SPRITE_ATLAS_WIDTH, y + shelf_height), pygame.SRCALPHA)
+        for key, rect in placements.items():
+            self.sheet.blit(drawn[key][0], rect)
+        self._convert_sheet()
+        self._slice(placements, {key: drawn[key][1:] for key in drawn})
+
+    def _convert_sheet(self):
+        """Zet de sheet om naar het pixel formaat van het display (sneller blitten)"""
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            self.sheet = self.sheet.convert_alpha()
+
+    def _slice(self, placements, offsets):
+        """Maak per frame een subsurface van de sheet"""
+        for key, rect in placements.items():
+            offset_x, offset_y = offsets[key]
+            self.frames[key] = (self.sheet.subsurface(rect), offset_x, offset_y)
+
+    def save(self, cache_dir, signature):
+        """Schrijf de sheet (PNG) en de frame index (JSON) naar cache_dir"""
+        os.makedirs(cache_dir, exist_ok=True)
+        index = {
+            'signature': signature,
+            'frames': [[list(key), list(surface.get_offset()) + list(surface.get_size()),
+                        offset_x, offset_y]
+                       for key, (surface, offset_x, offset_y) in self.frames.items()],
+        }
+        pygame.image.save(self.sheet, os.path.join(cache_dir, ATLAS_IMAGE_NAME))
+        with open(os.path.join(cache_dir, ATLAS_INDEX_NAME), 'w') as f:
+            json.dump(index, f)
+
+    def load(self, cache_dir, signature):
+        """Laad de sheet uit cache_dir
+
+        Returns: False als er geen (of een verouderde) cache is
+        """
+        index_path = os.path.join(cache_dir, ATLAS_INDEX_NAME)
+        image_path = os.path.join(cache_dir, ATLAS_IMAGE_NAME)
+        if not (os.path.exists(index_path) and os.path.exists(image_path)):
+            return False
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+            if index.get('signature') != signature:
+                return False
+            self.sheet = pygame.image.load(image_path)
+        except (OSError, ValueError, pygame.error):
+            return False
+
+        self._convert_sheet()
+        placements = {}
+        offsets = {}
+        for key, rect, offset_x, offset_y in index['frames']:
+            key = tuple(key)
+            placements[key] = pygame.Rect(rect)
+            offsets[key] = (offset_x, offset_y)
+        self._slice(placements, offsets)
+        return True
+
+    def get(self, key):
+        """Frame voor een key: (surface, offset_x, offset_y)"""
+        frame = self.frames.get(key)
+        if frame is None:
+            if not self.baked:
+                self.bake()
+                frame = self.frames.get(key)
+            if frame is None:
+                frame = self.frames[key] = self._draw_frame(key)
+        return frame
+
+    def blit(self, screen, key, x, y):
+        """Teken het frame voor key met de linkerbovenhoek van de entity op (x, y)"""
+        surface, offset_x, offset_y = self.get(key)
+        screen.blit(surface, (x + offset_x, y + offset_y))
+
+
+_sprite_atlas = SpriteAtlas()
+
+
+def get_sprite_atlas():
+    """De gedeelde atlas (wordt bij het eerste gebruik gebakken als Game dat niet al deed)"""
+    return _sprite_atlas
@@ -0,0 +1,152 @@
+"""
+Telemetry - Per-frame tijden en game state naar JSON lines of CSV (via een writer thread)
+"""
+import os
+import csv
+import json
+import queue
+import threading
+from constants import TELEMETRY_BATCH_FRAMES, TELEMETRY_QUEUE_BATCHES, TELEMETRY_CLOSE_TIMEOUT
+
+TELEMETRY_FORMATS = ('jsonl', 'csv')
+
+# Vaste kolommen van een record (de scope tijden komen erachter als '<scope>_ms';
+# de 'frame' scope zelf is total_ms)
+BASE_FIELDS = ('frame', 'total_ms', 'room_x', 'room_y', 'in_cave', 'cave', 'in_dungeon',
+               'monsters', 'archers', 'bats', 'slimes', 'boss', 'projectiles', 'drops')
+
+
+def count_alive(entities):
+    return sum(1 for entity in entities if entity.alive)
+
+
+def get_scene_counts(scene):
+    """Aantal levende vijanden, projectielen en drops in de huidige room/dungeon room/cave"""
+    boss = getattr(scene, 'boss', None)
+    projectiles = getattr(scene, 'projectiles', None)
+    return {
+        'monsters': count_alive(getattr(scene, 'monsters', ())),
+        'archers': count_alive(getattr(scene, 'archers', ())),
+        'bats': count_alive(getattr(scene, 'bats', ())),
+        'slimes': count_alive(getattr(scene, 'slimes', ())),
+        'boss': int(bool(boss and boss.alive)),
+        'projectiles': len(projectiles) if projectiles is not None else 0,
+        'drops': len(getattr(scene, 'health_drops', ())) + len(getattr(scene, 'rupee_drops', ())),
+    }
+
+
+class Telemetry:
+    """Schrijft elke frame een record weg zonder de game loop op te houden
+
+    record() bouwt alleen een dict en zet per TELEMETRY_BATCH_FRAMES frames een batch in
+    een begrensde wachtrij. Een achtergrond thread schrijft de batches naar disk. Als de
+    disk het niet bijhoudt en de wachtrij vol is, wordt de batch weggegooid (en geteld)
+    in plaats van te wachten.
+
+    De scope tijden komen uit de Profiler (die hiervoor aan moet staan). JSON lines
+    bevat alle scopes; CSV heeft vaste kolommen voor de scopes uit profiler.scope_names().
+    """
+
+    def __init__(self, path, profiler, file_format=None, batch_frames=TELEMETRY_BATCH_FRAMES,
+                 max_batches=TELEMETRY_QUEUE_BATCHES):
+        if file_format is None:
+            file_format = 'csv' if path.endswith('.csv') else 'jsonl'
+        if file_format not in TELEMETRY_FORMATS:
+            raise ValueError(f"Onbekend telemetry formaat {file_format}")
+        self.path = path
+        self.format = file_format
+        self.profiler = profiler
+        self.batch_frames = batch_frames
+        self.scopes = [scope for scope in profiler.scope_names() if scope != 'frame']
+        self.fields = list(BASE_FIELDS) + [f"{scope}_ms" for scope in self.scopes]
+
+        self.frame = 0
+        self.batch = []
+        self.dropped_frames = 0
+        self.error = None  # Fout waardoor de writer thread gestopt is
+        self.queue = queue.Queue(maxsize=max_batches)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.thread = threading.Thread(target=self._write_loop, name='telemetry-writer', daemon=True)
+        self.thread.start()
+
+    def record(self, game):
+        """Leg de afgelopen frame vast (aanroepen na update/render)"""
+        scopes = {name: ns / 1e6 for name, ns in self.profiler.take_frame().items()}
+        total_ms = scopes.pop('frame', 0.0)
+        # In een dungeon de positie binnen de dungeon, anders de overworld room
+        manager = game.dungeon_manager if game.in_dungeon else game.room_manager
+        room_x, room_y = manager.current_room
+        record = {
+            'frame': self.frame,
+            'total_ms': total_ms,
+            'room_x': room_x,
+            'room_y': room_y,
+            'in_cave': game.in_cave,
+            'cave': game.current_cave or '',
+            'in_dungeon': game.in_dungeon,
+        }
+        record.update(get_scene_counts(game.get_current_scene()))
+        record['scopes'] = scopes
+        self.batch.append(record)
+        self.frame += 1
+        if len(self.batch) >= self.batch_frames:
+            self._submit()
+
+    def _submit(self):
+        if not self.batch:
+            return
+        try:
+            self.queue.put_nowait(self.batch)
+        except queue.Full:
+            # Nooit wachten op de disk - liever een gat in de telemetry
+            self.dropped_frames += len(self.batch)
+        self.batch = []
+
+    def close(self):
+        """Schrijf de rest weg en wacht tot de writer thread klaar is
+
+        Blijft nooit hangen: is de writer gestopt (of de wachtrij na de timeout nog vol),
+        dan wordt er niet langer gewacht. Een fout van de writer komt hier opnieuw omhoog.
+        """
+        self._submit()
+        if self.thread.is_alive():
+            try:
+                self.queue.put(None, timeout=TELEMETRY_CLOSE_TIMEOUT)
+            except queue.Full:
+                pass
+            self.thread.join(TELEMETRY_CLOSE_TIMEOUT)
+        if self.error:
+            raise self.error
+
+    def _write_loop(self):
+        try:
+            self._write_batches()
+        except OSError as error:
+            # Bewaren voor close(); de game loop merkt er niets van
+            self.error = error
+
+    def _write_batches(self):
+        with open(self.path, 'w', newline='') as f:
+            writer = None
+            if self.format == 'csv':
+                writer = csv.writer(f)
+                writer.writerow(self.fields)
+            while True:
+                batch = self.queue.get()
+                if batch is None:
+                    break
+                if writer:
+                    writer.writerows(self._csv_row(record) for record in batch)
+                else:
+                    f.writelines(json.dumps(record, separators=(',', ':')) + '\n' for record in batch)
+                f.flush()
+
+    def _csv_row(self, record):
+        scopes = record['scopes']
+        row = [record[field] for field in BASE_FIELDS]
+        row[1] = round(row[1], 4)
+        row.extend(round(scopes.get(scope, 0.0), 4) for scope in self.scopes)
+        return row
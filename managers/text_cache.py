@@ -0,0 +1,73 @@
+"""
+TextCache - Gedeelde fonts en een LRU cache van gerenderde tekst
+"""
+from collections import OrderedDict
+import pygame
+from constants import TEXT_CACHE_MAX_ENTRIES, TEXT_CACHE_MAX_BYTES
+
+
+class TextCache:
+    """Maakt elk font één keer aan en rendert elke tekst maar één keer
+
+    Fonts worden per (naam, grootte) bewaard. Gerenderde tekst staat in een LRU cache
+    met key (font naam, grootte, tekst, kleur); bij een nieuwe tekst (bijv. een
+    andere rupee teller) wordt alleen die ene string gerasterd. De cache is begrensd
+    op aantal surfaces en op geschat geheugen; de minst recent gebruikte gaat eerst.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_MAX_ENTRIES, max_bytes=TEXT_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.fonts = {}  # (naam, grootte) -> pygame.font.Font
+        self.surfaces = OrderedDict()  # (naam, grootte, tekst, kleur) -> Surface
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size, name=None):
+        """Gedeeld font object (None = het standaard pygame font)"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def render(self, text, size, color, name=None):
+        """Gerenderde (anti-aliased) tekst - zelfde resultaat als Font.render(text, True, color)"""
+        key = (name, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(size, name).render(text, True, color)
+        self.surfaces[key] = surface
+        self.total_bytes += self._surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def _surface_bytes(self, surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _evict(self):
+        """Gooi de minst recent gebruikte teksten weg tot de cache binnen de grenzen valt"""
+        while len(self.surfaces) > 1 and (len(self.surfaces) > self.max_entries or
+                                          self.total_bytes > self.max_bytes):
+            _, surface = self.surfaces.popitem(last=False)
+            self.total_bytes -= self._surface_bytes(surface)
+
+    def clear(self):
+        self.surfaces.clear()
+        self.total_bytes = 0
+
+
+_text_cache = TextCache()
+
+
+def get_text_cache():
+    """De gedeelde text cache"""
+    return _text_cache
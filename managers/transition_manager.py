@@ -1,5 +1,5 @@
 import pygame
-from constants import GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS
+from constants import GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS, CAVE_EXIT_SIZE
 
 class TransitionManager:
     def __init__(self, collision_manager):
@@ -9,9 +9,9 @@ class TransitionManager:
         """Check of speler de grot verlaat"""
         # Exit is onderaan in het midden
         exit_rect = pygame.Rect(
-            GAME_WIDTH // 2 - 25,
+            GAME_WIDTH // 2 - CAVE_EXIT_SIZE // 2,
             HUD_HEIGHT + GAME_HEIGHT - WALL_THICKNESS,
-            50,
+            CAVE_EXIT_SIZE,
             WALL_THICKNESS
         )
 
@@ -206,11 +206,7 @@ class TransitionManager:
                                        test_y - player.height // 2,
                                        player.width, player.height)
 
-                has_collision = False
-                for obstacle in current_room.obstacles:
-                    if test_rect.colliderect(obstacle.rect):
-                        has_collision = True
-                        break
+                has_collision = current_room.rect_hits_obstacle(test_rect)
 
                 # Check pushable block
                 if not has_collision and current_room.pushable_block:
@@ -0,0 +1,191 @@
+"""
+GridEncoder - Symbolische room toestand als kanalen x rijen x kolommen grid (zonder te renderen)
+"""
+import numpy as np
+from world.projectile_pool import KIND_ARROW
+from constants import GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, TILE_SIZE, EXIT_SIZE, CAVE_EXIT_SIZE
+
+CHANNELS = ('walls', 'exits', 'locks', 'rock', 'water', 'tree',
+            'blocks', 'monsters', 'archers', 'bats', 'slimes', 'boss',
+            'arrows', 'fireballs', 'drops', 'items', 'player')
+CHANNEL = {name: index for index, name in enumerate(CHANNELS)}
+# Kanalen vóór 'blocks' veranderen alleen als de statische laag van de room verandert
+STATIC_CHANNELS = CHANNEL['blocks']
+
+
+def get_items(attributes):
+    """Items die nu zichtbaar zijn en opgepakt of gekocht kunnen worden (attributes = vars(scene))"""
+    items = [item for item in attributes.get('items', ()) if not item.collected]
+    for name in ('key', 'heart_container', 'triforce'):
+        item = attributes.get(name)
+        if item and not item.collected and attributes.get(f'{name}_revealed', True):
+            items.append(item)
+    for name in ('sword', 'shield'):
+        item = attributes.get(name)
+        if item and not item.collected:
+            items.append(item)
+    return items
+
+
+class GridEncoder:
+    """Schrijft de huidige scene als grid van vakjes in een bestaande array
+
+    Eén kanaal per soort (zie CHANNELS); een vakje is 1 als iets van die soort het
+    overlapt. Het grid beslaat het speelveld zonder HUD, met vakjes van cell_size
+    pixels (TILE_SIZE of een deler ervan voor een fijnere grid).
+
+    Er wordt niets gerenderd: de rects gaan als byte slices in een bytearray, die aan
+    het eind in één keer naar `out` gekopieerd wordt. Muren, exits, sloten, obstakels
+    en barrier blokken worden per room één keer uitgerekend, tot de room zijn
+    statische laag ongeldig maakt (static_version). Werkt voor Room, DungeonRoom en
+    de caves.
+    """
+
+    def __init__(self, cell_size=TILE_SIZE, dtype=np.uint8):
+        if TILE_SIZE % cell_size or GAME_WIDTH % cell_size or GAME_HEIGHT % cell_size:
+            raise ValueError(f"cell_size {cell_size} past niet op de tile grid")
+        self.cell_size = cell_size
+        self.rows = GAME_HEIGHT // cell_size
+        self.columns = GAME_WIDTH // cell_size
+        self.shape = (len(CHANNELS), self.rows, self.columns)
+        self.dtype = dtype
+        self.cells = bytearray(len(CHANNELS) * self.rows * self.columns)
+        self.grid = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.shape)
+        self.static_size = STATIC_CHANNELS * self.rows * self.columns
+        self.empty = bytes(len(self.cells) - self.static_size)
+        self.ones = [b'\x01' * count for count in range(self.columns + 1)]
+        self.static = None
+        self.static_key = None
+
+    def encode(self, game, out):
+        scene = game.get_current_scene()
+        cells = self.cells
+        key = (scene, scene.static_version)
+        if key != self.static_key:
+            cells[:] = bytes(len(cells))
+            self.encode_static(scene)
+            self.static = bytes(cells[:self.static_size])
+            self.static_key = key
+        cells[:self.static_size] = self.static
+        cells[self.static_size:] = self.empty
+        self.encode_dynamic(scene)
+        self.paint(CHANNEL['player'], game.player.rect)
+        out[:] = self.grid
+        return out
+
+    def paint(self, channel, rect):
+        """Zet de vakjes die rect (scherm coördinaten) overlapt op 1"""
+        self.paint_box(channel, *rect)
+
+    def paint_box(self, channel, x, y, width, height):
+        if width <= 0 or height <= 0:
+            return
+        cell = self.cell_size
+        columns = self.columns
+        rows = self.rows
+        y -= HUD_HEIGHT
+        x0 = x // cell if x > 0 else 0
+        y0 = y // cell if y > 0 else 0
+        x1 = (x + width - 1) // cell + 1
+        y1 = (y + height - 1) // cell + 1
+        if x1 > columns:
+            x1 = columns
+        if y1 > rows:
+            y1 = rows
+        if x0 >= x1 or y0 >= y1:
+            return
+        cells = self.cells
+        top = (channel * rows + y0) * columns
+        if x1 - x0 <= 2 and y1 - y0 <= 2:
+            # Meestal (alles tot een vakje groot): de vier hoeken zijn de hele rect
+            bottom = top + (y1 - y0 - 1) * columns
+            x1 -= 1
+            cells[top + x0] = cells[top + x1] = cells[bottom + x0] = cells[bottom + x1] = 1
+            return
+        ones = self.ones[x1 - x0]
+        for row in range(top, top + (y1 - y0) * columns, columns):
+            cells[row + x0:row + x1] = ones
+
+    def paint_walls(self, scene, exit_sizes):
+        """Muur rand met een opening in het midden; exit_sizes: richting -> breedte (0 = dicht)"""
+        thickness = scene.wall_thickness
+        width = scene.screen_width
+        height = scene.screen_height
+        # (x, y, lengte langs de muur, horizontaal)
+        sides = {
+            'north': (0, HUD_HEIGHT, width, True),
+            'south': (0, HUD_HEIGHT + height - thickness, width, True),
+            'west': (0, HUD_HEIGHT, height, False),
+            'east': (width - thickness, HUD_HEIGHT, height, False),
+        }
+        for direction, (x, y, length, horizontal) in sides.items():
+            size = exit_sizes.get(direction, 0)
+            start = length // 2 - size // 2
+            # Muur voor en na de opening, de opening zelf is een exit
+            for channel, offset, part in ((CHANNEL['walls'], 0, start),
+                                          (CHANNEL['exits'], start, size),
+                                          (CHANNEL['walls'], start + size, length - start - size)):
+                if horizontal:
+                    self.paint_box(channel, x + offset, y, part, thickness)
+                else:
+                    self.paint_box(channel, x, y + offset, thickness, part)
+
+    def encode_static(self, scene):
+        exits = getattr(scene, 'exits', None)
+        if exits is not None:
+            self.paint_walls(scene, {direction: EXIT_SIZE if open_exit else 0
+                                     for direction, open_exit in exits.items()})
+        else:
+            self.paint_walls(scene, {'south': CAVE_EXIT_SIZE if scene.has_exit else 0})
+
+        if getattr(scene, 'locked_exits', None):
+            for rect in scene.get_locked_door_rects(HUD_HEIGHT):
+                self.paint(CHANNEL['locks'], rect)
+        for obstacle in getattr(scene, 'obstacles', ()):
+            self.paint(CHANNEL[obstacle.type], obstacle.rect)
+        for rect in getattr(scene, 'barrier_blocks', ()):
+            self.paint(CHANNEL['walls'], rect)
+        cave_entrance = getattr(scene, 'cave_entrance', None)
+        if cave_entrance:
+            self.paint(CHANNEL['exits'], cave_entrance.rect)
+
+    def encode_dynamic(self, scene):
+        paint_box = self.paint_box
+        # Via __dict__: getattr met default kost een exception per ontbrekend attribuut
+        attributes = vars(scene)
+        # De batch stores schrijven hun posities elke stap terug naar de objecten
+        for name in ('monsters', 'archers', 'bats', 'slimes'):
+            channel = CHANNEL[name]
+            for entity in attributes.get(name, ()):
+                if entity.alive:
+                    paint_box(channel, *entity.rect)
+        boss = attributes.get('boss')
+        if boss and boss.alive:
+            paint_box(CHANNEL['boss'], *boss.rect)
+
+        pool = attributes.get('projectiles')
+        if pool is not None and pool.count:
+            slots = np.flatnonzero(pool.active)
+            arrows = CHANNEL['arrows']
+            fireballs = CHANNEL['fireballs']
+            for kind, x, y, width, height in zip(pool.kind[slots].tolist(), pool.rect_x[slots].tolist(),
+                                                 pool.rect_y[slots].tolist(), pool.width[slots].tolist(),
+                                                 pool.height[slots].tolist()):
+                paint_box(arrows if kind == KIND_ARROW else fireballs, x, y, width, height)
+
+        block = attributes.get('pushable_block')
+        if block:
+            paint_box(CHANNEL['blocks'], *block.rect)
+        stairs = attributes.get('hidden_stairs')
+        if stairs and stairs.revealed:
+            paint_box(CHANNEL['exits'], *stairs.rect)
+
+        channel = CHANNEL['drops']
+        for drops in (attributes.get('health_drops', ()), attributes.get('rupee_drops', ())):
+            for drop in drops:
+                if not drop.collected:
+                    paint_box(channel, *drop.rect)
+
+        channel = CHANNEL['items']
+        for item in get_items(attributes):
+            paint_box(channel, *item.rect)
@@ -0,0 +1,193 @@
+"""
+VectorEnvironment - N environments in lockstep, in dit proces of verdeeld over worker processen
+"""
+import os
+import multiprocessing
+import numpy as np
+from rl.environment import Environment
+from world.random_streams import get_stream_states, set_stream_states
+
+BACKENDS = ('inprocess', 'subprocess')
+
+
+class EnvironmentGroup:
+    """Een aantal environments die in hetzelfde proces om de beurt een stap zetten
+
+    Observaties, rewards en dones gaan direct in de meegegeven arrays (views op de
+    gedeelde buffers). Een environment die klaar is begint meteen een nieuwe episode
+    met de volgende seed: environment i krijgt seeds seed + i, seed + i + n, ...
+
+    De RNG streams zijn globaal per proces. Met isolate_rng krijgt elke game zijn eigen
+    stream toestand terug voor hij een stap zet (kost ongeveer 60 us per game per stap),
+    zodat een episode niet afhangt van de andere games in hetzelfde proces.
+    """
+
+    def __init__(self, indices, num_envs, seed, observations, rewards, dones, isolate_rng=True, **env_kwargs):
+        self.indices = list(indices)
+        self.num_envs = num_envs
+        self.seed = seed
+        self.rewards = rewards
+        self.dones = dones
+        self.isolate_rng = isolate_rng and len(self.indices) > 1
+        self.envs = [Environment(buffer=observations[index], **env_kwargs) for index in self.indices]
+        self.episodes = [0] * len(self.envs)
+        self.rng_states = [None] * len(self.envs)
+
+    def episode_seed(self, i):
+        return self.seed + self.indices[i] + self.episodes[i] * self.num_envs
+
+    def reset(self):
+        for i, env in enumerate(self.envs):
+            self.episodes[i] = 0
+            env.reset(self.episode_seed(i))
+            if self.isolate_rng:
+                self.rng_states[i] = get_stream_states()
+
+    def step(self, actions):
+        """Eén stap voor elke environment; geeft de info dicts terug"""
+        infos = []
+        for i, (env, index) in enumerate(zip(self.envs, self.indices)):
+            if self.isolate_rng:
+                set_stream_states(self.rng_states[i])
+            _, reward, done, info = env.step(actions[index])
+            if done:
+                # Laatste observatie bewaren, daarna direct de volgende episode
+                info['final_observation'] = env.buffer.copy()
+                info['episode_seed'] = env.seed
+                self.episodes[i] += 1
+                env.reset(self.episode_seed(i))
+            if self.isolate_rng:
+                self.rng_states[i] = get_stream_states()
+            self.rewards[index] = reward
+            self.dones[index] = done
+            infos.append(info)
+        return infos
+
+
+def shared_array(context, shape, dtype):
+    """NumPy array in gedeeld geheugen (wordt met de worker processen gedeeld, niet gepickled)"""
+    dtype = np.dtype(dtype)
+    raw = context.RawArray('b', max(1, int(np.prod(shape)) * dtype.itemsize))
+    return raw, np.frombuffer(raw, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+
+def _worker(connection, buffers, shape, dtype, indices, num_envs, seed, isolate_rng, env_kwargs):
+    """Worker proces: stapt zijn deel van de environments op commando van de parent"""
+    raw_observations, raw_rewards, raw_dones, raw_actions = buffers
+    count = int(np.prod(shape))
+    observations = np.frombuffer(raw_observations, dtype=dtype, count=count).reshape(shape)
+    rewards = np.frombuffer(raw_rewards, dtype=np.float32, count=num_envs)
+    dones = np.frombuffer(raw_dones, dtype=np.bool_, count=num_envs)
+    actions = np.frombuffer(raw_actions, dtype=np.int64, count=num_envs)
+    group = EnvironmentGroup(indices, num_envs, seed, observations, rewards, dones, isolate_rng, **env_kwargs)
+    try:
+        while True:
+            command = connection.recv()
+            if command == 'step':
+                connection.send(group.step(actions))
+            elif command == 'reset':
+                group.reset()
+                connection.send(None)
+            elif command == 'close':
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        connection.close()
+
+
+class VectorEnvironment:
+    """N onafhankelijke, geseede games die samen een stap zetten
+
+    reset() en step(actions) geven gestapelde arrays terug: observaties (N, ...),
+    rewards (N,) float32 en dones (N,) bool, plus een lijst info dicts. Een game die
+    klaar is, begint direct opnieuw (zie EnvironmentGroup); de laatste observatie van
+    de episode staat dan in info['final_observation'].
+
+    Backends:
+      'inprocess'  - alle games in dit proces
+      'subprocess' - de games verdeeld over `workers` processen (standaard alle cores).
+                     Observaties, rewards, dones en acties staan in gedeeld geheugen; per
+                     stap gaat er alleen een kort commando en de info dicts door de pipes.
+
+    De teruggegeven arrays zijn de buffers zelf: de volgende stap overschrijft ze.
+    """
+
+    def __init__(self, num_envs, seed=0, backend='inprocess', workers=None, isolate_rng=True, **env_kwargs):
+        if backend not in BACKENDS:
+            raise ValueError(f"Onbekende backend {backend}")
+        self.num_envs = num_envs
+        self.backend = backend
+        probe = Environment(**env_kwargs)
+        self.observation_shape = probe.observation_shape
+        self.observation_dtype = probe.observation_dtype
+        self.action_count = probe.action_count
+        shape = (num_envs,) + self.observation_shape
+
+        self.group = None
+        self.workers = []
+        self.connections = []
+        if backend == 'inprocess':
+            self.observations = np.zeros(shape, dtype=self.observation_dtype)
+            self.rewards = np.zeros(num_envs, dtype=np.float32)
+            self.dones = np.zeros(num_envs, dtype=bool)
+            self.actions = np.zeros(num_envs, dtype=np.int64)
+            self.group = EnvironmentGroup(range(num_envs), num_envs, seed, self.observations,
+                                          self.rewards, self.dones, isolate_rng, **env_kwargs)
+            return
+
+        context = multiprocessing.get_context()
+        raw_observations, self.observations = shared_array(context, shape, self.observation_dtype)
+        raw_rewards, self.rewards = shared_array(context, (num_envs,), np.float32)
+        raw_dones, self.dones = shared_array(context, (num_envs,), np.bool_)
+        raw_actions, self.actions = shared_array(context, (num_envs,), np.int64)
+        buffers = (raw_observations, raw_rewards, raw_dones, raw_actions)
+
+        workers = min(workers or os.cpu_count() or 1, num_envs)
+        for indices in np.array_split(np.arange(num_envs), workers):
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_worker, daemon=True,
+                args=(child_connection, buffers, shape, self.observation_dtype, indices.tolist(),
+                      num_envs, seed, isolate_rng, env_kwargs))
+            process.start()
+            child_connection.close()
+            self.workers.append(process)
+            self.connections.append(parent_connection)
+
+    def reset(self):
+        if self.group:
+            self.group.reset()
+        else:
+            for connection in self.connections:
+                connection.send('reset')
+            for connection in self.connections:
+                connection.recv()
+        return self.observations
+
+    def step(self, actions):
+        self.actions[:] = actions
+        if self.group:
+            infos = self.group.step(self.actions)
+        else:
+            for connection in self.connections:
+                connection.send('step')
+            infos = []
+            for connection in self.connections:
+                infos.extend(connection.recv())
+        return self.observations, self.rewards, self.dones, infos
+
+    def close(self):
+        for connection in self.connections:
+            try:
+                connection.send('close')
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self.workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.workers = []
+        self.connections = []
+        self.group = None
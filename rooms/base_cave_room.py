@@ -1,11 +1,12 @@
 import pygame
 from world.fire import Fire
+from rooms.static_layer import StaticLayerMixin
 from constants import (
-    GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS,
+    GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS, CAVE_EXIT_SIZE,
     WALL_COLOR, CAVE_EXIT_COLOR, CAVE_BACKGROUND_COLOR
 )
 
-class BaseCaveRoom:
+class BaseCaveRoom(StaticLayerMixin):
     def __init__(self):
         self.screen_width = GAME_WIDTH
         self.screen_height = GAME_HEIGHT
@@ -33,6 +34,22 @@ class BaseCaveRoom:
             fire.update()
 
     def render(self, screen, hud_height=HUD_HEIGHT):
+        # Muren, exit en cave content (oude man, items) in één blit
+        self.render_static(screen, hud_height)
+        self.render_dynamic(screen)
+
+    def render_dynamic(self, screen):
+        """Teken de vuren (het enige dat in een cave beweegt)"""
+        for fire in self.fires:
+            fire.render(screen)
+
+    def get_dirty_rects(self):
+        """Rects van alles wat render_dynamic() deze frame tekent"""
+        return [fire.get_render_rect() for fire in self.fires]
+
+    def render_static_layer(self, screen, hud_height=HUD_HEIGHT):
+        """Teken alles wat niet beweegt (gecachet door StaticLayerMixin)
+        Subclasses roepen invalidate_static_layer() aan als hun content verandert"""
         # Zwarte achtergrond
         game_area = pygame.Rect(0, hud_height, self.screen_width, self.screen_height)
         pygame.draw.rect(screen, self.background_color, game_area)
@@ -45,15 +62,15 @@ class BaseCaveRoom:
         # Ondermuur met smalle exit in het midden
         pygame.draw.rect(screen, WALL_COLOR,
                         (0, hud_height + self.screen_height - self.wall_thickness,
-                         self.screen_width // 2 - 25, self.wall_thickness))
+                         self.screen_width // 2 - CAVE_EXIT_SIZE // 2, self.wall_thickness))
         pygame.draw.rect(screen, WALL_COLOR,
-                        (self.screen_width // 2 + 25, hud_height + self.screen_height - self.wall_thickness,
-                         self.screen_width // 2 - 25, self.wall_thickness))
+                        (self.screen_width // 2 + CAVE_EXIT_SIZE // 2, hud_height + self.screen_height - self.wall_thickness,
+                         self.screen_width // 2 - CAVE_EXIT_SIZE // 2, self.wall_thickness))
 
         # Exit (zwart blok in het midden onderaan)
         pygame.draw.rect(screen, CAVE_EXIT_COLOR,
-                        (self.screen_width // 2 - 25, hud_height + self.screen_height - self.wall_thickness,
-                         50, self.wall_thickness))
+                        (self.screen_width // 2 - CAVE_EXIT_SIZE // 2, hud_height + self.screen_height - self.wall_thickness,
+                         CAVE_EXIT_SIZE, self.wall_thickness))
 
         # Linkermuur
         pygame.draw.rect(screen, WALL_COLOR,
@@ -64,10 +81,6 @@ class BaseCaveRoom:
                         (self.screen_width - self.wall_thickness, hud_height,
                          self.wall_thickness, self.screen_height))
 
-        # Render fires
-        for fire in self.fires:
-            fire.render(screen)
-
         # Render specifieke cave content (override in subclasses)
         self.render_content(screen)
 
@@ -1,5 +1,4 @@
 import pygame
-import random
 from items.key import Key
 from items.heart_container import HeartContainer
 from items.triforce import Triforce
@@ -7,6 +6,10 @@ from entities.bat import Bat
 from entities.slime import Slime
 from entities.boss import Boss
 from world.fire import Fire
+from rooms.static_layer import StaticLayerMixin
+from world.spatial_hash import SpatialHash
+from world.projectile_pool import ProjectilePool
+from world.random_streams import generation_random
 from constants import (
     GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS, EXIT_SIZE,
     DUNGEON_WALL_COLOR, DUNGEON_DOOR_COLOR, DUNGEON_BACKGROUND_COLOR,
@@ -14,7 +17,7 @@ from constants import (
     DUNGEON_KEYHOLE_COLOR, DUNGEON_FLOOR_TILE_COLOR, TILE_SIZE
 )
 
-class DungeonRoom:
+class DungeonRoom(StaticLayerMixin):
     def __init__(self, x, y, screen_width=GAME_WIDTH, screen_height=GAME_HEIGHT):
         self.grid_x = x
         self.grid_y = y
@@ -46,14 +49,44 @@ class DungeonRoom:
         self.lock_color = DUNGEON_LOCK_COLOR
         self.keyhole_color = DUNGEON_KEYHOLE_COLOR
 
+        # Spatial hash grids voor broadphase collision queries (uitgelijnd op de tiles)
+        grid_origin = (self.wall_thickness, HUD_HEIGHT + self.wall_thickness)
+        self.bat_grid = SpatialHash(TILE_SIZE, grid_origin)
+        self.slime_grid = SpatialHash(TILE_SIZE, grid_origin)
+
+        # Vuurballen van de boss
+        self.projectiles = ProjectilePool()
+
     def add_exit(self, direction, locked=False):
         self.exits[direction] = True
         self.locked_exits[direction] = locked
 
+    def add_bat(self, bat):
+        self.bats.append(bat)
+        self.bat_grid.insert(bat, bat.rect)
+
+    def add_slime(self, slime):
+        self.slimes.append(slime)
+        self.slime_grid.insert(slime, slime.rect)
+
+    def get_obstacles_near(self, rect):
+        """Obstakels die rect raken (dungeons hebben geen tile obstakels, barriers zijn rects)"""
+        return [obstacle for obstacle in self.obstacles if rect.colliderect(obstacle.rect)]
+
+    def get_bats_near(self, rect):
+        """Vleermuizen in de tiles rond rect (broadphase)"""
+        return self.bat_grid.query(rect)
+
+    def get_slimes_near(self, rect):
+        """Slimes in de tiles rond rect (broadphase)"""
+        return self.slime_grid.query(rect)
+
     def unlock_exit(self, direction):
         """Unlock een exit"""
         if direction in self.locked_exits:
             self.locked_exits[direction] = False
+            # Deur zit in de statische laag
+            self.invalidate_static_layer()
 
     def get_locked_door_rects(self, hud_height=HUD_HEIGHT):
         """Return collision rects voor alle locked doors"""
@@ -143,46 +176,54 @@ class DungeonRoom:
         """Voeg vleermuizen toe aan deze kamer"""
         for _ in range(num_bats):
             # Random positie binnen de kamer
-            x = random.randint(
+            x = generation_random.randint(
                 self.wall_thickness + 50,
                 self.screen_width - self.wall_thickness - 75
             )
-            y = random.randint(
+            y = generation_random.randint(
                 hud_height + self.wall_thickness + 50,
                 hud_height + self.screen_height - self.wall_thickness - 70
             )
             bat = Bat(x, y)
-            self.bats.append(bat)
+            self.add_bat(bat)
 
     def add_slimes(self, num_slimes, hud_height=HUD_HEIGHT):
         """Voeg slimes toe aan deze kamer (grote slimes)"""
         for _ in range(num_slimes):
             # Random positie binnen de kamer
-            x = random.randint(
+            x = generation_random.randint(
                 self.wall_thickness + 50,
                 self.screen_width - self.wall_thickness - 75
             )
-            y = random.randint(
+            y = generation_random.randint(
                 hud_height + self.wall_thickness + 50,
                 hud_height + self.screen_height - self.wall_thickness - 70
             )
             slime = Slime(x, y, is_large=True)
-            self.slimes.append(slime)
+            self.add_slime(slime)
 
     def update(self, screen_width, screen_height, hud_height=HUD_HEIGHT, player=None, boss_sound=None):
         # Update vleermuizen
         for bat in self.bats:
             if bat.alive:
                 bat.update([], screen_width, screen_height, hud_height)
+                self.bat_grid.update(bat, bat.rect)
+            elif bat in self.bat_grid:
+                self.bat_grid.remove(bat)
 
         # Update slimes
         for slime in self.slimes:
             if slime.alive:
                 slime.update([], screen_width, screen_height, hud_height)
+                self.slime_grid.update(slime, slime.rect)
+            elif slime in self.slime_grid:
+                self.slime_grid.remove(slime)
 
         # Update boss
         if self.boss and self.boss.alive and player:
-            self.boss.update(player, hud_height, screen_width, screen_height, boss_sound)
+            self.boss.update(player, hud_height, screen_width, screen_height, boss_sound, self.projectiles)
+            # Vuurballen bewegen alleen zolang de boss leeft
+            self.projectiles.step(0, hud_height, screen_width, hud_height + screen_height)
 
         # Update vuren
         for fire in self.fires:
@@ -211,6 +252,12 @@ class DungeonRoom:
                 self.rupee_drops.remove(rupee_drop)
 
     def render(self, screen, hud_height=HUD_HEIGHT):
+        # Achtergrond, vloertegels, muren, deuren en blokken in één blit
+        self.render_static(screen, hud_height)
+        self.render_dynamic(screen)
+
+    def render_static_layer(self, screen, hud_height=HUD_HEIGHT):
+        """Teken alles wat niet beweegt (gecachet door StaticLayerMixin)"""
         # Teken donkere achtergrond (ondergronds gevoel)
         game_area = pygame.Rect(0, hud_height, self.screen_width, self.screen_height)
         pygame.draw.rect(screen, self.background_color, game_area)
@@ -303,6 +350,8 @@ class DungeonRoom:
         if hasattr(self, 'pushable_block'):
             self.pushable_block.render(screen)
 
+    def render_dynamic(self, screen):
+        """Teken alles wat kan bewegen of verdwijnen (bovenop de statische laag)"""
         # Render vuren
         for fire in self.fires:
             fire.render(screen)
@@ -320,6 +369,7 @@ class DungeonRoom:
         # Render boss
         if self.boss and self.boss.alive:
             self.boss.render(screen)
+            self.projectiles.render(screen)
 
         # Render sleutel (als deze bestaat en niet collected is)
         if self.key and not self.key.collected and self.key_revealed:
@@ -341,6 +391,24 @@ class DungeonRoom:
         for rupee_drop in self.rupee_drops:
             rupee_drop.render(screen)
 
+    def get_dirty_rects(self):
+        """Rects van alles wat render_dynamic() deze frame tekent"""
+        rects = [fire.get_render_rect() for fire in self.fires]
+        rects.extend(slime.get_render_rect() for slime in self.slimes if slime.alive)
+        rects.extend(bat.get_render_rect() for bat in self.bats if bat.alive)
+        if self.boss and self.boss.alive:
+            rects.append(self.boss.get_render_rect())
+            rects.extend(self.projectiles.get_render_rects())
+        if self.key and not self.key.collected and self.key_revealed:
+            rects.append(self.key.get_render_rect())
+        if self.heart_container and not self.heart_container.collected and self.heart_container_revealed:
+            rects.append(self.heart_container.get_render_rect())
+        if self.triforce and not self.triforce.collected and self.triforce_revealed:
+            rects.append(self.triforce.get_render_rect())
+        rects.extend(health_drop.get_render_rect() for health_drop in self.health_drops)
+        rects.extend(rupee_drop.get_render_rect() for rupee_drop in self.rupee_drops)
+        return rects
+
 class DungeonManager:
     def __init__(self, screen_width=GAME_WIDTH, screen_height=GAME_HEIGHT):
         self.rooms = {}
@@ -1,24 +1,34 @@
 import pygame
-import random
+import numpy as np
+from collections import OrderedDict
 from world.obstacle import Obstacle
 from entities.monster import Monster
 from entities.archer import Archer
 from items.item import Item
 from items.pushable_block import PushableBlock
 from world.hidden_stairs import HiddenStairs
+from rooms.static_layer import StaticLayerMixin
+from world.spatial_hash import SpatialHash
+from world.entity_store import EntityStore
+from world.projectile_pool import ProjectilePool
+from world.random_streams import generation_random, make_room_random
+from rooms.room_codec import encode_room, decode_room
 from constants import (
     GAME_WIDTH, GAME_HEIGHT, HUD_HEIGHT, WALL_THICKNESS, EXIT_SIZE,
     WALL_COLOR, EXIT_COLOR, BACKGROUND_COLOR, TILE_SIZE,
     MIN_OBSTACLES_PER_ROOM, MAX_OBSTACLES_PER_ROOM,
     MIN_MONSTERS_PER_ROOM, MAX_MONSTERS_PER_ROOM,
     SAFE_DISTANCE_FROM_EXIT, MONSTER_WIDTH, MONSTER_HEIGHT,
-    ARCHER_WIDTH, ARCHER_HEIGHT
+    ARCHER_WIDTH, ARCHER_HEIGHT, ENTITY_QUERY_MARGIN, ENTITY_BATCH_THRESHOLD,
+    TILE_EMPTY, OBSTACLE_TILE_CODES, ROOM_CACHE_SIZE
 )
 
-class Room:
-    def __init__(self, x, y, screen_width=GAME_WIDTH, screen_height=GAME_HEIGHT):
+class Room(StaticLayerMixin):
+    def __init__(self, x, y, screen_width=GAME_WIDTH, screen_height=GAME_HEIGHT, rng=None):
         self.grid_x = x
         self.grid_y = y
+        # RNG voor de generatie van deze room (RoomManager geeft elke room een eigen stream)
+        self.rng = rng or generation_random
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.exits = {'north': False, 'south': False, 'east': False, 'west': False}
@@ -29,6 +39,7 @@ class Room:
         self.items = []
         self.pushable_block = None
         self.hidden_stairs = None
+        self.cave_entrance = None  # Grot ingang (onderdeel van de statische laag)
         self.health_drops = []  # Health drops die verschijnen bij enemy deaths
         self.rupee_drops = []  # Rupee drops die verschijnen bij enemy deaths
 
@@ -49,6 +60,25 @@ class Room:
         self.grid_height = (screen_height - 2 * self.wall_thickness) // self.tile_size
         self.occupied_tiles = set()  # Houdt bij welke tiles bezet zijn
 
+        # Occupancy map: één byte per tile (TILE_EMPTY of een obstakel code) voor O(1) lookups
+        self.grid_origin_x = self.wall_thickness
+        self.grid_origin_y = HUD_HEIGHT + self.wall_thickness
+        self.tile_map = bytearray(self.grid_width * self.grid_height)
+        self.obstacle_tiles = {}  # (grid_x, grid_y) -> Obstacle
+
+        # Spatial hash grids voor broadphase collision queries van bewegende entities
+        grid_origin = (self.grid_origin_x, self.grid_origin_y)
+        self.monster_grid = SpatialHash(self.tile_size, grid_origin)
+        self.archer_grid = SpatialHash(self.tile_size, grid_origin)
+
+        # Alle pijlen van de archers in deze room
+        self.projectiles = ProjectilePool()
+
+        # Array-backed opslag zodat veel monsters/archers in één batch bewegen
+        # (pas gevuld vanaf ENTITY_BATCH_THRESHOLD, daaronder kost numpy meer dan het oplevert)
+        self.monster_store = EntityStore(self.tile_size, grid_origin)
+        self.archer_store = EntityStore(self.tile_size, grid_origin)
+
         # NIET hier genereren - eerst moeten exits worden ingesteld!
         # Deze worden later aangeroepen vanuit RoomManager
         
@@ -57,6 +87,106 @@ class Room:
         
     def add_monster(self, monster):
         self.monsters.append(monster)
+        self.monster_grid.insert(monster, monster.rect)
+        self.add_to_store(self.monster_store, self.monsters, monster)
+
+    def add_archer(self, archer):
+        self.archers.append(archer)
+        self.archer_grid.insert(archer, archer.rect)
+        self.add_to_store(self.archer_store, self.archers, archer)
+
+    @staticmethod
+    def add_to_store(store, entities, entity):
+        """Voeg toe aan de batch store zodra de room genoeg vijanden heeft"""
+        if len(store):
+            store.add(entity)
+        elif len(entities) >= ENTITY_BATCH_THRESHOLD:
+            for existing in entities:
+                store.add(existing)
+
+    def add_obstacle(self, obstacle, grid_x, grid_y):
+        """Plaats een obstakel op een tile (obstakels vullen altijd precies één tile)"""
+        self.obstacles.append(obstacle)
+        self.tile_map[grid_y * self.grid_width + grid_x] = OBSTACLE_TILE_CODES[obstacle.type]
+        self.obstacle_tiles[(grid_x, grid_y)] = obstacle
+
+    def get_tile(self, grid_x, grid_y):
+        """Tile code op een grid positie (buiten de grid is alles vrij)"""
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            return self.tile_map[grid_y * self.grid_width + grid_x]
+        return TILE_EMPTY
+
+    def get_tile_range(self, rect):
+        """Grid bereik (x0, y0, x1, y1) van de tiles die rect overlapt, binnen de grid"""
+        left = rect.left - self.grid_origin_x
+        top = rect.top - self.grid_origin_y
+        size = self.tile_size
+        x0 = max(left // size, 0)
+        y0 = max(top // size, 0)
+        # right/bottom zijn exclusief
+        x1 = min((left + rect.width - 1) // size, self.grid_width - 1)
+        y1 = min((top + rect.height - 1) // size, self.grid_height - 1)
+        return x0, y0, x1, y1
+
+    def rect_hits_obstacle(self, rect):
+        """Check of rect een obstakel raakt (alleen de 1-4 tiles onder rect)"""
+        x0, y0, x1, y1 = self.get_tile_range(rect)
+        tile_map = self.tile_map
+        for grid_y in range(y0, y1 + 1):
+            row = grid_y * self.grid_width
+            for grid_x in range(x0, x1 + 1):
+                if tile_map[row + grid_x] != TILE_EMPTY:
+                    return True
+        return False
+
+    def rects_hit_obstacle(self, rect_x, rect_y, width, height):
+        """Gevectoriseerde rect_hits_obstacle voor numpy arrays van rects
+
+        Kijkt naar de tiles onder de vier hoeken, dus rects mogen niet groter zijn dan een tile.
+        """
+        tiles = np.frombuffer(self.tile_map, dtype=np.uint8)
+        size = self.tile_size
+        left = rect_x - self.grid_origin_x
+        top = rect_y - self.grid_origin_y
+
+        hit = np.zeros(len(rect_x), dtype=bool)
+        for corner_x in (left, left + width - 1):
+            grid_x = corner_x // size
+            inside_x = (grid_x >= 0) & (grid_x < self.grid_width)
+            for corner_y in (top, top + height - 1):
+                grid_y = corner_y // size
+                inside = inside_x & (grid_y >= 0) & (grid_y < self.grid_height)
+                index = np.where(inside, grid_y * self.grid_width + grid_x, 0)
+                hit |= inside & (tiles[index] != TILE_EMPTY)
+        return hit
+
+    def rect_hits_wall(self, rect, hud_height=HUD_HEIGHT):
+        """Check of rect (deels) in de muren rondom de room ligt"""
+        return (rect.left < self.wall_thickness or
+                rect.right > self.screen_width - self.wall_thickness or
+                rect.top < hud_height + self.wall_thickness or
+                rect.bottom > hud_height + self.screen_height - self.wall_thickness)
+
+    def get_obstacles_near(self, rect):
+        """Obstakels op de tiles die rect overlapt"""
+        x0, y0, x1, y1 = self.get_tile_range(rect)
+        tile_map = self.tile_map
+        obstacles = []
+        for grid_y in range(y0, y1 + 1):
+            row = grid_y * self.grid_width
+            for grid_x in range(x0, x1 + 1):
+                if tile_map[row + grid_x] != TILE_EMPTY:
+                    obstacles.append(self.obstacle_tiles[(grid_x, grid_y)])
+        return obstacles
+
+    def get_monsters_near(self, rect):
+        """Monsters in de tiles rond rect (broadphase)"""
+        return self.monster_grid.query(rect)
+
+    def get_archers_near(self, rect):
+        """Archers in de tiles rond rect (broadphase)"""
+        return self.archer_grid.query(rect)
+
 
     def is_near_exit(self, grid_x, grid_y):
         """Check of een grid positie te dichtbij een exit is"""
@@ -89,7 +219,7 @@ class Room:
 
     def generate_obstacles(self, hud_height=HUD_HEIGHT, cave_rect=None):
         # Voeg random obstakels toe aan elke room (op grid)
-        num_obstacles = random.randint(MIN_OBSTACLES_PER_ROOM, MAX_OBSTACLES_PER_ROOM)
+        num_obstacles = self.rng.randint(MIN_OBSTACLES_PER_ROOM, MAX_OBSTACLES_PER_ROOM)
         max_attempts = 100  # Maximaal aantal pogingen per obstakel
 
         for _ in range(num_obstacles):
@@ -100,8 +230,8 @@ class Room:
                 attempts += 1
 
                 # Kies random grid positie
-                grid_x = random.randint(0, self.grid_width - 1)
-                grid_y = random.randint(0, self.grid_height - 1)
+                grid_x = self.rng.randint(0, self.grid_width - 1)
+                grid_y = self.rng.randint(0, self.grid_height - 1)
 
                 # Skip als deze tile al bezet is
                 if (grid_x, grid_y) in self.occupied_tiles:
@@ -124,7 +254,7 @@ class Room:
                         continue
 
                 # Random type: 40% rots, 30% water, 30% boom/bosje
-                rand = random.random()
+                rand = self.rng.random()
                 if rand < 0.4:
                     obstacle_type = 'rock'
                 elif rand < 0.7:
@@ -134,7 +264,7 @@ class Room:
 
                 # Maak obstakel met vaste tile grootte
                 obstacle = Obstacle(x, y, self.tile_size, self.tile_size, obstacle_type)
-                self.obstacles.append(obstacle)
+                self.add_obstacle(obstacle, grid_x, grid_y)
 
                 # Markeer deze tile als bezet
                 self.occupied_tiles.add((grid_x, grid_y))
@@ -143,9 +273,9 @@ class Room:
     def generate_monsters(self, hud_height=HUD_HEIGHT):
         # Special case voor starting room (1,1): maximaal 2 monsters, ver van centrum
         if self.grid_x == 1 and self.grid_y == 1:
-            num_monsters = random.randint(1, 2)  # 1 of 2 monsters
+            num_monsters = self.rng.randint(1, 2)  # 1 of 2 monsters
         else:
-            num_monsters = random.randint(MIN_MONSTERS_PER_ROOM, MAX_MONSTERS_PER_ROOM)
+            num_monsters = self.rng.randint(MIN_MONSTERS_PER_ROOM, MAX_MONSTERS_PER_ROOM)
 
         max_attempts = 50
 
@@ -164,50 +294,36 @@ class Room:
 
                     # Kies een positie ver van het centrum (in de hoeken)
                     # Random hoek kiezen: 0=linksboven, 1=rechtsboven, 2=linksonder, 3=rechtsonder
-                    corner = random.randint(0, 3)
+                    corner = self.rng.randint(0, 3)
 
                     if corner == 0:  # Linksboven
-                        x = random.randint(self.wall_thickness + 50, center_x - 150)
-                        y = random.randint(hud_height + self.wall_thickness + 50, center_y - 100)
+                        x = self.rng.randint(self.wall_thickness + 50, center_x - 150)
+                        y = self.rng.randint(hud_height + self.wall_thickness + 50, center_y - 100)
                     elif corner == 1:  # Rechtsboven
-                        x = random.randint(center_x + 150, self.screen_width - self.wall_thickness - 100)
-                        y = random.randint(hud_height + self.wall_thickness + 50, center_y - 100)
+                        x = self.rng.randint(center_x + 150, self.screen_width - self.wall_thickness - 100)
+                        y = self.rng.randint(hud_height + self.wall_thickness + 50, center_y - 100)
                     elif corner == 2:  # Linksonder
-                        x = random.randint(self.wall_thickness + 50, center_x - 150)
-                        y = random.randint(center_y + 100, hud_height + self.screen_height - self.wall_thickness - 100)
+                        x = self.rng.randint(self.wall_thickness + 50, center_x - 150)
+                        y = self.rng.randint(center_y + 100, hud_height + self.screen_height - self.wall_thickness - 100)
                     else:  # Rechtsonder
-                        x = random.randint(center_x + 150, self.screen_width - self.wall_thickness - 100)
-                        y = random.randint(center_y + 100, hud_height + self.screen_height - self.wall_thickness - 100)
+                        x = self.rng.randint(center_x + 150, self.screen_width - self.wall_thickness - 100)
+                        y = self.rng.randint(center_y + 100, hud_height + self.screen_height - self.wall_thickness - 100)
                 else:
                     # Random positie binnen de speelbare ruimte (met HUD offset)
-                    x = random.randint(self.wall_thickness + 50, self.screen_width - self.wall_thickness - 100)
-                    y = random.randint(hud_height + self.wall_thickness + 50, hud_height + self.screen_height - self.wall_thickness - 100)
+                    x = self.rng.randint(self.wall_thickness + 50, self.screen_width - self.wall_thickness - 100)
+                    y = self.rng.randint(hud_height + self.wall_thickness + 50, hud_height + self.screen_height - self.wall_thickness - 100)
 
                 # Maak tijdelijk rect om overlap te checken
                 temp_rect = pygame.Rect(x, y, MONSTER_WIDTH, MONSTER_HEIGHT)
 
                 # Check overlap met obstakels
-                overlap = False
-                for obstacle in self.obstacles:
-                    if temp_rect.colliderect(obstacle.rect):
-                        overlap = True
-                        break
+                overlap = self.rect_hits_obstacle(temp_rect)
 
-                # Check overlap met andere monsters
+                # Check overlap met andere monsters en archers (met 20px marge rondom)
                 if not overlap:
-                    for monster in self.monsters:
-                        padded_rect = monster.rect.inflate(40, 40)
-                        if temp_rect.colliderect(padded_rect):
-                            overlap = True
-                            break
-
-                # Check overlap met archers
-                if not overlap:
-                    for archer in self.archers:
-                        padded_rect = archer.rect.inflate(40, 40)
-                        if temp_rect.colliderect(padded_rect):
-                            overlap = True
-                            break
+                    padded_rect = temp_rect.inflate(40, 40)
+                    overlap = bool(self.monster_grid.query_colliding(padded_rect) or
+                                   self.archer_grid.query_colliding(padded_rect))
 
                 if not overlap:
                     # Voor starting room (1,1): alleen normale monsters, geen archers
@@ -215,17 +331,17 @@ class Room:
                     if self.grid_x == 1 and self.grid_y == 1:
                         # Alleen normale monsters in starting room
                         monster = Monster(x, y)
-                        self.monsters.append(monster)
+                        self.add_monster(monster)
                         # Bewaar configuratie voor respawn
                         self.initial_monster_configs.append({'x': x, 'y': y})
-                    elif random.random() < 0.3:
+                    elif self.rng.random() < 0.3:
                         archer = Archer(x, y)
-                        self.archers.append(archer)
+                        self.add_archer(archer)
                         # Bewaar configuratie voor respawn
                         self.initial_archer_configs.append({'x': x, 'y': y})
                     else:
                         monster = Monster(x, y)
-                        self.monsters.append(monster)
+                        self.add_monster(monster)
                         # Bewaar configuratie voor respawn
                         self.initial_monster_configs.append({'x': x, 'y': y})
                     placed = True
@@ -237,8 +353,8 @@ class Room:
             # Zoek een vrije positie voor de trap en blok
             max_attempts = 50
             for _ in range(max_attempts):
-                stairs_grid_x = random.randint(2, self.grid_width - 3)
-                stairs_grid_y = random.randint(2, self.grid_height - 3)
+                stairs_grid_x = self.rng.randint(2, self.grid_width - 3)
+                stairs_grid_y = self.rng.randint(2, self.grid_height - 3)
 
                 # Check of deze positie vrij is
                 if (stairs_grid_x, stairs_grid_y) not in self.occupied_tiles:
@@ -262,6 +378,11 @@ class Room:
             # Clear oude dode monsters
             self.monsters.clear()
             self.archers.clear()
+            self.monster_grid.clear()
+            self.archer_grid.clear()
+            self.monster_store.clear()
+            self.archer_store.clear()
+            self.projectiles.clear()
             # Clear drops
             self.health_drops.clear()
             self.rupee_drops.clear()
@@ -269,12 +390,12 @@ class Room:
             # Spawn nieuwe monsters op oorspronkelijke posities
             for config in self.initial_monster_configs:
                 monster = Monster(config['x'], config['y'])
-                self.monsters.append(monster)
+                self.add_monster(monster)
 
             # Spawn nieuwe archers op oorspronkelijke posities
             for config in self.initial_archer_configs:
                 archer = Archer(config['x'], config['y'])
-                self.archers.append(archer)
+                self.add_archer(archer)
 
             # Reset respawn tracking
             self.all_monsters_dead = False
@@ -287,6 +408,9 @@ class Room:
             # Timer loopt al door in update()
             pass
 
+        # Alleen de huidige room houdt een statische laag in het geheugen
+        self.invalidate_static_layer()
+
     def on_player_enter(self):
         """Aangeroepen wanneer de speler de room binnenkomt"""
         # Check of we moeten respawnen
@@ -294,15 +418,43 @@ class Room:
 
     def update(self, screen_width, screen_height, hud_height=HUD_HEIGHT, player=None):
         # Update alle monsters
-        for monster in self.monsters:
-            if monster.alive:
-                monster.update(self.obstacles, screen_width, screen_height, hud_height, self.pushable_block)
+        if len(self.monster_store):
+            # Veel monsters: alles in één batch (zelfde regels als Monster.update)
+            for monster in self.monster_store.sync_alive():
+                self.monster_grid.remove(monster)
+            for monster in self.monster_store.step(self, screen_width, screen_height, hud_height, self.pushable_block):
+                self.monster_grid.update(monster, monster.rect)
+        else:
+            for monster in self.monsters:
+                if monster.alive:
+                    nearby = self.get_obstacles_near(monster.rect.inflate(ENTITY_QUERY_MARGIN, ENTITY_QUERY_MARGIN))
+                    monster.update(nearby, screen_width, screen_height, hud_height, self.pushable_block)
+                    self.monster_grid.update(monster, monster.rect)
+                elif monster in self.monster_grid:
+                    self.monster_grid.remove(monster)
 
         # Update alle archers (hebben player nodig om te mikken)
         if player:
-            for archer in self.archers:
-                if archer.alive:
-                    archer.update(self.obstacles, screen_width, screen_height, hud_height, self.pushable_block, player)
+            if len(self.archer_store):
+                for archer in self.archer_store.sync_alive():
+                    self.archer_grid.remove(archer)
+                for archer in self.archer_store.step(self, screen_width, screen_height, hud_height, self.pushable_block):
+                    self.archer_grid.update(archer, archer.rect)
+                for archer in self.archers:
+                    if archer.alive:
+                        archer.update_shooting(player, self.projectiles)
+            else:
+                for archer in self.archers:
+                    if archer.alive:
+                        nearby = self.get_obstacles_near(archer.rect.inflate(ENTITY_QUERY_MARGIN, ENTITY_QUERY_MARGIN))
+                        archer.update(nearby, screen_width, screen_height, hud_height, self.pushable_block,
+                                      player, self.projectiles)
+                        self.archer_grid.update(archer, archer.rect)
+                    elif archer in self.archer_grid:
+                        self.archer_grid.remove(archer)
+
+            # Beweeg alle pijlen in één keer, weg als ze buiten het scherm zijn
+            self.projectiles.step(0, hud_height, screen_width, screen_height)
 
         # Check of alle monsters EN archers dood zijn
         all_enemies_dead = (len(self.monsters) + len(self.archers) > 0 and
@@ -338,6 +490,46 @@ class Room:
                 self.rupee_drops.remove(rupee_drop)
 
     def render(self, screen, hud_height=HUD_HEIGHT):
+        # Achtergrond, muren, obstakels, trap en blok in één blit
+        self.render_static(screen, hud_height)
+        self.render_dynamic(screen)
+
+    def render_dynamic(self, screen):
+        """Teken alles wat kan bewegen of verdwijnen (bovenop de statische laag)"""
+        # Render items
+        for item in self.items:
+            item.render(screen)
+
+        # Render health drops
+        for health_drop in self.health_drops:
+            health_drop.render(screen)
+
+        # Render rupee drops
+        for rupee_drop in self.rupee_drops:
+            rupee_drop.render(screen)
+
+        # Render monsters en archers
+        for monster in self.monsters:
+            monster.render(screen)
+
+        for archer in self.archers:
+            archer.render(screen)
+
+        # Render pijlen
+        self.projectiles.render(screen)
+
+    def get_dirty_rects(self):
+        """Rects van alles wat render_dynamic() deze frame tekent"""
+        rects = [item.get_render_rect() for item in self.items if not item.collected]
+        rects.extend(health_drop.get_render_rect() for health_drop in self.health_drops)
+        rects.extend(rupee_drop.get_render_rect() for rupee_drop in self.rupee_drops)
+        rects.extend(monster.get_render_rect() for monster in self.monsters if monster.alive)
+        rects.extend(archer.get_render_rect() for archer in self.archers if archer.alive)
+        rects.extend(self.projectiles.get_render_rects())
+        return rects
+
+    def render_static_layer(self, screen, hud_height=HUD_HEIGHT):
+        """Teken alles wat niet beweegt na generate_obstacles (gecachet door StaticLayerMixin)"""
         # Teken achtergrond alleen in game field gebied (onder HUD)
         game_area = pygame.Rect(0, hud_height, self.screen_width, self.screen_height)
         pygame.draw.rect(screen, BACKGROUND_COLOR, game_area)
@@ -406,66 +598,146 @@ class Room:
         if self.pushable_block:
             self.pushable_block.render(screen)
 
-        # Render items
-        for item in self.items:
-            item.render(screen)
-
-        # Render health drops
-        for health_drop in self.health_drops:
-            health_drop.render(screen)
-
-        # Render rupee drops
-        for rupee_drop in self.rupee_drops:
-            rupee_drop.render(screen)
-
-        # Render monsters en archers
-        for monster in self.monsters:
-            monster.render(screen)
-
-        for archer in self.archers:
-            archer.render(screen)
+        # Render grot ingang (als deze room er een heeft)
+        if self.cave_entrance:
+            self.cave_entrance.render(screen)
 
 class RoomManager:
-    def __init__(self, screen_width=GAME_WIDTH, screen_height=GAME_HEIGHT, world_width=3, world_height=3, cave_entrances=None):
-        self.rooms = {}
+    """Beheert de overworld rooms - rooms worden pas gegenereerd als ze nodig zijn
+
+    Elke room krijgt een eigen RNG afgeleid van de world seed en zijn coördinaten,
+    dus een room ziet er hetzelfde uit ongeacht wanneer (of in welke volgorde) hij
+    gegenereerd wordt. Het opstarten kost daardoor evenveel voor een 3x3 als een
+    256x256 wereld. Met prefetch worden ook de buren van de huidige room alvast
+    gegenereerd, zodat een room transition geen generatie hapering geeft.
+
+    Er blijven maximaal max_resident_rooms rooms als objecten in het geheugen (LRU,
+    de huidige room en zijn buren nooit). Een verdrongen room waar de speler geweest
+    is wordt met encode_room() compact bewaard en bij terugkomst weer opgebouwd; een
+    room waar de speler nooit was kan gewoon opnieuw gegenereerd worden.
+    """
+
+    def __init__(self, screen_width=GAME_WIDTH, screen_height=GAME_HEIGHT, world_width=3, world_height=3,
+                 cave_entrances=None, prefetch=True, max_resident_rooms=ROOM_CACHE_SIZE):
+        self.rooms = OrderedDict()  # Rooms die als object in het geheugen staan, oudste eerst
+        self.evicted = {}  # (x, y) -> bytes van verdrongen rooms waar de speler geweest is
+        self.entered = set()  # Rooms waar de speler geweest is (die kunnen afwijken van de generatie)
         self.current_room = (1, 1) # spawn in het middelste scherm
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.world_width = world_width
         self.world_height = world_height
         self.cave_entrances = cave_entrances or {}
-        self.create_world()
+        self.prefetch = prefetch
+        # Huidige room + 4 buren moeten er altijd in passen
+        self.max_resident_rooms = max(max_resident_rooms, 5)
+        self.entered.add(self.current_room)
+        self.prefetch_neighbors(self.current_room)
+
+    def in_world(self, x, y):
+        return 0 <= x < self.world_width and 0 <= y < self.world_height
+
+    def get_room(self, x, y):
+        """Geef de room op (x, y) terug en genereer (of herstel) hem als hij niet in het geheugen staat"""
+        room = self.rooms.get((x, y))
+        if room is not None:
+            self.rooms.move_to_end((x, y))
+            return room
+        data = self.evicted.pop((x, y), None)
+        if data is not None:
+            room = decode_room(self.create_empty_room(x, y), data)
+        else:
+            room = self.create_room(x, y)
+        self.rooms[(x, y)] = room
+        return room
+
+    def create_empty_room(self, x, y):
+        """Room met alleen exits en cave entrance (de rest komt uit generatie of decode_room)"""
+        room = Room(x, y, self.screen_width, self.screen_height, rng=make_room_random(x, y))
+        # Voeg exits toe (simpel: alle aangrenzende kamers)
+        if x > 0:
+            room.add_exit('west')
+        if x < self.world_width - 1:
+            room.add_exit('east')
+        if y > 0:
+            room.add_exit('north')
+        if y < self.world_height - 1:
+            room.add_exit('south')
+
+        if (x, y) in self.cave_entrances:
+            room.cave_entrance, _ = self.cave_entrances[(x, y)]
+        return room
+
+    def create_room(self, x, y):
+        """Genereer één room met zijn eigen RNG stream"""
+        room = self.create_empty_room(x, y)
+
+        # Geef cave entrance rect door als deze room een cave heeft
+        cave_rect = room.cave_entrance.rect if room.cave_entrance else None
+
+        # NU genereren we de content, nadat exits zijn ingesteld
+        room.generate_obstacles(cave_rect=cave_rect)
+        room.generate_monsters()
+        room.generate_secret_stairs()
+        return room
+
+    def get_neighbors(self, room_pos):
+        x, y = room_pos
+        return [(nx, ny) for nx, ny in ((x, y - 1), (x, y + 1), (x + 1, y), (x - 1, y))
+                if self.in_world(nx, ny)]
+
+    def prefetch_neighbors(self, room_pos):
+        """Genereer de huidige room en (met prefetch) zijn buren alvast"""
+        self.get_room(*room_pos)
+        if self.prefetch:
+            for neighbor in self.get_neighbors(room_pos):
+                self.get_room(*neighbor)
+        self.evict_rooms()
+
+    def evict_rooms(self):
+        """Verdring de minst recent gebruikte rooms tot er max_resident_rooms over zijn"""
+        if len(self.rooms) <= self.max_resident_rooms:
+            return
+        keep = {self.current_room, *self.get_neighbors(self.current_room)}
+        for pos in [pos for pos in self.rooms if pos not in keep]:
+            if len(self.rooms) <= self.max_resident_rooms:
+                break
+            self.evict_room(pos)
+
+    def evict_room(self, pos):
+        room = self.rooms.pop(pos)
+        if pos in self.entered:
+            self.evicted[pos] = encode_room(room)
+
+    def encode_rooms(self):
+        """Alle rooms waar de speler geweest is als bytes (voor save games)"""
+        encoded = {pos: data for pos, data in self.evicted.items()}
+        for pos, room in self.rooms.items():
+            if pos in self.entered:
+                encoded[pos] = encode_room(room)
+        return encoded
+
+    def restore_rooms(self, current_room, encoded):
+        """Vervang alle rooms door die uit encode_rooms(); de rest wordt opnieuw gegenereerd"""
+        self.rooms = OrderedDict()
+        self.evicted = dict(encoded)
+        self.entered = set(encoded)
+        self.current_room = current_room
+        self.entered.add(current_room)
+        self.prefetch_neighbors(current_room)
 
     def create_world(self):
+        """Genereer alle rooms in één keer (alleen nodig voor tools, de game doet het lazy)"""
+        self.max_resident_rooms = max(self.max_resident_rooms, self.world_width * self.world_height)
         for x in range(self.world_width):
             for y in range(self.world_height):
-                room = Room(x, y, self.screen_width, self.screen_height)
-                # Voeg exits toe (simpel: alle aangrenzende kamers)
-                if x > 0:
-                    room.add_exit('west')
-                if x < self.world_width - 1:
-                    room.add_exit('east')
-                if y > 0:
-                    room.add_exit('north')
-                if y < self.world_height - 1:
-                    room.add_exit('south')
-
-                # Geef cave entrance rect door als deze room een cave heeft
-                cave_rect = None
-                if (x, y) in self.cave_entrances:
-                    cave_entrance, _ = self.cave_entrances[(x, y)]
-                    cave_rect = cave_entrance.rect
-
-                # NU genereren we de content, nadat exits zijn ingesteld
-                room.generate_obstacles(cave_rect=cave_rect)
-                room.generate_monsters()
-                room.generate_secret_stairs()
-
-                self.rooms[(x, y)] = room
-    
+                self.get_room(x, y)
+
     def get_current_room(self):
-        return self.rooms[self.current_room]
-    
+        # current_room wordt ook van buitenaf gezet (cave en dungeon exits)
+        self.entered.add(self.current_room)
+        return self.get_room(*self.current_room)
+
     def change_room(self, direction):
         x, y = self.current_room
         if direction == 'north':
@@ -477,7 +749,9 @@ class RoomManager:
         elif direction == 'west':
             x -= 1
             
-        if (x, y) in self.rooms:
+        if self.in_world(x, y):
             self.current_room = (x, y)
+            self.entered.add(self.current_room)
+            self.prefetch_neighbors(self.current_room)
             return True
         return False
\ No newline at end of file
@@ -0,0 +1,186 @@
+import struct
+from entities.monster import Monster
+from entities.archer import Archer
+from items.health_drop import HealthDrop
+from items.rupee import Rupee
+from items.pushable_block import PushableBlock
+from world.hidden_stairs import HiddenStairs
+from world.obstacle import Obstacle
+from world.entity_store import DIRECTIONS, DIRECTION_CODES
+from constants import OBSTACLE_TILE_CODES, TILE_EMPTY
+
+# Compacte binaire vorm van een overworld room (voor eviction en save games).
+# Alles is little-endian; de layout staat hieronder per blok beschreven.
+ROOM_CODEC_VERSION = 1
+
+OBSTACLE_TILE_TYPES = {code: name for name, code in OBSTACLE_TILE_CODES.items()}
+
+_HEADER = struct.Struct('<BHHBi')  # versie, grid breedte, grid hoogte, flags, respawn timer
+_STAIRS = struct.Struct('<hhH')  # pixel x, pixel y, reveal timer
+_BLOCK = struct.Struct('<hh')  # pixel x, pixel y
+COUNT = struct.Struct('<H')
+_CONFIG = struct.Struct('<hh')  # oorspronkelijke positie van een vijand (voor respawn)
+_MONSTER = struct.Struct('<ddbBHHH')  # x, y, health, richting, timer, interval, damage cooldown
+_ARCHER = struct.Struct('<ddbBHHHH')  # zelfde als monster + shoot cooldown
+_HEALTH_DROP = struct.Struct('<ddH')  # x, y, lifetime
+_RUPEE = struct.Struct('<ddBHd')  # x, y, waarde, lifetime, animatie offset
+
+FLAG_ALL_MONSTERS_DEAD = 1
+FLAG_HIDDEN_STAIRS = 2
+FLAG_STAIRS_REVEALED = 4
+FLAG_PUSHABLE_BLOCK = 8
+FLAG_BLOCK_PUSHED = 16
+
+
+def pack_list(parts, layout, rows):
+    parts.append(COUNT.pack(len(rows)))
+    parts.extend(layout.pack(*row) for row in rows)
+
+
+def _unpack_list(data, offset, layout):
+    count, = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    rows = []
+    for _ in range(count):
+        rows.append(layout.unpack_from(data, offset))
+        offset += layout.size
+    return rows, offset
+
+
+def pack_drops(parts, room):
+    """Health en rupee drops die nog liggen (ook gebruikt door de save snapshot)"""
+    pack_list(parts, _HEALTH_DROP, [(d.x, d.y, d.lifetime) for d in room.health_drops if not d.collected])
+    pack_list(parts, _RUPEE, [(r.x, r.y, r.value, r.lifetime, r.animation_offset)
+                              for r in room.rupee_drops if not r.collected])
+
+
+def unpack_drops(data, offset, room):
+    """Vervang de drops van room door die uit pack_drops; geeft de offset erna terug"""
+    room.health_drops.clear()
+    rows, offset = _unpack_list(data, offset, _HEALTH_DROP)
+    for x, y, lifetime in rows:
+        drop = HealthDrop(x, y)
+        drop.lifetime = lifetime
+        room.health_drops.append(drop)
+    room.rupee_drops.clear()
+    rows, offset = _unpack_list(data, offset, _RUPEE)
+    for x, y, value, lifetime, animation_offset in rows:
+        rupee = Rupee(x, y, value)
+        rupee.lifetime = lifetime
+        rupee.animation_offset = animation_offset
+        room.rupee_drops.append(rupee)
+    return offset
+
+
+def encode_room(room):
+    """Zet de toestand van een room om naar bytes
+
+    Bewaard worden de obstakel tiles, trap en duwbaar blok, de respawn configs, de
+    levende vijanden, de drops en de respawn timer. Pijlen in de lucht en dode
+    vijanden gaan verloren; de rest (muren, exits, cave) komt van de RoomManager.
+    """
+    flags = FLAG_ALL_MONSTERS_DEAD if room.all_monsters_dead else 0
+    stairs = room.hidden_stairs
+    block = room.pushable_block
+    if stairs:
+        flags |= FLAG_HIDDEN_STAIRS
+        if stairs.revealed:
+            flags |= FLAG_STAIRS_REVEALED
+    if block:
+        flags |= FLAG_PUSHABLE_BLOCK
+        if block.has_been_pushed:
+            flags |= FLAG_BLOCK_PUSHED
+
+    parts = [_HEADER.pack(ROOM_CODEC_VERSION, room.grid_width, room.grid_height, flags, room.respawn_timer),
+             bytes(room.tile_map)]
+    if stairs:
+        parts.append(_STAIRS.pack(stairs.x, stairs.y, stairs.reveal_timer))
+    if block:
+        parts.append(_BLOCK.pack(block.x, block.y))
+
+    pack_list(parts, _CONFIG, [(config['x'], config['y']) for config in room.initial_monster_configs])
+    pack_list(parts, _CONFIG, [(config['x'], config['y']) for config in room.initial_archer_configs])
+
+    # direction_timer staat bij veel vijanden alleen in de batch store
+    room.monster_store.write_back()
+    room.archer_store.write_back()
+    pack_list(parts, _MONSTER, [
+        (m.x, m.y, m.health, DIRECTION_CODES[m.direction], m.direction_timer,
+         m.direction_change_interval, m.damage_cooldown)
+        for m in room.monsters if m.alive])
+    pack_list(parts, _ARCHER, [
+        (a.x, a.y, a.health, DIRECTION_CODES[a.direction], a.direction_timer,
+         a.direction_change_interval, a.damage_cooldown, a.shoot_cooldown)
+        for a in room.archers if a.alive])
+
+    pack_drops(parts, room)
+    return b''.join(parts)
+
+
+def _restore_enemy(entity, health, direction, direction_timer, interval, damage_cooldown):
+    entity.health = health
+    entity.direction = DIRECTIONS[direction]
+    entity.direction_timer = direction_timer
+    entity.direction_change_interval = interval
+    entity.damage_cooldown = damage_cooldown
+    entity.can_damage = damage_cooldown == 0
+
+
+def decode_room(room, data):
+    """Vul een lege room (exits en cave al ingesteld) met de toestand uit encode_room()"""
+    version, grid_width, grid_height, flags, respawn_timer = _HEADER.unpack_from(data, 0)
+    if version != ROOM_CODEC_VERSION:
+        raise ValueError(f"Onbekende room codec versie {version}")
+    if (grid_width, grid_height) != (room.grid_width, room.grid_height):
+        raise ValueError("Room grid past niet bij de opgeslagen tile map")
+    offset = _HEADER.size
+
+    # Obstakels terug uit de tile map
+    tile_count = grid_width * grid_height
+    tile_map = data[offset:offset + tile_count]
+    offset += tile_count
+    for index, code in enumerate(tile_map):
+        if code != TILE_EMPTY:
+            grid_x, grid_y = index % grid_width, index // grid_width
+            x = room.grid_origin_x + grid_x * room.tile_size
+            y = room.grid_origin_y + grid_y * room.tile_size
+            room.add_obstacle(Obstacle(x, y, room.tile_size, room.tile_size, OBSTACLE_TILE_TYPES[code]),
+                              grid_x, grid_y)
+            room.occupied_tiles.add((grid_x, grid_y))
+
+    if flags & FLAG_HIDDEN_STAIRS:
+        x, y, reveal_timer = _STAIRS.unpack_from(data, offset)
+        offset += _STAIRS.size
+        room.hidden_stairs = HiddenStairs(x, y, room.tile_size)
+        room.hidden_stairs.revealed = bool(flags & FLAG_STAIRS_REVEALED)
+        room.hidden_stairs.reveal_timer = reveal_timer
+        room.occupied_tiles.add(((x - room.grid_origin_x) // room.tile_size,
+                                 (y - room.grid_origin_y) // room.tile_size))
+    if flags & FLAG_PUSHABLE_BLOCK:
+        x, y = _BLOCK.unpack_from(data, offset)
+        offset += _BLOCK.size
+        room.pushable_block = PushableBlock(x, y, room.tile_size)
+        room.pushable_block.has_been_pushed = bool(flags & FLAG_BLOCK_PUSHED)
+
+    configs, offset = _unpack_list(data, offset, _CONFIG)
+    room.initial_monster_configs = [{'x': x, 'y': y} for x, y in configs]
+    configs, offset = _unpack_list(data, offset, _CONFIG)
+    room.initial_archer_configs = [{'x': x, 'y': y} for x, y in configs]
+
+    rows, offset = _unpack_list(data, offset, _MONSTER)
+    for x, y, health, direction, direction_timer, interval, damage_cooldown in rows:
+        monster = Monster(x, y)
+        _restore_enemy(monster, health, direction, direction_timer, interval, damage_cooldown)
+        room.add_monster(monster)
+    rows, offset = _unpack_list(data, offset, _ARCHER)
+    for x, y, health, direction, direction_timer, interval, damage_cooldown, shoot_cooldown in rows:
+        archer = Archer(x, y)
+        _restore_enemy(archer, health, direction, direction_timer, interval, damage_cooldown)
+        archer.shoot_cooldown = shoot_cooldown
+        room.add_archer(archer)
+
+    offset = unpack_drops(data, offset, room)
+
+    room.all_monsters_dead = bool(flags & FLAG_ALL_MONSTERS_DEAD)
+    room.respawn_timer = respawn_timer
+    return room
@@ -4,6 +4,7 @@ from entities.old_man import OldMan
 from items.heart_container import HeartContainer
 from items.shield_item import ShieldItem
 from world.fire import Fire
+from managers.text_cache import get_text_cache
 from constants import HUD_HEIGHT, GAME_WIDTH, GAME_HEIGHT
 
 class ShopCaveRoom(BaseCaveRoom):
@@ -82,13 +83,14 @@ class ShopCaveRoom(BaseCaveRoom):
         if self.heart_purchased and self.shield_purchased:
             self.old_man.visible = False
 
-        return purchased
+        if purchased:
+            # Gekochte items verdwijnen uit de statische laag
+            self.invalidate_static_layer()
 
-    def render(self, screen, hud_height):
-        """Render de shop cave"""
-        # Render de basis cave (muren, exit, etc)
-        super().render(screen, hud_height)
+        return purchased
 
+    def render_content(self, screen):
+        """Render shop specifieke content"""
         # Render oude man
         self.old_man.render(screen)
 
@@ -105,8 +107,7 @@ class ShopCaveRoom(BaseCaveRoom):
     def _render_price(self, screen, item, price):
         """Helper methode om prijs boven een item te renderen"""
         # Render prijs boven het item
-        font = pygame.font.Font(None, 32)
-        price_text = font.render(f"{price}", True, (255, 215, 0))
+        price_text = get_text_cache().render(f"{price}", 32, (255, 215, 0))
 
         # Teken een klein rupee symbool naast de prijs
         rupee_size = 12
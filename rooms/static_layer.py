@@ -0,0 +1,37 @@
+import pygame
+from constants import HUD_HEIGHT
+
+
+class StaticLayerMixin:
+    """Cachet alles wat niet beweegt (achtergrond, muren, obstakels) in één Surface
+
+    Subclasses implementeren render_static_layer(surface, hud_height). De laag wordt
+    pas opnieuw getekend na invalidate_static_layer(), bijvoorbeeld als een blok
+    verschoven wordt of een trap onthuld. static_version telt die momenten, zodat
+    ook andere caches (zonder te renderen) weten wanneer ze verouderd zijn.
+    """
+
+    static_layer = None
+    static_version = 0
+
+    def render_static_layer(self, surface, hud_height):
+        """Override: teken de statische inhoud van de room op surface"""
+        raise NotImplementedError
+
+    def invalidate_static_layer(self):
+        """Markeer de statische laag als verouderd (wordt bij de volgende render opnieuw getekend)"""
+        self.static_layer = None
+        self.static_version += 1
+
+    def get_static_layer(self, hud_height=HUD_HEIGHT):
+        """Geef de statische laag terug, teken hem eerst als hij nog niet bestaat"""
+        if self.static_layer is None:
+            # Zelfde coördinaten als het scherm, zodat bestaande render code ongewijzigd werkt
+            self.static_layer = pygame.Surface((self.screen_width, hud_height + self.screen_height))
+            self.render_static_layer(self.static_layer, hud_height)
+        return self.static_layer
+
+    def render_static(self, screen, hud_height=HUD_HEIGHT):
+        """Blit de statische laag over het hele speelveld"""
+        layer = self.get_static_layer(hud_height)
+        screen.blit(layer, (0, hud_height), (0, hud_height, self.screen_width, self.screen_height))
@@ -0,0 +1,237 @@
+import numpy as np
+from constants import WALL_THICKNESS, HUD_HEIGHT
+from world.random_streams import make_numpy_generator
+
+# Zelfde volgorde als ai_random.choice(['left', 'right', 'up', 'down']) in Monster/Archer
+DIRECTIONS = ('left', 'right', 'up', 'down')
+DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTIONS)}
+DIRECTION_DX = np.array([-1.0, 1.0, 0.0, 0.0])
+DIRECTION_DY = np.array([0.0, 0.0, -1.0, 1.0])
+
+# Bereik van direction_change_interval (zelfde als ai_random.randint(60, 180))
+DIRECTION_INTERVAL_MIN = 60
+DIRECTION_INTERVAL_MAX = 180
+
+
+def round_like_rect(values):
+    """Rond af zoals pygame.Rect bij float toewijzing (halve pixels van nul af)"""
+    return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
+
+
+class EntityStore:
+    """Structure-of-arrays opslag voor rondzwervende vijanden (Monster, Archer)
+
+    Positie, snelheid, richting, timers, health en damage cooldown staan in NumPy
+    kolommen, zodat step() alle vijanden van een room in één keer beweegt - inclusief
+    muur-bounce, obstakel rollback (via de occupancy map van de room) en het pushable
+    block. De objecten blijven bestaan voor combat en rendering; step() schrijft de
+    nieuwe waarden naar ze terug (direction_timer alleen via write_back()).
+
+    Entities mogen niet groter zijn dan een tile (zie Room.rects_hit_obstacle).
+    """
+
+    COLUMNS = ('x', 'y', 'vx', 'vy', 'speed', 'width', 'height', 'rect_x', 'rect_y',
+               'direction', 'direction_timer', 'direction_interval', 'health',
+               'damage_cooldown', 'active')
+
+    def __init__(self, cell_size, origin=(0, 0), capacity=16, seed=None):
+        # Cel raster van de spatial hash - step() meldt welke entities van cel wisselen
+        self.cell_size = cell_size
+        self.origin_x, self.origin_y = origin
+        # Pas bij de eerste add() geseed (uit de AI stream), zodat een lege store die stream niet verschuift
+        self.seed = seed
+        self.rng = None
+        self.objects = []
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.width = np.zeros(capacity, dtype=np.int64)
+        self.height = np.zeros(capacity, dtype=np.int64)
+        self.rect_x = np.zeros(capacity, dtype=np.int64)
+        self.rect_y = np.zeros(capacity, dtype=np.int64)
+        self.direction = np.zeros(capacity, dtype=np.int64)
+        self.direction_timer = np.zeros(capacity, dtype=np.int64)
+        self.direction_interval = np.zeros(capacity, dtype=np.int64)
+        self.health = np.zeros(capacity, dtype=np.int64)
+        self.damage_cooldown = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+    def _grow(self):
+        """Verdubbel de capaciteit en kopieer de bestaande kolommen"""
+        old = {name: getattr(self, name) for name in self.COLUMNS}
+        self._allocate(self.capacity * 2)
+        for name, column in old.items():
+            getattr(self, name)[:self.count] = column[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def add(self, entity):
+        """Voeg een entity toe (neemt de huidige waarden van het object over)"""
+        if self.rng is None:
+            self.rng = make_numpy_generator() if self.seed is None else np.random.default_rng(self.seed)
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        self.objects.append(entity)
+        self.x[i] = entity.x
+        self.y[i] = entity.y
+        self.speed[i] = entity.speed
+        self.width[i] = entity.width
+        self.height[i] = entity.height
+        self.rect_x[i] = entity.rect.x
+        self.rect_y[i] = entity.rect.y
+        self.direction[i] = DIRECTION_CODES[entity.direction]
+        self.vx[i] = DIRECTION_DX[self.direction[i]] * entity.speed
+        self.vy[i] = DIRECTION_DY[self.direction[i]] * entity.speed
+        self.direction_timer[i] = entity.direction_timer
+        self.direction_interval[i] = entity.direction_change_interval
+        self.health[i] = entity.health
+        self.damage_cooldown[i] = entity.damage_cooldown
+        self.active[i] = entity.alive
+        self.count += 1
+
+    def clear(self):
+        self.objects.clear()
+        self.count = 0
+        self.active[:] = False
+
+    def sync_alive(self):
+        """Neem health, alive en damage cooldown over die combat op de objecten zette
+
+        Returns: list van entities die sinds de vorige sync zijn doodgegaan
+        """
+        n = self.count
+        if n == 0:
+            return []
+        objects = self.objects
+        self.health[:n] = [entity.health for entity in objects]
+        self.damage_cooldown[:n] = [entity.damage_cooldown for entity in objects]
+        alive = np.array([entity.alive for entity in objects], dtype=bool)
+        died = np.flatnonzero(self.active[:n] & ~alive)
+        self.active[:n] &= alive
+        return [objects[i] for i in died.tolist()]
+
+    def _cells(self, rect_x, rect_y, width, height):
+        """Cel bereik (zelfde als SpatialHash._cells_for) per entity"""
+        size = self.cell_size
+        left = rect_x - self.origin_x
+        top = rect_y - self.origin_y
+        return left // size, top // size, (left + width - 1) // size, (top + height - 1) // size
+
+    def step(self, room, screen_width, screen_height, hud_height=HUD_HEIGHT, pushable_block=None):
+        """Beweeg alle levende entities één frame (batch versie van Monster.update)
+
+        Returns: list van entities die van spatial hash cel gewisseld zijn
+        """
+        active = np.flatnonzero(self.active[:self.count])
+        if active.size == 0:
+            return []
+        # Als iedereen leeft zijn slices (views) goedkoper dan fancy indexing
+        rows = slice(0, self.count) if active.size == self.count else active
+
+        # Verander af en toe van richting
+        timer = self.direction_timer[rows] + 1
+        direction = self.direction[rows]
+        interval = self.direction_interval[rows]
+        change = timer >= interval
+        changes = np.count_nonzero(change)
+        if changes:
+            direction[change] = self.rng.integers(0, 4, changes)
+            timer[change] = 0
+            interval[change] = self.rng.integers(DIRECTION_INTERVAL_MIN, DIRECTION_INTERVAL_MAX + 1, changes)
+
+        # Beweeg in de huidige richting
+        old_x = self.x[rows]
+        old_y = self.y[rows]
+        speed = self.speed[rows]
+        new_x = old_x + DIRECTION_DX[direction] * speed
+        new_y = old_y + DIRECTION_DY[direction] * speed
+        width = self.width[rows]
+        height = self.height[rows]
+
+        # Muur collisions op de float positie - alleen de botsende as gaat terug
+        hit_x = (new_x < WALL_THICKNESS) | (new_x + width > screen_width - WALL_THICKNESS)
+        hit_y = (new_y < hud_height + WALL_THICKNESS) | (new_y + height > screen_height - WALL_THICKNESS)
+        x = np.where(hit_x, old_x, new_x)
+        y = np.where(hit_y, old_y, new_y)
+
+        # Obstakels en pushable block op de bewogen rect - hele stap terug
+        moved_rect_x = round_like_rect(new_x)
+        moved_rect_y = round_like_rect(new_y)
+        blocked = room.rects_hit_obstacle(moved_rect_x, moved_rect_y, width, height)
+        if pushable_block:
+            block = pushable_block.rect
+            blocked |= ((moved_rect_x < block.right) & (moved_rect_x + width > block.left) &
+                        (moved_rect_y < block.bottom) & (moved_rect_y + height > block.top))
+        x[blocked] = old_x[blocked]
+        y[blocked] = old_y[blocked]
+
+        # Nieuwe willekeurige richting na elke botsing
+        bounced = hit_x | hit_y | blocked
+        bounces = np.count_nonzero(bounced)
+        if bounces:
+            direction[bounced] = self.rng.integers(0, 4, bounces)
+            timer[bounced] = 0
+
+        rect_x = round_like_rect(x)
+        rect_y = round_like_rect(y)
+
+        # Damage cooldown
+        cooldown = self.damage_cooldown[rows]
+        cooling = cooldown > 0
+        cooldown = np.where(cooling, cooldown - 1, 0)
+
+        # Welke entities wisselen van spatial hash cel
+        old_cells = self._cells(self.rect_x[rows], self.rect_y[rows], width, height)
+        new_cells = self._cells(rect_x, rect_y, width, height)
+        crossed = np.zeros(active.size, dtype=bool)
+        for old, new in zip(old_cells, new_cells):
+            crossed |= old != new
+
+        # Terugschrijven naar de kolommen
+        self.x[rows] = x
+        self.y[rows] = y
+        self.vx[rows] = DIRECTION_DX[direction] * speed
+        self.vy[rows] = DIRECTION_DY[direction] * speed
+        self.rect_x[rows] = rect_x
+        self.rect_y[rows] = rect_y
+        self.direction[rows] = direction
+        self.direction_timer[rows] = timer
+        self.direction_interval[rows] = interval
+        self.damage_cooldown[rows] = cooldown
+
+        # ...en naar de objecten: positie elke frame, de rest alleen als het veranderd is
+        objects = self.objects
+        for i, ex, ey, rx, ry in zip(active.tolist(), x.tolist(), y.tolist(),
+                                     rect_x.tolist(), rect_y.tolist()):
+            entity = objects[i]
+            entity.x = ex
+            entity.y = ey
+            entity.rect.topleft = (rx, ry)
+
+        turned = change | bounced
+        for i, code, iv in zip(active[turned].tolist(), direction[turned].tolist(),
+                               interval[turned].tolist()):
+            entity = objects[i]
+            entity.direction = DIRECTIONS[code]
+            entity.direction_change_interval = iv
+
+        for i, dc in zip(active[cooling].tolist(), cooldown[cooling].tolist()):
+            entity = objects[i]
+            entity.damage_cooldown = dc
+            entity.can_damage = dc == 0
+
+        return [objects[i] for i in active[crossed].tolist()]
+
+    def write_back(self):
+        """Schrijf ook de direction timers naar de objecten (step() houdt die alleen in de kolommen)"""
+        for i, t in zip(range(self.count), self.direction_timer[:self.count].tolist()):
+            self.objects[i].direction_timer = t
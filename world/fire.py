@@ -1,43 +1,52 @@
 import pygame
-import random
-from constants import FIRE_COLOR_1, FIRE_COLOR_2, FIRE_COLOR_3
+from constants import FIRE_WIDTH, FIRE_HEIGHT, FIRE_COLOR_1, FIRE_COLOR_2, FIRE_COLOR_3
+from managers.sprite_atlas import get_sprite_atlas
+from world.random_streams import generation_random
 
 class Fire:
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.width = 20
-        self.height = 25
+        self.width = FIRE_WIDTH
+        self.height = FIRE_HEIGHT
         self.rect = pygame.Rect(x, y, self.width, self.height)
 
         # Animatie
         self.animation_timer = 0
-        self.flicker_offset = random.randint(0, 10)
+        self.flicker_offset = generation_random.randint(0, 10)
 
     def update(self):
         self.animation_timer += 1
 
-    def render(self, screen):
-        # Simpel vuur effect met kleuren die flikkeren
-        base_y = self.y + 15
+    def get_render_rect(self):
+        """Gebied waarin render() tekent (vlammen steken boven de rect uit)"""
+        return pygame.Rect(self.x - 2, self.y - 8, self.width + 4, self.height + 10)
 
+    def render(self, screen):
         # Flikkerende hoogte gebaseerd op timer
         flicker = (self.animation_timer + self.flicker_offset) % 20
         height_offset = 5 if flicker < 10 else 0
-
-        # Vuurkleuren
-        colors = [
-            FIRE_COLOR_1,  # Oranje-rood
-            FIRE_COLOR_2,  # Donker oranje
-            FIRE_COLOR_3   # Goud
-        ]
-
-        # Teken meerdere vlammen voor effect
-        for i, color in enumerate(colors):
-            flame_height = 15 - (i * 3) + height_offset
-            flame_width = 16 - (i * 4)
-            flame_x = self.x + (self.width - flame_width) // 2
-            flame_y = base_y - flame_height
-
-            pygame.draw.ellipse(screen, color,
-                              (flame_x, flame_y, flame_width, flame_height))
+        get_sprite_atlas().blit(screen, ('fire', height_offset), self.x, self.y)
+
+
+def draw_fire(screen, x, y, height_offset):
+    """Teken een vuur met de linkerbovenhoek op (x, y) (wordt gebakken in de sprite atlas)"""
+    # Simpel vuur effect met kleuren die flikkeren
+    base_y = y + 15
+
+    # Vuurkleuren
+    colors = [
+        FIRE_COLOR_1,  # Oranje-rood
+        FIRE_COLOR_2,  # Donker oranje
+        FIRE_COLOR_3   # Goud
+    ]
+
+    # Teken meerdere vlammen voor effect
+    for i, color in enumerate(colors):
+        flame_height = 15 - (i * 3) + height_offset
+        flame_width = 16 - (i * 4)
+        flame_x = x + (FIRE_WIDTH - flame_width) // 2
+        flame_y = base_y - flame_height
+
+        pygame.draw.ellipse(screen, color,
+                          (flame_x, flame_y, flame_width, flame_height))
@@ -0,0 +1,185 @@
+import math
+import numpy as np
+from entities.arrow import render_arrow, get_arrow_render_rect
+from entities.boss import render_fireball, get_fireball_render_rect
+from world.entity_store import round_like_rect
+from constants import (
+    ARROW_SPEED, ARROW_WIDTH, ARROW_HEIGHT, FIREBALL_SPEED, FIREBALL_RADIUS
+)
+
+# Soorten projectielen in de pool
+KIND_ARROW = 0
+KIND_FIREBALL = 1
+KIND_SPEED = (ARROW_SPEED, FIREBALL_SPEED)
+KIND_SIZE = ((ARROW_WIDTH, ARROW_HEIGHT), (FIREBALL_RADIUS * 2, FIREBALL_RADIUS * 2))
+
+
+class ProjectilePool:
+    """Gedeelde pool voor alle projectielen (pijlen, vuurballen) in één room
+
+    Slots worden vooraf gealloceerd en via een free list hergebruikt, zodat schieten
+    en verwijderen geen objecten aanmaakt en geen list.remove() kost. step() beweegt
+    alle projectielen in één numpy operatie en gooit ze weg buiten de grenzen; hit
+    tests tegen een rect of de occupancy map zijn ook gevectoriseerd. Elk projectiel
+    onthoudt zijn eigenaar, zodat een dode archer of boss zijn projectielen meeneemt.
+    """
+
+    def __init__(self, capacity=32):
+        self.capacity = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.dx = np.zeros(0)
+        self.dy = np.zeros(0)
+        self.angle = np.zeros(0)
+        self.width = np.zeros(0, dtype=np.int64)
+        self.height = np.zeros(0, dtype=np.int64)
+        self.rect_x = np.zeros(0, dtype=np.int64)
+        self.rect_y = np.zeros(0, dtype=np.int64)
+        self.kind = np.zeros(0, dtype=np.int64)
+        self.owner = np.zeros(0, dtype=np.int64)
+        self.active = np.zeros(0, dtype=bool)
+        self.free_slots = []  # Stack: laagste vrije slot ligt bovenop
+        self.owner_ids = {}  # eigenaar -> nummer in de owner kolom
+        self.count = 0
+        self._grow(capacity)
+
+    COLUMNS = ('x', 'y', 'dx', 'dy', 'angle', 'width', 'height', 'rect_x', 'rect_y',
+               'kind', 'owner', 'active')
+
+    def _grow(self, capacity):
+        """Vergroot de pool (alleen als alle slots bezet zijn)"""
+        old_capacity = self.capacity
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:old_capacity] = column
+            setattr(self, name, grown)
+        self.capacity = capacity
+        self.free_slots = list(range(capacity - 1, old_capacity - 1, -1)) + self.free_slots
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, kind, x, y, dx, dy, owner=None):
+        """Vuur een projectiel af met genormaliseerde richting (dx, dy)
+
+        Returns: het slot nummer van het projectiel
+        """
+        if not self.free_slots:
+            self._grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+
+        speed = KIND_SPEED[kind]
+        width, height = KIND_SIZE[kind]
+        self.x[slot] = x
+        self.y[slot] = y
+        self.dx[slot] = dx * speed
+        self.dy[slot] = dy * speed
+        self.angle[slot] = math.atan2(dy, dx)
+        self.width[slot] = width
+        self.height[slot] = height
+        self.rect_x[slot] = round_like_rect(np.float64(x - width // 2))
+        self.rect_y[slot] = round_like_rect(np.float64(y - height // 2))
+        self.kind[slot] = kind
+        self.owner[slot] = self.owner_ids.setdefault(owner, len(self.owner_ids))
+        self.active[slot] = True
+        self.count += 1
+        return slot
+
+    def spawn_arrow(self, x, y, dx, dy, owner=None):
+        return self.spawn(KIND_ARROW, x, y, dx, dy, owner)
+
+    def spawn_fireball(self, x, y, dx, dy, owner=None):
+        return self.spawn(KIND_FIREBALL, x, y, dx, dy, owner)
+
+    def release(self, slot):
+        """Geef een slot terug aan de free list"""
+        if self.active[slot]:
+            self.active[slot] = False
+            # Vrije slots bewegen niet mee in step()
+            self.dx[slot] = 0.0
+            self.dy[slot] = 0.0
+            self.free_slots.append(slot)
+            self.count -= 1
+
+    def release_slots(self, slots):
+        """Geef meerdere slots tegelijk terug"""
+        for slot in slots.tolist():
+            self.release(slot)
+
+    def release_owner(self, owner):
+        """Verwijder alle projectielen van een eigenaar (bijv. een gestorven archer)"""
+        owner_id = self.owner_ids.get(owner)
+        if owner_id is None or not self.count:
+            return
+        self.release_slots(np.flatnonzero(self.active & (self.owner == owner_id)))
+
+    def clear(self):
+        self.active[:] = False
+        self.dx[:] = 0.0
+        self.dy[:] = 0.0
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+        self.owner_ids.clear()
+        self.count = 0
+
+    def active_slots(self, kind=None):
+        """Slot nummers van alle actieve projectielen (optioneel van één soort)"""
+        if kind is None:
+            return np.flatnonzero(self.active)
+        return np.flatnonzero(self.active & (self.kind == kind))
+
+    def step(self, left, top, right, bottom):
+        """Beweeg alle projectielen en verwijder ze buiten [left, right] x [top, bottom]"""
+        if not self.count:
+            return
+        # Over alle slots tegelijk: vrije slots hebben snelheid 0 en worden genegeerd
+        self.x += self.dx
+        self.y += self.dy
+        self.rect_x[:] = round_like_rect(self.x - self.width // 2)
+        self.rect_y[:] = round_like_rect(self.y - self.height // 2)
+        self.cull(left, top, right, bottom)
+
+    def cull(self, left, top, right, bottom):
+        """Verwijder projectielen waarvan het middelpunt buiten de grenzen ligt"""
+        if not self.count:
+            return
+        outside = self.active & ((self.x < left) | (self.x > right) |
+                                 (self.y < top) | (self.y > bottom))
+        if outside.any():
+            self.release_slots(np.flatnonzero(outside))
+
+    def colliding(self, rect):
+        """Slots van projectielen waarvan de hitbox rect overlapt"""
+        if not self.count:
+            return []
+        hit = (self.active &
+               (self.rect_x < rect.right) & (self.rect_x + self.width > rect.left) &
+               (self.rect_y < rect.bottom) & (self.rect_y + self.height > rect.top))
+        return np.flatnonzero(hit).tolist()
+
+    def cull_obstacles(self, room):
+        """Verwijder projectielen die een obstakel tile van de room raken"""
+        if not self.count:
+            return
+        slots = np.flatnonzero(self.active)
+        hit = room.rects_hit_obstacle(self.rect_x[slots], self.rect_y[slots],
+                                      self.width[slots], self.height[slots])
+        if hit.any():
+            self.release_slots(slots[hit])
+
+    def get_render_rects(self):
+        """Rects van alles wat render() tekent"""
+        rects = []
+        for slot in self.active_slots().tolist():
+            if self.kind[slot] == KIND_ARROW:
+                rects.append(get_arrow_render_rect(self.x[slot], self.y[slot]))
+            else:
+                rects.append(get_fireball_render_rect(self.x[slot], self.y[slot]))
+        return rects
+
+    def render(self, screen):
+        for slot in self.active_slots().tolist():
+            if self.kind[slot] == KIND_ARROW:
+                render_arrow(screen, self.x[slot], self.y[slot], self.angle[slot])
+            else:
+                render_fireball(screen, self.x[slot], self.y[slot])
@@ -0,0 +1,64 @@
+import random
+import hashlib
+import numpy as np
+
+# Aparte RNG streams, zodat bijv. een extra drop roll de wereld generatie of de
+# AI niet verschuift. Het zijn vaste objecten die seed_streams() in-place herseedt,
+# dus modules kunnen ze gewoon importeren.
+generation_random = random.Random()  # Rooms, obstakels, vijand posities, cave entrances
+ai_random = random.Random()  # Vijand bewegingen en animaties
+drops_random = random.Random()  # Item drops van verslagen vijanden
+
+STREAMS = {
+    'generation': generation_random,
+    'ai': ai_random,
+    'drops': drops_random,
+}
+
+world_seed = None
+
+
+def new_world_seed():
+    """Willekeurige seed voor een nieuwe wereld (niet uit een van de streams)"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def derive_seed(seed, name):
+    """Vaste sub-seed per stream (hash() is per proces anders, sha256 niet)"""
+    digest = hashlib.sha256(f"{seed}:{name}".encode()).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+
+def seed_streams(seed):
+    """Seed alle streams vanuit één world seed - zelfde seed geeft dezelfde wereld en simulatie"""
+    global world_seed
+    world_seed = seed
+    for name, stream in STREAMS.items():
+        stream.seed(derive_seed(seed, name))
+
+
+def get_stream_states():
+    """Toestand van alle streams en de world seed (om meerdere games in één proces te draaien)"""
+    return world_seed, tuple(stream.getstate() for stream in STREAMS.values())
+
+
+def set_stream_states(states):
+    """Zet de toestand uit get_stream_states() terug"""
+    global world_seed
+    world_seed, stream_states = states
+    for stream, state in zip(STREAMS.values(), stream_states):
+        stream.setstate(state)
+
+
+def make_room_random(x, y):
+    """Eigen generatie RNG voor de overworld room op (x, y), onafhankelijk van de volgorde"""
+    return random.Random(derive_seed(world_seed, f"room:{x},{y}"))
+
+
+def make_numpy_generator(stream=ai_random):
+    """NumPy generator die zijn seed uit een stream trekt (voor gevectoriseerde AI)"""
+    return np.random.default_rng(stream.getrandbits(64))
+
+
+# Zonder expliciete seed (bijv. losse scripts) is elke run anders, zoals voorheen
+seed_streams(new_world_seed())
@@ -0,0 +1,18 @@
+
+def get_enemies(scene):
+    """Alle vijanden van een room, dungeon room of cave (ook de dode)"""
+    enemies = [*getattr(scene, 'monsters', ()), *getattr(scene, 'archers', ()),
+               *getattr(scene, 'bats', ()), *getattr(scene, 'slimes', ())]
+    boss = getattr(scene, 'boss', None)
+    if boss:
+        enemies.append(boss)
+    return enemies
+
+
+def get_location(game):
+    """Waar de speler is: ('overworld', x, y), ('dungeon', x, y) of ('cave', naam)"""
+    if game.in_dungeon:
+        return ('dungeon',) + game.dungeon_manager.current_room
+    if game.in_cave:
+        return ('cave', game.current_cave)
+    return ('overworld',) + game.room_manager.current_room
@@ -0,0 +1,120 @@
+from constants import TILE_SIZE
+
+
+class SpatialHash:
+    """Uniform grid (op het TILE_SIZE raster) voor broadphase collision queries
+
+    Objecten worden opgeslagen in elke cel die hun rect overlapt. Een query geeft
+    alleen de objecten in de cellen rond de gevraagde rect terug, zodat de kosten
+    schalen met de lokale dichtheid in plaats van met het totale aantal entities.
+    Resultaten komen in invoeg-volgorde terug, zodat de simulatie deterministisch blijft.
+    """
+
+    def __init__(self, cell_size=TILE_SIZE, origin=(0, 0)):
+        self.cell_size = cell_size
+        # Origin zodat cellen samenvallen met de tiles van een room (binnen de muren)
+        self.origin_x, self.origin_y = origin
+        self.cells = {}  # (cel_x, cel_y) -> dict van objecten
+        self.object_cells = {}  # object -> tuple van cellen waar het in staat
+        self.order = {}  # object -> volgnummer (voor deterministische volgorde)
+        self.next_order = 0
+
+    def __len__(self):
+        return len(self.object_cells)
+
+    def __contains__(self, obj):
+        return obj in self.object_cells
+
+    def _cells_for(self, rect):
+        """Alle cellen die een rect overlapt"""
+        size = self.cell_size
+        left = rect.left - self.origin_x
+        top = rect.top - self.origin_y
+        x0 = left // size
+        y0 = top // size
+        # right/bottom zijn exclusief, dus de laatste pixel telt
+        x1 = (left + rect.width - 1) // size
+        y1 = (top + rect.height - 1) // size
+        if x0 == x1 and y0 == y1:
+            return ((x0, y0),)
+        return tuple((cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+
+    def insert(self, obj, rect):
+        """Voeg een object toe (of werk het bij als het er al in staat)"""
+        if obj in self.object_cells:
+            self.update(obj, rect)
+            return
+
+        cells = self._cells_for(rect)
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                bucket = self.cells[cell] = {}
+            bucket[obj] = None
+        self.object_cells[obj] = cells
+        self.order[obj] = self.next_order
+        self.next_order += 1
+
+    def remove(self, obj):
+        """Haal een object uit de grid"""
+        cells = self.object_cells.pop(obj, None)
+        if cells is None:
+            return
+        del self.order[obj]
+        for cell in cells:
+            bucket = self.cells[cell]
+            del bucket[obj]
+            if not bucket:
+                del self.cells[cell]
+
+    def update(self, obj, rect):
+        """Werk de cellen van een bewegend object bij (goedkoop als het in dezelfde cellen blijft)"""
+        old_cells = self.object_cells.get(obj)
+        if old_cells is None:
+            self.insert(obj, rect)
+            return
+
+        new_cells = self._cells_for(rect)
+        if new_cells == old_cells:
+            return
+
+        for cell in old_cells:
+            bucket = self.cells[cell]
+            del bucket[obj]
+            if not bucket:
+                del self.cells[cell]
+        for cell in new_cells:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                bucket = self.cells[cell] = {}
+            bucket[obj] = None
+        self.object_cells[obj] = new_cells
+
+    def clear(self):
+        self.cells.clear()
+        self.object_cells.clear()
+        self.order.clear()
+
+    def query(self, rect):
+        """Alle objecten in de cellen die rect overlapt (broadphase, nog zonder colliderect)"""
+        cells = self._cells_for(rect)
+        if len(cells) == 1:
+            bucket = self.cells.get(cells[0])
+            if not bucket:
+                return []
+            if len(bucket) == 1:
+                return list(bucket)
+            return sorted(bucket, key=self.order.__getitem__)
+
+        found = {}
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        if len(found) > 1:
+            return sorted(found, key=self.order.__getitem__)
+        return list(found)
+
+    def query_colliding(self, rect):
+        """Alle objecten waarvan de rect echt overlapt met rect"""
+        return [obj for obj in self.query(rect) if rect.colliderect(obj.rect)]